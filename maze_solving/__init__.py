@@ -5,3 +5,6 @@ and utilities for maze generation and visualization.
 """
 
 __version__ = '1.0.0'
+
+from .grid import Grid, as_grid
+from .path import Path
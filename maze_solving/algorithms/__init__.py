@@ -2,14 +2,99 @@
 Maze solving algorithms package.
 """
 
-from .astar import astar_search
-from .gbfs import greedy_best_first_search
-from .ids import iterative_deepening_search
-from .ucs import uniform_cost_search
+from .ara import (
+    AnytimeSolution,
+    anytime_astar_search,
+    anytime_astar_solutions,
+    anytime_astar_steps
+)
+from .astar import astar_search, astar_steps
+from .bidirectional import (
+    bidirectional_astar_search,
+    bidirectional_astar_steps,
+    bidirectional_uniform_cost_search,
+    bidirectional_uniform_cost_steps
+)
+from .core import SearchEvent, SearchSteps
+from .distance_field import DistanceField, distance_field
+from .gbfs import greedy_best_first_search, greedy_best_first_steps
+from .hpa import HierarchicalPlanner
+from .ids import (
+    ida_star_search,
+    ida_star_steps,
+    iterative_deepening_search,
+    iterative_deepening_steps
+)
+from .jps import jump_point_search, jump_point_steps
+from .junctions import JunctionGraph, compressed_search, junction_graph
+from .landmarks import Landmarks, select_landmarks
+from .limits import SearchLimits, SearchResult, solve_within
+from .lpastar import IncrementalPlanner
+from .stats import SearchStats
+from .ucs import uniform_cost_search, uniform_cost_steps
+
+# Solvers by the short names used on the command line and in batch jobs
+ALGORITHMS = {
+    'astar': astar_search,
+    'ucs': uniform_cost_search,
+    'gbfs': greedy_best_first_search,
+    'ids': iterative_deepening_search,
+    'ida': ida_star_search,
+    'jps': jump_point_search,
+    'bi-astar': bidirectional_astar_search,
+    'bi-ucs': bidirectional_uniform_cost_search,
+    'ara': anytime_astar_search
+}
+
+# Generator variants of the solvers above, yielding a SearchEvent per step
+STEPS = {
+    'astar': astar_steps,
+    'ucs': uniform_cost_steps,
+    'gbfs': greedy_best_first_steps,
+    'ids': iterative_deepening_steps,
+    'ida': ida_star_steps,
+    'jps': jump_point_steps,
+    'bi-astar': bidirectional_astar_steps,
+    'bi-ucs': bidirectional_uniform_cost_steps,
+    'ara': anytime_astar_steps
+}
 
 __all__ = [
+    'ALGORITHMS',
+    'AnytimeSolution',
+    'DistanceField',
+    'HierarchicalPlanner',
+    'IncrementalPlanner',
+    'JunctionGraph',
+    'Landmarks',
+    'STEPS',
+    'SearchEvent',
+    'SearchLimits',
+    'SearchResult',
+    'SearchStats',
+    'SearchSteps',
+    'anytime_astar_search',
+    'anytime_astar_solutions',
+    'anytime_astar_steps',
     'astar_search',
+    'astar_steps',
+    'bidirectional_astar_search',
+    'bidirectional_astar_steps',
+    'bidirectional_uniform_cost_search',
+    'bidirectional_uniform_cost_steps',
+    'compressed_search',
+    'distance_field',
     'greedy_best_first_search',
+    'greedy_best_first_steps',
+    'ida_star_search',
+    'ida_star_steps',
     'iterative_deepening_search',
-    'uniform_cost_search'
+    'iterative_deepening_steps',
+    'jump_point_search',
+    'jump_point_steps',
+    'junction_graph',
+    'select_landmarks',
+    'solve_within',
+    'uniform_cost_search',
+    'uniform_cost_steps'
 ]
@@ -0,0 +1,281 @@
+"""
+Anytime Repairing A* (ARA*): a quick first path, improved until a deadline.
+
+The first pass is weighted A*, ordering cells by g + w * h with an inflated
+weight w, which heads for the goal almost greedily and finds a path at most
+w times the shortest. Every later pass lowers w and repairs the previous
+search instead of starting over: cells whose cost dropped after they were
+expanded are set aside as "inconsistent", and only those and the cells still
+queued are searched again. Once w reaches 1 the path is a shortest one.
+
+After each pass the solver reports the path with a suboptimality bound,
+its length / min(g + h) over the cells still queued or inconsistent, which is
+often well below the weight that pass used.
+"""
+
+from collections import namedtuple
+from heapq import heapify, heappop, heappush
+
+from ..grid import as_grid
+from ..path import Path, parent_array, tree_cells
+from .core import (
+    SearchEvent, build_path, closest_cell, manhattan_heuristic, resolve_endpoints, run_steps
+)
+from .stats import EXPAND, EXPLORE
+
+AnytimeSolution = namedtuple('AnytimeSolution', [
+    'path',      # Path from start to goal
+    'length',    # Moves along the path
+    'bound',     # The path is at most this many times the shortest
+    'weight',    # Heuristic weight of the pass that produced it
+    'expanded',  # Cells expanded by all passes so far
+])
+
+# Cell states
+NEW, OPEN, CLOSED = 0, 1, 2
+
+
+def anytime_astar_search(maze_obj, start=None, goal=None, weight=3.0, decrement=0.5,
+                         stats=None, limits=None, landmarks=None):
+    """
+    Anytime A*: return the best path found before the limits stop the search.
+
+    Without limits the passes run down to weight 1, so the result is a
+    shortest path.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells; the maze's goal
+            (pyamaze's ``_goal``) or (1, 1) by default
+        weight (float): Heuristic weight of the first pass, at least 1
+        decrement (float): How much each pass lowers the weight
+        stats: SearchStats to add the counters of all passes to, or None
+        limits: SearchLimits bounding the search, or None; a stopped search
+            returns its best path so far, or the path to the cell it got
+            closest to the goal if it had not found one yet
+        landmarks: Landmarks from select_landmarks for the ALT heuristic
+
+    Returns:
+        Path: Path from start to goal
+    """
+    return run_steps(anytime_astar_steps(maze_obj, start, goal, weight, decrement, stats,
+                                         limits, landmarks, emit=False))
+
+
+def anytime_astar_steps(maze_obj, start=None, goal=None, weight=3.0, decrement=0.5,
+                        stats=None, limits=None, landmarks=None, emit=True):
+    """
+    Anytime A* as a generator of search steps.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        weight (float): Heuristic weight of the first pass
+        decrement (float): How much each pass lowers the weight
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        landmarks: Landmarks for the ALT heuristic, or None
+        emit (bool): Yield events; False just runs the search
+
+    Yields:
+        SearchEvent: One per expanded cell (cells are expanded again in
+        later passes), then one at the goal
+
+    Returns:
+        Path: Best path found, as the generator's return value (see
+        SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+    came_from, best = yield from _events(_passes(
+        grid, start, goals, _heuristic(grid, goals, start, landmarks), weight, decrement,
+        stats, limits, emit
+    ))
+    if best is not None:
+        return best.path
+    if limits is not None and limits.stopped:
+        return build_path(grid, came_from, start,
+                          closest_cell(grid, [start, *tree_cells(came_from)], goals))
+    return Path(grid.cols)
+
+
+def anytime_astar_solutions(maze_obj, start=None, goal=None, weight=3.0, decrement=0.5,
+                            stats=None, limits=None, landmarks=None):
+    """
+    Anytime A* as a generator of improving solutions.
+
+    Example:
+        limits = SearchLimits(timeout=0.005)
+        for solution in anytime_astar_solutions(m, limits=limits):
+            send(solution.path, solution.bound)
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        weight (float): Heuristic weight of the first pass
+        decrement (float): How much each pass lowers the weight
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits ending the improvement, or None to go on until
+            the path is proven shortest
+        landmarks: Landmarks for the ALT heuristic, or None
+
+    Yields:
+        AnytimeSolution: After every pass that shortened the path or
+        tightened its bound; the last one has bound 1.0 unless the limits
+        stopped the search first
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+    yield from _passes(grid, start, goals, _heuristic(grid, goals, start, landmarks),
+                       weight, decrement, stats, limits, emit=False)
+
+
+def _heuristic(grid, goals, start, landmarks):
+    if landmarks is None:
+        return manhattan_heuristic(grid, goals)
+    landmarks.check(grid)
+    return landmarks.heuristic(goals, start)
+
+
+def _events(passes):
+    """Pass on the SearchEvents of _passes, dropping its solutions."""
+    while True:
+        try:
+            step = next(passes)
+        except StopIteration as done:
+            return done.value
+        if isinstance(step, SearchEvent):
+            yield step
+
+
+def _passes(grid, start, goals, heuristic, weight, decrement, stats, limits, emit):
+    """
+    Run the ARA* passes.
+
+    Yields:
+        SearchEvent per expansion when emit is set, and an AnytimeSolution
+        after each pass that improved the path or its bound
+
+    Returns:
+        tuple: (came_from, best) with the search tree and the last
+        AnytimeSolution, or None if no path was found
+    """
+    if weight < 1:
+        raise ValueError('weight must be at least 1')
+    if decrement <= 0:
+        raise ValueError('decrement must be positive')
+    openings, moves = grid.openings, grid.moves
+
+    unseen = float('inf')
+    g_score = [unseen] * grid.size
+    g_score[start] = 0
+    state = bytearray(grid.size)
+    state[start] = OPEN
+    ever_closed = bytearray(grid.size)  # Cells expanded by any pass
+    came_from = parent_array(grid.size)
+    events = [(EXPLORE, start)] if stats is not None and stats.detailed else None
+    expanded = 0
+    explored = 1
+    pushes = stale = 0
+    peak = 1
+
+    targets = set(goals)
+    goal_g, goal = (0, start) if start in targets else (unseen, None)
+    inconsistent = set()
+    w = float(weight)
+    h = heuristic(start)
+    frontier = [(w * h, h, 0, start)]
+    best = None
+    check_at = limits.start() if limits is not None else unseen
+    stopped = False
+
+    while True:
+        # Expand until no queued cell could lead to a cheaper goal under w
+        while frontier and frontier[0][0] < goal_g:
+            if expanded >= check_at:
+                if limits.check(expanded):
+                    stopped = True
+                    break
+                check_at = limits.next_check(expanded)
+            f, _, g, current = heappop(frontier)
+            if state[current] != OPEN or g != g_score[current]:
+                stale += 1
+                continue  # Stale entry left behind by a cheaper push
+            state[current] = ever_closed[current] = CLOSED
+            expanded += 1
+            if events is not None:
+                events.append((EXPAND, current))
+
+            new_g = g + 1
+            pushed = []
+            for offset in moves[openings[current]]:
+                neighbor = current + offset
+                if new_g >= g_score[neighbor]:
+                    continue
+                if g_score[neighbor] == unseen:
+                    explored += 1
+                if events is not None:
+                    events.append((EXPLORE, neighbor))
+                g_score[neighbor] = new_g
+                came_from[neighbor] = current
+                if neighbor in targets and new_g < goal_g:
+                    goal_g, goal = new_g, neighbor
+                if state[neighbor] == CLOSED:
+                    # Expanded this pass already: repaired in the next one
+                    inconsistent.add(neighbor)
+                    continue
+                state[neighbor] = OPEN
+                h = heuristic(neighbor)
+                heappush(frontier, (new_g + w * h, h, new_g, neighbor))
+                pushes += 1
+                if len(frontier) > peak:
+                    peak = len(frontier)
+                if emit:
+                    pushed.append(grid.cell(neighbor))
+
+            if emit:
+                yield SearchEvent(grid.cell(current), tuple(pushed), f)
+
+        if goal is None:
+            break  # No path, or stopped before finding one
+
+        # Parents repaired since goal_g was set can make the path shorter
+        # than goal_g, so the length is read off the path itself
+        path = build_path(grid, came_from, start, goal)
+        length = len(path)
+
+        # Lower bound on the shortest path from what is left to search
+        waiting = [cell for _, _, g, cell in frontier
+                   if state[cell] == OPEN and g == g_score[cell]]
+        waiting.extend(inconsistent)
+        lowest = min((g_score[cell] + heuristic(cell) for cell in waiting), default=unseen)
+        bound = max(1.0, min(w, length / lowest)) if lowest else 1.0
+        if best is None or length < best.length or bound < best.bound:
+            best = AnytimeSolution(path, length, bound, w, expanded)
+            yield best
+        if stopped or bound == 1.0 or w == 1.0:
+            break
+
+        # Next pass: requeue the open and inconsistent cells under the lower
+        # weight and start a fresh closed set
+        w = max(1.0, w - decrement)
+        state = bytearray(grid.size)
+        frontier = []
+        for cell in set(waiting):
+            state[cell] = OPEN
+            h = heuristic(cell)
+            frontier.append((g_score[cell] + w * h, h, g_score[cell], cell))
+        heapify(frontier)
+        inconsistent.clear()
+
+    if emit and best is not None:
+        yield SearchEvent(grid.cell(goal), (), best.length)
+    if stats is not None:
+        stats.record(grid, len(ever_closed) - ever_closed.count(0), explored, pushes, stale,
+                     peak, events)
+    if limits is not None:
+        limits.finish(best is not None)
+    return came_from, best
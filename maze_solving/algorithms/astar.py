@@ -2,75 +2,102 @@
 A* Search Algorithm implementation for maze solving.
 """
 
-from pyamaze import maze, agent, textLabel
-from queue import PriorityQueue
+from ..grid import as_grid
+from .bidirectional import bidirectional_astar_search
+from .core import (
+    best_first_steps, goal_paths, manhattan_heuristic, resolve_endpoints, run_steps
+)
+from .dial import bucket_steps, choose_frontier
+from .junctions import compressed_search
 
-def manhattan_distance(cell1, cell2):
-    """Calculate Manhattan distance between two cells."""
-    x1, y1 = cell1
-    x2, y2 = cell2
-    return abs(x1-x2) + abs(y1-y2)
-
-def astar_search(maze_obj):
+def astar_search(maze_obj, start=None, goal=None, all_goals=False, bidirectional=False,
+                 stats=None, limits=None, compress=False, landmarks=None, frontier='auto'):
     """
     A* Search algorithm implementation.
     
     Args:
-        maze_obj: pyamaze.maze object representing the maze
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells; the maze's goal
+            (pyamaze's ``_goal``) or (1, 1) by default
+        all_goals (bool): With several goals, search on until every goal is
+            reached and return a path to each instead of stopping at the
+            nearest one
+        bidirectional (bool): Search from both ends at once and meet in the
+            middle (see bidirectional_astar_search); single goal only
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None; a stopped search
+            returns the path to the cell it got closest to the goal
+        compress: JunctionGraph from junction_graph() to search instead of
+            the cells, built once and reused across queries; True builds one
+            for this query only, which costs more than it saves (see
+            compressed_search). Not with all_goals
+        landmarks: Landmarks from select_landmarks to guide the search with
+            the ALT heuristic instead of Manhattan distance alone
+        frontier (str): 'heap' for a binary heap, 'buckets' for Dial's
+            bucket queue, or 'auto' (the heap, whose tie-break on h expands
+            fewer cells; buckets for the heuristic-free all_goals sweep)
         
     Returns:
-        dict: Path from start to goal
+        Path: Path from start to goal ({goal: path} with all_goals)
     """
-    start = (maze_obj.rows, maze_obj.cols)
-    goal = (1, 1)
-    
-    g_score = {cell: float('inf') for cell in maze_obj.grid}
-    g_score[start] = 0
-    f_score = {cell: float('inf') for cell in maze_obj.grid}
-    f_score[start] = manhattan_distance(start, goal)
+    if compress:
+        if all_goals or bidirectional:
+            raise ValueError('compress cannot be combined with all_goals or bidirectional')
+        return compressed_search(maze_obj, start, goal, stats=stats, limits=limits,
+                                 graph=None if compress is True else compress)
+    if bidirectional:
+        return bidirectional_astar_search(maze_obj, start=start, goal=goal, stats=stats,
+                                          limits=limits)
 
-    open_set = PriorityQueue()
-    open_set.put((manhattan_distance(start, goal), manhattan_distance(start, goal), start))
-    came_from = {}
-    
-    # Track explored and expanded nodes separately
-    maze_obj.explored_cells = set()  # All cells we've seen
-    maze_obj.expanded_nodes = set()  # Cells we've actually expanded
+    return run_steps(astar_steps(maze_obj, start, goal, all_goals, stats, limits,
+                                 landmarks=landmarks, frontier=frontier, emit=False))
 
-    while not open_set.empty():
-        current = open_set.get()[2]
-        maze_obj.expanded_nodes.add(current)  # Count as expanded when we process it
-        
-        if current == goal:
-            break
-            
-        for direction in 'ESNW':
-            if maze_obj.maze_map[current][direction]:
-                if direction == 'E':
-                    neighbor = (current[0], current[1]+1)
-                elif direction == 'W':
-                    neighbor = (current[0], current[1]-1)
-                elif direction == 'N':
-                    neighbor = (current[0]-1, current[1])
-                elif direction == 'S':
-                    neighbor = (current[0]+1, current[1])
+def astar_steps(maze_obj, start=None, goal=None, all_goals=False, stats=None, limits=None,
+                landmarks=None, frontier='auto', emit=True):
+    """
+    A* search as a generator of search steps.
 
-                maze_obj.explored_cells.add(neighbor)  # Count as explored when we see it
-                
-                tentative_g = g_score[current] + 1
-                tentative_f = tentative_g + manhattan_distance(neighbor, goal)
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        all_goals (bool): Return a path to every goal
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        landmarks: Landmarks for the ALT heuristic, or None
+        frontier (str): 'auto', 'heap' or 'buckets' (see astar_search)
+        emit (bool): Yield events; False just runs the search
 
-                if tentative_f < f_score[neighbor]:
-                    g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_f
-                    open_set.put((tentative_f, manhattan_distance(neighbor, goal), neighbor))
-                    came_from[neighbor] = current
+    Yields:
+        SearchEvent: One per expanded cell
 
-    # Reconstruct path
-    path = {}
-    current = goal
-    while current != start:
-        path[came_from[current]] = current
-        current = came_from[current]
-        
-    return path
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals), as the
+        generator's return value (see SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+
+    # Visiting every goal is a plain Dijkstra sweep: the distance to the
+    # nearest remaining goal would not be a consistent heuristic
+    if all_goals:
+        heuristic = None
+    elif landmarks is not None:
+        landmarks.check(grid)
+        heuristic = landmarks.heuristic(goals, start)
+    else:
+        heuristic = manhattan_heuristic(grid, goals)
+    max_step = choose_frontier(grid, frontier, heuristic=heuristic is not None)
+    if max_step is not None:
+        came_from, reached = yield from bucket_steps(
+            grid, start, goals, max_step, heuristic=heuristic, all_goals=all_goals,
+            stats=stats, limits=limits, emit=emit
+        )
+    else:
+        came_from, reached = yield from best_first_steps(
+            grid, start, goals, heuristic=heuristic, all_goals=all_goals, stats=stats,
+            limits=limits, emit=emit
+        )
+    return goal_paths(grid, came_from, start, goals, reached, all_goals,
+                      partial=limits is not None and limits.stopped)
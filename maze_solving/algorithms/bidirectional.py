@@ -0,0 +1,279 @@
+"""
+Bidirectional A* and Uniform Cost Search for maze solving.
+
+Two searches run at once, one forward from the start and one backward from
+the goal, until they meet in the middle. For A* both sides use the averaged
+potential p(v) = (h_goal(v) - h_start(v)) / 2 (negated for the backward
+side), which keeps the two heuristics consistent with each other so the
+plain bidirectional Dijkstra stopping rule stays correct: stop once the two
+smallest frontier keys add up to at least the best path seen so far.
+Keys are doubled to keep them integral.
+"""
+
+from heapq import heappop, heappush
+
+from ..grid import as_grid
+from ..path import Path, parent_array, tree_cells
+from .core import (
+    SearchEvent, build_path, closest_cell, manhattan_heuristic, resolve_endpoints,
+    run_steps
+)
+from .stats import EXPAND, EXPLORE
+
+
+def bidirectional_search(grid, start, goal, use_heuristic=True, use_cost=False, stats=None,
+                         limits=None):
+    """
+    Run a bidirectional best-first search over a Grid.
+
+    Takes the same arguments as bidirectional_steps and returns its result
+    without producing any events.
+    """
+    return run_steps(bidirectional_steps(grid, start, goal, use_heuristic, use_cost, stats,
+                                         limits, emit=False))
+
+
+def bidirectional_steps(grid, start, goal, use_heuristic=True, use_cost=False, stats=None,
+                        limits=None, emit=True):
+    """
+    Run a bidirectional best-first search over a Grid, yielding a
+    SearchEvent per expansion on either side.
+
+    Args:
+        grid: maze_solving.grid.Grid to search
+        start (int): Flat index of the start cell
+        goal (int): Flat index of the goal cell
+        use_heuristic (bool): Guide both sides with Manhattan potentials (A*)
+            instead of searching blind (UCS)
+        use_cost (bool): Read move costs from the grid's cost layer instead
+            of charging 1 per move
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None; a stopped
+            search returns the best meeting cell found so far, if any
+        emit (bool): Yield events; False runs the search without stopping
+
+    Yields:
+        SearchEvent: One per expanded cell, with f half the entry's key
+
+    Returns:
+        tuple: (forward_parent, backward_parent, meeting) where
+        forward_parent maps a cell to its predecessor from the start,
+        backward_parent maps a cell to its successor towards the goal, and
+        meeting is the flat index where the shortest path crosses from one
+        tree to the other (None if no path exists)
+    """
+    openings, moves = grid.openings, grid.moves
+    cost = grid.cost if use_cost else None
+
+    if use_heuristic:
+        to_goal = manhattan_heuristic(grid, goal)
+        to_start = manhattan_heuristic(grid, start)
+
+        def potential(index):
+            return to_goal(index) - to_start(index)
+    else:
+        def potential(index):
+            return 0
+
+    unseen = float('inf')
+    # Index 0 is the forward search, index 1 the backward one
+    g_score = ([unseen] * grid.size, [unseen] * grid.size)
+    closed = (bytearray(grid.size), bytearray(grid.size))
+    parent = (parent_array(grid.size), parent_array(grid.size))
+    frontier = ([], [])
+    sign = (1, -1)
+
+    for side, root in ((0, start), (1, goal)):
+        g_score[side][root] = 0
+        heappush(frontier[side], (sign[side] * potential(root), root))
+
+    detailed = stats is not None and stats.detailed
+    events = [(EXPLORE, start), (EXPLORE, goal)] if detailed else None
+    expanded = 0
+    explored = 1 if start == goal else 2
+    pushes = stale = 0
+    peak = 2
+    best = unseen  # Cost of the best complete path found so far
+    meeting = None
+
+    if start == goal:
+        if stats is not None:
+            stats.record(grid, expanded, explored, frontier_peak=peak, events=events)
+        if limits is not None:
+            limits.start()
+            limits.finish(True)
+        return parent[0], parent[1], start
+
+    check_at = limits.start() if limits is not None else unseen
+    while frontier[0] and frontier[1]:
+        if frontier[0][0][0] + frontier[1][0][0] >= 2 * best:
+            break
+        if expanded >= check_at:
+            if limits.check(expanded):
+                break
+            check_at = limits.next_check(expanded)
+
+        # Grow the smaller frontier
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        other = 1 - side
+        g_side, g_other = g_score[side], g_score[other]
+        closed_side = closed[side]
+
+        key, current = heappop(frontier[side])
+        if closed_side[current]:
+            stale += 1
+            continue  # Stale entry left behind by a cheaper push
+        closed_side[current] = 1
+        if not closed[other][current]:
+            expanded += 1
+        if events is not None:
+            events.append((EXPAND, current))
+
+        pushed = [] if emit else None
+        for offset in moves[openings[current]]:
+            neighbor = current + offset
+            # Forward pays for leaving current, backward for leaving neighbor
+            if cost is None:
+                step = 1
+            else:
+                step = cost[current] if side == 0 else cost[neighbor]
+            new_g = g_side[current] + step
+            if closed_side[neighbor] or new_g >= g_side[neighbor]:
+                continue
+            if g_side[neighbor] == unseen and g_other[neighbor] == unseen:
+                explored += 1
+            if events is not None:
+                events.append((EXPLORE, neighbor))
+            g_side[neighbor] = new_g
+            parent[side][neighbor] = current
+            heappush(frontier[side],
+                     (2 * new_g + sign[side] * potential(neighbor), neighbor))
+            pushes += 1
+            if len(frontier[0]) + len(frontier[1]) > peak:
+                peak = len(frontier[0]) + len(frontier[1])
+            if pushed is not None:
+                pushed.append(grid.cell(neighbor))
+
+            if g_other[neighbor] != unseen and new_g + g_other[neighbor] < best:
+                best = new_g + g_other[neighbor]
+                meeting = neighbor
+
+        if emit:
+            yield SearchEvent(grid.cell(current), tuple(pushed), key / 2)
+
+    if stats is not None:
+        stats.record(grid, expanded, explored, pushes, stale, peak, events)
+    if limits is not None:
+        limits.finish(meeting is not None)
+    return parent[0], parent[1], meeting
+
+
+def build_bidirectional_path(grid, forward_parent, backward_parent, start, goal, meeting):
+    """
+    Join the two search trees at the meeting cell into one path.
+
+    Args:
+        grid: maze_solving.grid.Grid that was searched
+        forward_parent: Parent array with the predecessor of each cell from
+            the start
+        backward_parent: Parent array with the successor of each cell
+            towards the goal
+        start (int): Flat index of the start cell
+        goal (int): Flat index of the goal cell
+        meeting (int): Flat index shared by both halves of the path
+
+    Returns:
+        Path: Path from start to goal
+    """
+    if meeting is None:
+        return Path(grid.cols)
+    cells = Path.from_parents(grid, forward_parent, start, meeting).cells
+    while cells[-1] != goal:
+        cells.append(backward_parent[cells[-1]])
+    return Path(grid.cols, cells)
+
+
+def _steps(maze_obj, start, goal, use_heuristic, use_cost, stats, limits, emit):
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+    if len(goals) != 1:
+        raise ValueError('Bidirectional search needs exactly one goal')
+    goal = goals[0]
+
+    forward, backward, meeting = yield from bidirectional_steps(
+        grid, start, goal, use_heuristic=use_heuristic, use_cost=use_cost, stats=stats,
+        limits=limits, emit=emit
+    )
+    if meeting is None and limits is not None and limits.stopped:
+        # No path joined up yet: head as close to the goal as the start's tree got
+        return build_path(grid, forward, start, closest_cell(grid, [start, *tree_cells(forward)], [goal]))
+    return build_bidirectional_path(grid, forward, backward, start, goal, meeting)
+
+
+def bidirectional_astar_search(maze_obj, start=None, goal=None, stats=None, limits=None):
+    """
+    Bidirectional A* Search algorithm implementation.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal (tuple): (row, col) goal cell, the maze's goal or (1, 1) by
+            default
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None
+
+    Returns:
+        Path: Path from start to goal
+    """
+    return run_steps(_steps(maze_obj, start, goal, True, False, stats, limits, emit=False))
+
+
+def bidirectional_uniform_cost_search(maze_obj, start=None, goal=None, stats=None,
+                                      limits=None):
+    """
+    Bidirectional Uniform Cost Search algorithm implementation.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal (tuple): (row, col) goal cell, the maze's goal or (1, 1) by
+            default
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None
+
+    Returns:
+        Path: Path from start to goal
+    """
+    return run_steps(_steps(maze_obj, start, goal, False, True, stats, limits, emit=False))
+
+
+def bidirectional_astar_steps(maze_obj, start=None, goal=None, stats=None, limits=None,
+                              emit=True):
+    """
+    Bidirectional A* as a generator of search steps.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal (tuple): (row, col) goal cell
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        emit (bool): Yield events; False just runs the search
+
+    Yields:
+        SearchEvent: One per cell expanded by either side
+
+    Returns:
+        Path: Path from start to goal, as the generator's return value (see
+        SearchSteps)
+    """
+    return (yield from _steps(maze_obj, start, goal, True, False, stats, limits, emit))
+
+
+def bidirectional_uniform_cost_steps(maze_obj, start=None, goal=None, stats=None,
+                                     limits=None, emit=True):
+    """
+    Bidirectional uniform cost search as a generator of search steps (see
+    bidirectional_astar_steps).
+    """
+    return (yield from _steps(maze_obj, start, goal, False, True, stats, limits, emit))
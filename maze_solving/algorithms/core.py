@@ -0,0 +1,344 @@
+"""
+Shared best-first search engine used by A*, GBFS and UCS.
+
+The frontier is a plain ``heapq`` binary heap. Instead of decrease-key, a
+cell is pushed again whenever its cost improves and the outdated entries are
+dropped when they surface (lazy deletion), which keeps every operation a
+single C-level heap call.
+"""
+
+from collections import namedtuple
+from heapq import heappop, heappush
+
+from ..path import Path, parent_array, tree_cells
+from .stats import EXPAND, EXPLORE
+
+SearchEvent = namedtuple('SearchEvent', [
+    'cell',    # (row, col) cell just expanded
+    'pushed',  # (row, col) cells pushed on the frontier while expanding it
+    'f',       # Priority the cell was expanded at (the current best f)
+])
+
+
+class SearchSteps:
+    """
+    Iterate over a step generator and keep the solver's result.
+
+    Example:
+        steps = SearchSteps(astar_steps(m))
+        for event in steps:
+            if event.f > limit:
+                break  # Stop early; steps.result stays None
+        path = steps.result
+
+    Attributes:
+        result: The generator's return value once it has run to the end
+        done (bool): Whether the generator has run to the end
+    """
+
+    def __init__(self, steps):
+        """
+        Args:
+            steps: Generator from one of the ``*_steps`` functions
+        """
+        self._steps = steps
+        self.result = None
+        self.done = False
+
+    def __iter__(self):
+        self.result = yield from self._steps
+        self.done = True
+
+    def close(self):
+        """Stop the search and release its state."""
+        self._steps.close()
+
+
+def run_steps(steps):
+    """
+    Drain a step generator and return its result.
+
+    Args:
+        steps: Generator from one of the ``*_steps`` functions
+
+    Returns:
+        The generator's return value (the path for the solver variants)
+    """
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
+
+
+def resolve_endpoints(maze_obj, grid, start=None, goal=None):
+    """
+    Turn the start/goal arguments of a solver into flat indices.
+
+    Args:
+        maze_obj: Object passed to the solver (a pyamaze maze's ``_goal`` is
+            used as the default goal)
+        grid: maze_solving.grid.Grid being searched
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells, the maze's goal
+            or (1, 1) by default
+
+    Returns:
+        tuple: (start, goals) as a flat index and a list of flat indices
+
+    Raises:
+        ValueError: If no goal is given or a cell lies outside the grid
+    """
+    if start is None:
+        start = grid.default_start
+    if goal is None:
+        goal = getattr(maze_obj, '_goal', None) or grid.default_goal
+    if not goal:
+        raise ValueError('At least one goal is required')
+    goals = [goal] if isinstance(goal[0], int) else list(goal)
+    for cell in [start, *goals]:
+        row, col = cell
+        if not (1 <= row <= grid.rows and 1 <= col <= grid.cols):
+            raise ValueError(f'{cell} is outside the {grid.rows}x{grid.cols} maze')
+    return grid.index(start), [grid.index(g) for g in goals]
+
+
+def manhattan_heuristic(grid, goal):
+    """
+    Build a Manhattan distance heuristic towards ``goal``.
+
+    Args:
+        grid: maze_solving.grid.Grid being searched
+        goal: Flat index of the goal cell, or a list of flat indices to
+            measure the distance to the nearest one
+
+    Returns:
+        callable: Function mapping a flat index to its distance from goal
+    """
+    cols = grid.cols
+    if isinstance(goal, int) or len(goal) == 1:
+        goal_row, goal_col = divmod(goal if isinstance(goal, int) else goal[0], cols)
+
+        def heuristic(index):
+            row, col = divmod(index, cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+    else:
+        targets = [divmod(g, cols) for g in goal]
+
+        def heuristic(index):
+            row, col = divmod(index, cols)
+            return min(abs(row - r) + abs(col - c) for r, c in targets)
+
+    return heuristic
+
+
+def best_first_search(grid, start, goals, heuristic=None, g_weight=1,
+                      use_cost=False, reopen=True, all_goals=False, stats=None,
+                      limits=None, graph=None):
+    """
+    Run a best-first search over a Grid.
+
+    Takes the same arguments as best_first_steps and returns its result
+    without producing any events.
+    """
+    return run_steps(best_first_steps(
+        grid, start, goals, heuristic, g_weight, use_cost, reopen, all_goals, stats,
+        limits, graph, emit=False
+    ))
+
+
+def best_first_steps(grid, start, goals, heuristic=None, g_weight=1,
+                     use_cost=False, reopen=True, all_goals=False, stats=None,
+                     limits=None, graph=None, emit=True):
+    """
+    Run a best-first search over a Grid, yielding a SearchEvent per expansion.
+
+    Entries are ordered by ``g_weight * g + h`` and ties are broken on h, so
+    the usual searches are configurations of this one loop:
+
+    - A*: ``g_weight=1`` with a heuristic
+    - Uniform cost search: no heuristic, ``use_cost=True``
+    - Greedy best-first: ``g_weight=0`` with a heuristic and ``reopen=False``
+
+    Args:
+        grid: maze_solving.grid.Grid to search
+        start (int): Flat index of the start cell
+        goals (list): Flat indices of the goal cells
+        heuristic (callable): Estimate of the remaining cost from a cell, or
+            None for no guidance
+        g_weight (int): Weight of the path cost in the priority
+        use_cost (bool): Read move costs from the grid's cost layer instead
+            of charging 1 per move
+        reopen (bool): Whether a cell already discovered may be pushed again
+            when a cheaper route to it is found
+        all_goals (bool): Keep searching until every goal is reached instead
+            of stopping at the first one
+        stats: SearchStats to add this search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        graph: JunctionGraph of the grid to search instead of its cells:
+            moves follow the graph's corridors and charge their length (or
+            their summed cost with use_cost), and came_from links nodes
+        emit (bool): Yield events; False runs the search without stopping
+
+    Yields:
+        SearchEvent: One per expanded cell, with f the entry's priority
+
+    Returns:
+        tuple: (came_from, reached) where came_from is a parent array giving
+        each reached flat index its predecessor (see maze_solving.path) and
+        reached lists the goals in the order they were reached
+    """
+    openings, moves = grid.openings, grid.moves
+    cost = grid.cost if use_cost else None
+    edges = graph.edges if graph is not None else None
+
+    unseen = float('inf')
+    g_score = [unseen] * grid.size
+    g_score[start] = 0
+    closed = bytearray(grid.size)
+    came_from = parent_array(grid.size)
+    # Counters are plain locals; cells are only logged for detailed stats
+    events = [(EXPLORE, start)] if stats is not None and stats.detailed else None
+    expanded = 0  # Cells taken off the frontier and processed
+    explored = 1  # Cells that have been seen
+    pushes = stale = 0
+    peak = 1
+
+    h = heuristic(start) if heuristic else 0
+    frontier = [(h, h, start)]
+    targets = set(goals)
+    reached = []
+    check_at = limits.start() if limits is not None else unseen
+
+    while frontier:
+        if expanded >= check_at:
+            if limits.check(expanded):
+                break
+            check_at = limits.next_check(expanded)
+        f, _, current = heappop(frontier)
+        if closed[current]:
+            stale += 1
+            continue  # Stale entry left behind by a cheaper push
+        closed[current] = 1
+        expanded += 1
+        if events is not None:
+            events.append((EXPAND, current))
+
+        if current in targets:
+            reached.append(current)
+            targets.discard(current)
+            if not all_goals or not targets:
+                if emit:
+                    yield SearchEvent(grid.cell(current), (), f)
+                break
+
+        if edges is None:
+            new_g = g_score[current] + (1 if cost is None else cost[current])
+            links = moves[openings[current]]
+        else:
+            links = edges[current]
+        for link in links:
+            if edges is None:
+                neighbor = current + link
+            else:
+                neighbor, length, total, _ = link
+                new_g = g_score[current] + (total if use_cost else length)
+            if closed[neighbor]:
+                continue
+            old_g = g_score[neighbor]
+            if old_g != unseen:
+                if not reopen or new_g >= old_g:
+                    continue
+            else:
+                explored += 1
+            if events is not None:
+                events.append((EXPLORE, neighbor))
+            g_score[neighbor] = new_g
+            came_from[neighbor] = current
+            h = heuristic(neighbor) if heuristic else 0
+            heappush(frontier, (g_weight * new_g + h, h, neighbor))
+            pushes += 1
+            if len(frontier) > peak:
+                peak = len(frontier)
+
+        if emit:
+            if edges is None:
+                neighbors = [current + offset for offset in moves[openings[current]]]
+            else:
+                neighbors = [link[0] for link in edges[current]]
+            yield SearchEvent(grid.cell(current), tuple(
+                grid.cell(neighbor) for neighbor in neighbors
+                if came_from[neighbor] == current and not closed[neighbor]
+            ), f)
+
+    if stats is not None:
+        stats.record(grid, expanded, explored, pushes, stale, peak, events)
+    if limits is not None:
+        limits.finish(bool(reached))
+    return came_from, reached
+
+
+def build_path(grid, came_from, start, goal):
+    """
+    Walk came_from back from goal into a Path.
+
+    Args:
+        grid: maze_solving.grid.Grid that was searched
+        came_from: Parent array (or dict) with the predecessor of each
+            reached flat index
+        start (int): Flat index of the start cell
+        goal (int): Flat index of the goal cell
+
+    Returns:
+        Path: Path from start to goal, which reads as {cell: next_cell}
+    """
+    return Path.from_parents(grid, came_from, start, goal)
+
+
+def closest_cell(grid, cells, goals):
+    """
+    Pick the cell nearest to the goals, where a stopped search got furthest.
+
+    Args:
+        grid: maze_solving.grid.Grid that was searched
+        cells: Flat indices to choose from
+        goals (list): Flat indices of the goal cells
+
+    Returns:
+        int: Flat index with the smallest Manhattan distance to a goal (the
+        first one on ties)
+    """
+    return min(cells, key=manhattan_heuristic(grid, goals))
+
+
+def goal_paths(grid, came_from, start, goals, reached, all_goals=False, partial=False):
+    """
+    Build a solver's return value from its search tree.
+
+    Args:
+        grid: maze_solving.grid.Grid that was searched
+        came_from: Parent array with the predecessor of each reached flat
+            index
+        start (int): Flat index of the start cell
+        goals (list): Flat indices of the goal cells
+        reached (list): Goals in the order the search reached them
+        all_goals (bool): Return a path per goal instead of one path
+        partial (bool): When no goal was reached (the search was stopped),
+            return the path to the discovered cell nearest the goals
+
+    Returns:
+        Path: Path to the first goal reached, or with all_goals a dict
+        {goal_cell: path}, with an empty path for unreachable goals
+    """
+    if all_goals:
+        return {
+            grid.cell(goal): build_path(grid, came_from, start, goal) if goal in reached
+            else Path(grid.cols)
+            for goal in goals
+        }
+    if reached:
+        return build_path(grid, came_from, start, reached[0])
+    if partial:
+        return build_path(grid, came_from, start,
+                          closest_cell(grid, [start, *tree_cells(came_from)], goals))
+    return Path(grid.cols)
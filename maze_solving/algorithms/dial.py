@@ -0,0 +1,221 @@
+"""
+Dial's bucket queue: a frontier for small integer move costs.
+
+When every move costs a small whole number and the heuristic is integral and
+changes by at most one per move (Manhattan distance and the ALT bounds do),
+the priority f = g + h of a pushed cell is never more than ``max_step``
+above the priority being expanded. The frontier can then be a ring of
+``max_step + 1`` buckets indexed by f modulo the ring size: a push is a list
+append, a pop takes from the current bucket and advances to the next
+non-empty one. No entry tuples are built and nothing is compared.
+
+Outdated entries are left in their buckets and skipped when they come up,
+as the heap engine does. Within a bucket cells are taken last in, first out,
+which prefers the cells pushed most recently, the deeper ones.
+
+For A* that order is weaker than the heap's (f, h, index) tie-break: on a
+300x300 maze with every wall knocked through it expands 11658 cells where
+the heap expands 6385, and splitting each bucket by h costs more time than
+the heap saves. 'auto' therefore only picks buckets for searches without a
+heuristic.
+"""
+
+from ..path import parent_array
+from .core import SearchEvent, run_steps
+from .stats import EXPAND, EXPLORE
+
+# Largest cell cost the bucket frontier is picked for automatically
+MAX_BUCKET_COST = 64
+
+
+def bucket_step(grid, use_cost=False, heuristic=False, max_cost=MAX_BUCKET_COST):
+    """
+    Largest priority increase of one move, if a bucket frontier can be used.
+
+    Args:
+        grid: maze_solving.grid.Grid to be searched
+        use_cost (bool): Whether the search reads the grid's cost layer
+        heuristic (bool): Whether the search adds an integral heuristic that
+            changes by at most one per move
+        max_cost (int): Largest cell cost to accept
+
+    Returns:
+        int: The bound (the ring needs one more bucket than that), or None
+        if some cost is fractional, negative or above max_cost
+    """
+    step = 1
+    if use_cost and grid.cost is not None:
+        lowest, highest, whole = grid.cost_range()
+        if lowest < 0 or highest > max_cost or not whole:
+            return None
+        step = int(highest)
+    return step + 1 if heuristic else step
+
+
+def choose_frontier(grid, frontier, use_cost=False, heuristic=False):
+    """
+    Resolve a solver's ``frontier`` option.
+
+    Args:
+        grid: maze_solving.grid.Grid to be searched
+        frontier (str): 'heap', 'buckets', or 'auto' for buckets whenever
+            there is no heuristic and the costs allow them
+        use_cost (bool): Whether the search reads the grid's cost layer
+        heuristic (bool): Whether the search adds an integral heuristic
+
+    Returns:
+        int: max_step for bucket_steps, or None to use the heap
+
+    Raises:
+        ValueError: For an unknown frontier, or 'buckets' on a cost layer
+            that is not made of small whole numbers
+    """
+    if frontier not in ('auto', 'heap', 'buckets'):
+        raise ValueError(f"frontier must be 'auto', 'heap' or 'buckets', not {frontier!r}")
+    if frontier == 'heap' or (frontier == 'auto' and heuristic):
+        return None
+    step = bucket_step(grid, use_cost, heuristic)
+    if step is None and frontier == 'buckets':
+        raise ValueError('A bucket frontier needs whole cell costs between 0 and '
+                         f'{MAX_BUCKET_COST}')
+    return step
+
+
+def bucket_search(grid, start, goals, max_step, heuristic=None, use_cost=False,
+                  all_goals=False, stats=None, limits=None):
+    """
+    Run a bucket-queue search over a Grid.
+
+    Takes the same arguments as bucket_steps and returns its result without
+    producing any events.
+    """
+    return run_steps(bucket_steps(grid, start, goals, max_step, heuristic, use_cost,
+                                  all_goals, stats, limits, emit=False))
+
+
+def bucket_steps(grid, start, goals, max_step, heuristic=None, use_cost=False,
+                 all_goals=False, stats=None, limits=None, emit=True):
+    """
+    Run uniform cost search or A* over a Grid with a bucket frontier,
+    yielding a SearchEvent per expansion.
+
+    Args:
+        grid: maze_solving.grid.Grid to search
+        start (int): Flat index of the start cell
+        goals (list): Flat indices of the goal cells
+        max_step (int): Largest priority increase of one move, from
+            bucket_step
+        heuristic (callable): Integral, consistent estimate of the remaining
+            moves from a cell, or None for uniform cost search
+        use_cost (bool): Read move costs from the grid's cost layer instead
+            of charging 1 per move; they must be whole numbers no larger
+            than max_step allows
+        all_goals (bool): Keep searching until every goal is reached instead
+            of stopping at the first one
+        stats: SearchStats to add this search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        emit (bool): Yield events; False runs the search without stopping
+
+    Yields:
+        SearchEvent: One per expanded cell, with f the cell's priority
+
+    Returns:
+        tuple: (came_from, reached) as returned by best_first_steps
+
+    Raises:
+        ValueError: If an expanded cell's cost does not fit the buckets,
+            e.g. after the cost layer was edited in place (see
+            Grid.cost_range)
+    """
+    openings, moves = grid.openings, grid.moves
+    cost = grid.cost if use_cost else None
+    top = max_step - 1 if heuristic else max_step  # Largest cost the ring holds
+
+    unseen = float('inf')
+    g_score = [unseen] * grid.size
+    g_score[start] = 0
+    closed = bytearray(grid.size)
+    came_from = parent_array(grid.size)
+    events = [(EXPLORE, start)] if stats is not None and stats.detailed else None
+    expanded = 0
+    explored = 1
+    pushes = stale = 0
+    peak = queued = 1
+
+    width = max_step + 1
+    buckets = [[] for _ in range(width)]
+    f = heuristic(start) if heuristic else 0
+    buckets[f % width].append(start)
+    targets = set(goals)
+    reached = []
+    check_at = limits.start() if limits is not None else unseen
+
+    while queued:
+        if expanded >= check_at:
+            if limits.check(expanded):
+                break
+            check_at = limits.next_check(expanded)
+        bucket = buckets[f % width]
+        while not bucket:
+            f += 1
+            bucket = buckets[f % width]
+        current = bucket.pop()
+        queued -= 1
+        if closed[current]:
+            stale += 1
+            continue  # Stale entry left behind by a cheaper push
+        closed[current] = 1
+        expanded += 1
+        if events is not None:
+            events.append((EXPAND, current))
+
+        if current in targets:
+            reached.append(current)
+            targets.discard(current)
+            if not all_goals or not targets:
+                if emit:
+                    yield SearchEvent(grid.cell(current), (), f)
+                break
+
+        if cost is None:
+            new_g = g_score[current] + 1
+        else:
+            # Checked here too: the grid's cached cost_range misses edits in place
+            step = int(cost[current])
+            if step != cost[current] or step > top or step < 0:
+                raise ValueError(f'Cost {cost[current]} of {grid.cell(current)} does not fit '
+                                 'a bucket frontier; assign grid.cost again after editing it')
+            new_g = g_score[current] + step
+        for offset in moves[openings[current]]:
+            neighbor = current + offset
+            if closed[neighbor]:
+                continue
+            old_g = g_score[neighbor]
+            if old_g != unseen:
+                if new_g >= old_g:
+                    continue
+            else:
+                explored += 1
+            if events is not None:
+                events.append((EXPLORE, neighbor))
+            g_score[neighbor] = new_g
+            came_from[neighbor] = current
+            priority = new_g + heuristic(neighbor) if heuristic else new_g
+            buckets[priority % width].append(neighbor)
+            pushes += 1
+            queued += 1
+            if queued > peak:
+                peak = queued
+
+        if emit:
+            yield SearchEvent(grid.cell(current), tuple(
+                grid.cell(current + offset) for offset in moves[openings[current]]
+                if came_from[current + offset] == current
+                and not closed[current + offset]
+            ), f)
+
+    if stats is not None:
+        stats.record(grid, expanded, explored, pushes, stale, peak, events)
+    if limits is not None:
+        limits.finish(bool(reached))
+    return came_from, reached
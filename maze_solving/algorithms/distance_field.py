@@ -0,0 +1,126 @@
+"""
+Whole-maze breadth-first distance field computed with NumPy.
+
+Instead of popping one cell at a time, the wavefront engine keeps the current
+BFS layer as an array of flat indices and advances it in one step per
+direction: a boolean mask over the layer's opening flags selects the cells
+with that side open, the offset gives their neighbours, and a mask over the
+distance array drops neighbours already reached. One call gives the move
+count from every cell to the goal and the first move of a shortest path, so
+any start can be answered without another search.
+
+Each layer costs a handful of NumPy calls, so the engine pays off on mazes
+with loops, where layers are wide and few. On perfect mazes the layers are
+a few cells wide and a plain BFS is competitive.
+
+Only unit move costs are supported; a grid's cost layer is ignored. NumPy is
+imported on the first call, so loading the algorithms package does not
+need it.
+"""
+
+from array import array
+
+from ..grid import EAST, NORTH, SOUTH, WEST, as_grid
+from ..path import INDEX_TYPECODE, Path
+
+UNREACHABLE = -1
+
+
+class DistanceField:
+    """
+    Shortest-path distances and directions towards a single goal.
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        goal (tuple): (row, col) goal cell
+        distance: int32 array of shape (rows, cols) with the number of moves
+            from each cell to the goal, UNREACHABLE where there is no path
+        direction: uint8 array of shape (rows, cols) with the EAST/WEST/NORTH/
+            SOUTH flag of the first move towards the goal, 0 at the goal and
+            at unreachable cells
+    """
+
+    _STEPS = {EAST: (0, 1), WEST: (0, -1), NORTH: (-1, 0), SOUTH: (1, 0)}
+
+    def __init__(self, rows, cols, goal, distance, direction):
+        self.rows = rows
+        self.cols = cols
+        self.goal = goal
+        self.distance = distance
+        self.direction = direction
+
+    def distance_to_goal(self, cell):
+        """Number of moves from a (row, col) cell to the goal, or None."""
+        d = int(self.distance[cell[0] - 1, cell[1] - 1])
+        return None if d == UNREACHABLE else d
+
+    def path(self, start):
+        """
+        Follow the direction array from ``start`` to the goal.
+
+        Args:
+            start (tuple): (row, col) cell to route from
+
+        Returns:
+            Path: Path from start to goal, empty if the goal is unreachable
+        """
+        cols = self.distance.shape[1]
+        if self.distance_to_goal(start) is None:
+            return Path(cols)
+        path = array(INDEX_TYPECODE)
+        cell = start
+        while cell != self.goal:
+            path.append((cell[0] - 1) * cols + (cell[1] - 1))
+            dr, dc = self._STEPS[int(self.direction[cell[0] - 1, cell[1] - 1])]
+            cell = (cell[0] + dr, cell[1] + dc)
+        path.append((cell[0] - 1) * cols + (cell[1] - 1))
+        return Path(cols, path)
+
+
+def distance_field(maze_obj, goal=None):
+    """
+    Compute the BFS distance from every cell to ``goal`` in vectorised layers.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        goal (tuple): (row, col) target cell, (1, 1) by default
+
+    Returns:
+        DistanceField: Distances and first moves for every cell
+    """
+    import numpy as np
+
+    grid = as_grid(maze_obj)
+    if goal is None:
+        goal = grid.default_goal
+    cols = grid.cols
+
+    openings = np.frombuffer(grid.openings, dtype=np.uint8)
+    distance = np.full(grid.size, UNREACHABLE, dtype=np.int32)
+    direction = np.zeros(grid.size, dtype=np.uint8)
+
+    # (side open in the layer cell, offset to the neighbour, move back)
+    steps = ((EAST, 1, WEST), (WEST, -1, EAST),
+             (NORTH, -cols, SOUTH), (SOUTH, cols, NORTH))
+
+    layer = np.array([grid.index(goal)], dtype=np.int64)
+    distance[layer] = 0
+    depth = 0
+    while layer.size:
+        depth += 1
+        flags = openings[layer]
+        reached = []
+        for bit, offset, back in steps:
+            cells = layer[(flags & bit) != 0] + offset
+            cells = cells[distance[cells] == UNREACHABLE]
+            # Distinct layer cells have distinct neighbours in one direction,
+            # and earlier directions are already masked out by distance
+            distance[cells] = depth
+            direction[cells] = back
+            reached.append(cells)
+        layer = np.concatenate(reached)
+
+    shape = (grid.rows, grid.cols)
+    return DistanceField(grid.rows, grid.cols, goal,
+                         distance.reshape(shape), direction.reshape(shape))
@@ -2,65 +2,74 @@
 Greedy Best-First Search (GBFS) Algorithm implementation for maze solving.
 """
 
-from pyamaze import maze, agent, COLOR, textLabel
-from queue import PriorityQueue
+from ..grid import as_grid
+from .core import (
+    best_first_steps, goal_paths, manhattan_heuristic, resolve_endpoints, run_steps
+)
 
-def manhattan_distance(cell1, cell2):
-    """Calculate Manhattan distance between two cells."""
-    x1, y1 = cell1
-    x2, y2 = cell2
-    return abs(x1-x2) + abs(y1-y2)
-
-def greedy_best_first_search(maze_obj):
+def greedy_best_first_search(maze_obj, start=None, goal=None, all_goals=False, stats=None,
+                             limits=None, landmarks=None):
     """
     Greedy Best-First Search algorithm implementation.
     
     Args:
-        maze_obj: pyamaze.maze object representing the maze
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells; the maze's goal
+            (pyamaze's ``_goal``) or (1, 1) by default
+        all_goals (bool): With several goals, search on until every goal is
+            reached and return a path to each instead of stopping at the
+            nearest one
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None; a stopped search
+            returns the path to the cell it got closest to the goal
+        landmarks: Landmarks from select_landmarks to rank cells by the ALT
+            heuristic instead of Manhattan distance alone
         
     Returns:
-        dict: Path from start to goal
+        Path: Path from start to goal ({goal: path} with all_goals)
     """
-    start = (maze_obj.rows, maze_obj.cols)
-    goal = (1, 1)
-
-    # Initialize tracking sets
-    maze_obj.expanded_nodes = set()  # Nodes we've processed
-    maze_obj.explored_cells = set()  # Cells we've seen
-    maze_obj.explored_cells.add(start)  # Start is immediately seen
+    return run_steps(
+        greedy_best_first_steps(maze_obj, start, goal, all_goals, stats, limits,
+                                landmarks=landmarks, emit=False)
+    )
 
-    frontier = PriorityQueue()
-    frontier.put((manhattan_distance(start, goal), start))
-    came_from = {}
-
-    while not frontier.empty():
-        current = frontier.get()[1]
-        maze_obj.expanded_nodes.add(current)  # Mark as expanded when we process it
+def greedy_best_first_steps(maze_obj, start=None, goal=None, all_goals=False, stats=None,
+                            limits=None, landmarks=None, emit=True):
+    """
+    Greedy best-first search as a generator of search steps (f is the
+    heuristic value).
 
-        if current == goal:
-            break
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        all_goals (bool): Return a path to every goal
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        landmarks: Landmarks for the ALT heuristic, or None
+        emit (bool): Yield events; False just runs the search
 
-        for direction in 'ESNW':
-            if maze_obj.maze_map[current][direction]:
-                if direction == 'E':
-                    neighbor = (current[0], current[1]+1)
-                elif direction == 'W':
-                    neighbor = (current[0], current[1]-1)
-                elif direction == 'N':
-                    neighbor = (current[0]-1, current[1])
-                elif direction == 'S':
-                    neighbor = (current[0]+1, current[1])
+    Yields:
+        SearchEvent: One per expanded cell
 
-                if neighbor not in maze_obj.explored_cells:
-                    maze_obj.explored_cells.add(neighbor)  # Mark as explored when we first see it
-                    frontier.put((manhattan_distance(neighbor, goal), neighbor))
-                    came_from[neighbor] = current
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals), as the
+        generator's return value (see SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
 
-    # Reconstruct path
-    path = {}
-    current = goal
-    while current != start:
-        path[came_from[current]] = current
-        current = came_from[current]
+    if landmarks is not None:
+        landmarks.check(grid)
+        heuristic = landmarks.heuristic(goals, start)
+    else:
+        heuristic = manhattan_heuristic(grid, goals)
 
-    return path
+    # Ordered by heuristic alone; a cell keeps the parent it was first seen from
+    came_from, reached = yield from best_first_steps(
+        grid, start, goals, heuristic=heuristic,
+        g_weight=0, reopen=False, all_goals=all_goals, stats=stats, limits=limits, emit=emit
+    )
+    return goal_paths(grid, came_from, start, goals, reached, all_goals,
+                      partial=limits is not None and limits.stopped)
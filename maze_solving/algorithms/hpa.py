@@ -0,0 +1,337 @@
+"""
+Hierarchical Path-Finding A* (HPA*) over a precomputed cluster graph.
+
+The grid is cut into square clusters. Every cell with an open side into
+another cluster is an entrance, and for each cluster the move count between
+every pair of its entrances is precomputed with a breadth-first search that
+stays inside the cluster. Those distances plus the one-move links across
+cluster borders form the abstract graph.
+
+A query links the start and goal to the entrances of their own clusters,
+runs A* over the abstract graph and then refines only the clusters the
+route passes through, with one in-cluster BFS per abstract edge. Because
+every border crossing is an entrance, the refined path is a shortest path.
+
+Changing a wall only invalidates the one or two clusters it touches, which
+are rebuilt on their own.
+"""
+
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+
+from ..grid import Grid, as_grid
+from ..path import INDEX_TYPECODE, Path, parent_array, tree_cells
+from .core import closest_cell, manhattan_heuristic, resolve_endpoints
+from .stats import EXPAND, EXPLORE
+
+
+class HierarchicalPlanner:
+    """
+    HPA* planner answering many queries on one maze.
+
+    Example:
+        planner = HierarchicalPlanner(m, cluster_size=16)
+        path = planner.path((200, 200), (1, 1))
+        planner.set_wall((3, 4), 'E', is_open=False)
+        path = planner.path((200, 200), (1, 1))  # Only two clusters rebuilt
+
+    Planners pickle down to the grid and the entrance tables, so one built
+    for a large maze can be saved and loaded instead of precomputed again.
+
+    Attributes:
+        grid: maze_solving.grid.Grid being planned on (a private copy when
+            built from a pyamaze maze)
+        cluster_size (int): Side of a cluster in cells
+        cluster_cols (int): Number of clusters across the grid
+        cluster_count (int): Number of clusters
+        entrances (dict): Entrance flat indices of each cluster id
+        links (dict): For each entrance, a list of (node, moves) pairs: the
+            entrances it reaches inside its cluster and, one move away, the
+            entrances across its cluster's border
+    """
+
+    def __init__(self, maze_obj, cluster_size=16):
+        """
+        Args:
+            maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the
+                maze; a Grid is planned on (and modified) in place
+            cluster_size (int): Side of a cluster in cells
+        """
+        if cluster_size < 1:
+            raise ValueError('cluster_size must be at least 1')
+        self._maze_obj = None if isinstance(maze_obj, Grid) else maze_obj
+        self._layout(as_grid(maze_obj), cluster_size)
+        for cluster in range(self.cluster_count):
+            self._build(cluster)
+
+    def __getstate__(self):
+        # Entrance tables packed into flat arrays: cluster sizes, then
+        # entrances, then each entrance's link count and (entrance, moves)
+        sizes, nodes, counts, targets = array('l'), array('l'), array('l'), array('l')
+        for cluster in range(self.cluster_count):
+            entrances = self.entrances[cluster]
+            sizes.append(len(entrances))
+            nodes.extend(entrances)
+            for entrance in entrances:
+                links = self.links[entrance]
+                counts.append(len(links))
+                for target, moves in links:
+                    targets.extend((target, moves))
+        return (self.grid, self.cluster_size, sizes.tobytes(), nodes.tobytes(),
+                counts.tobytes(), targets.tobytes())
+
+    def __setstate__(self, state):
+        grid, cluster_size, *packed = state
+        sizes, nodes, counts, targets = (array('l', data) for data in packed)
+        self._maze_obj = None
+        self._layout(grid, cluster_size)
+        n = t = 0
+        for cluster, size in enumerate(sizes):
+            entrances = list(nodes[n:n + size])
+            self.entrances[cluster] = entrances
+            for entrance, count in zip(entrances, counts[n:n + size]):
+                pairs = targets[t:t + 2 * count]
+                self.links[entrance] = list(zip(pairs[::2], pairs[1::2]))
+                t += 2 * count
+            n += size
+
+    def _layout(self, grid, cluster_size):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cluster_cols = -(-grid.cols // cluster_size)
+        self.cluster_count = -(-grid.rows // cluster_size) * self.cluster_cols
+        self.entrances = {}
+        self.links = {}
+
+    def cluster_of(self, index):
+        """Cluster id of a flat index."""
+        row, col = divmod(index, self.grid.cols)
+        return row // self.cluster_size * self.cluster_cols + col // self.cluster_size
+
+    def _bounds(self, cluster):
+        """(top, bottom, left, right) row and column ranges of a cluster."""
+        k = self.cluster_size
+        top, left = divmod(cluster, self.cluster_cols)
+        top, left = top * k, left * k
+        return top, min(top + k, self.grid.rows), left, min(left + k, self.grid.cols)
+
+    def _cells(self, cluster):
+        """Flat indices of the cells in a cluster."""
+        cols = self.grid.cols
+        top, bottom, left, right = self._bounds(cluster)
+        return [row * cols + col
+                for row in range(top, bottom)
+                for col in range(left, right)]
+
+    def _bfs(self, source, cluster, target=None):
+        """
+        Breadth-first search from source that stays inside its cluster.
+
+        Returns:
+            dict: Predecessor of every cell reached (source maps to None),
+            stopping early once target is reached
+        """
+        openings, moves, cols = self.grid.openings, self.grid.moves, self.grid.cols
+        top, bottom, left, right = self._bounds(cluster)
+        first, end = top * cols, bottom * cols
+        parent = {source: None}
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            if cell == target:
+                break
+            for offset in moves[openings[cell]]:
+                neighbor = cell + offset
+                if (neighbor not in parent and first <= neighbor < end
+                        and left <= neighbor % cols < right):
+                    parent[neighbor] = cell
+                    queue.append(neighbor)
+        return parent
+
+    def _distances(self, source, cluster, targets):
+        """Moves from source to each of targets reachable inside the cluster."""
+        parent = self._bfs(source, cluster)
+        found = []
+        for target in targets:
+            if target in parent and target != source:
+                moves, cell = 0, target
+                while cell != source:
+                    cell = parent[cell]
+                    moves += 1
+                found.append((target, moves))
+        return found
+
+    def _crossings(self, index):
+        """Neighbours of index that lie in another cluster."""
+        cluster = self.cluster_of(index)
+        return [index + offset for offset in self.grid.moves[self.grid.openings[index]]
+                if self.cluster_of(index + offset) != cluster]
+
+    def _build(self, cluster):
+        """(Re)compute the entrances of a cluster and the links between them."""
+        for old in self.entrances.get(cluster, ()):
+            del self.links[old]
+        entrances = [index for index in self._cells(cluster) if self._crossings(index)]
+        self.entrances[cluster] = entrances
+        for entrance in entrances:
+            self.links[entrance] = self._distances(entrance, cluster, entrances) + [
+                (neighbor, 1) for neighbor in self._crossings(entrance)
+            ]
+
+    def update(self, cells):
+        """
+        Rebuild the clusters holding some cells after their walls changed
+        (set_wall does this itself).
+
+        Args:
+            cells: (row, col) cells whose sides were changed on the grid
+        """
+        for cluster in {self.cluster_of(self.grid.index(cell)) for cell in cells}:
+            self._build(cluster)
+
+    def set_wall(self, cell, direction, is_open):
+        """
+        Apply a wall change event.
+
+        Args:
+            cell (tuple): (row, col) cell whose side changes
+            direction (str): Side of the cell ('E', 'W', 'N', 'S')
+            is_open (bool): True if the wall was removed, False if built
+        """
+        neighbor = self.grid.set_open(cell, direction, is_open)
+        if self._maze_obj is not None:
+            # Keep the pyamaze maze in step so it can still be drawn
+            for c in (cell, neighbor):
+                sides = self._maze_obj.maze_map[c]
+                for d in 'EWNS':
+                    sides[d] = 1 if self.grid.is_open(c, d) else 0
+        self.update((cell, neighbor))
+
+    def path(self, start=None, goal=None, stats=None, limits=None):
+        """
+        Answer a query: search the abstract graph and refine the route.
+
+        Args:
+            start (tuple): (row, col) start cell, bottom-right by default
+            goal (tuple): (row, col) goal cell, (1, 1) by default
+            stats: SearchStats to add the counters of the abstract search
+                to (which count abstract nodes only), or None
+            limits: SearchLimits bounding the abstract search, or None; a
+                stopped search returns the path to the node it got closest
+                to the goal
+
+        Returns:
+            Path: Path from start to goal, in the same format as
+            astar_search; empty if the goal is unreachable
+        """
+        grid = self.grid
+        start, goals = resolve_endpoints(grid, grid, start, goal)
+        if len(goals) != 1:
+            raise ValueError('Hierarchical search needs exactly one goal')
+        goal = goals[0]
+
+        came_from, reached = self._search(start, goal, stats, limits)
+        if reached is None:
+            if limits is None or not limits.stopped:
+                return Path(grid.cols)
+            reached = closest_cell(grid, [start, *tree_cells(came_from)], goals)
+        return self._refine(came_from, start, reached)
+
+    def _search(self, start, goal, stats, limits):
+        """A* over the abstract graph; returns (came_from, reached)."""
+        grid = self.grid
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        heuristic = manhattan_heuristic(grid, goal)
+
+        # Temporary links from the start to its cluster's entrances (and to
+        # the goal if it shares the cluster), and from entrances to the goal
+        start_entrances = self.entrances[start_cluster]
+        targets = start_entrances + [goal] if goal_cluster == start_cluster else start_entrances
+        start_links = self._distances(start, start_cluster, targets) + [
+            (neighbor, 1) for neighbor in self._crossings(start)
+        ]
+        to_goal = {entrance: moves for entrance, moves in
+                   self._distances(goal, goal_cluster, self.entrances[goal_cluster])}
+
+        # Abstract nodes are cells, so the search state is indexed like core's
+        unseen = float('inf')
+        g_score = [unseen] * grid.size
+        g_score[start] = 0
+        closed = bytearray(grid.size)
+        came_from = parent_array(grid.size)
+        events = [(EXPLORE, start)] if stats is not None and stats.detailed else None
+        expanded = 0
+        explored = 1
+        pushes = stale = 0
+        peak = 1
+        frontier = [(heuristic(start), heuristic(start), start)]
+        reached = None
+        check_at = limits.start() if limits is not None else unseen
+
+        while frontier:
+            if expanded >= check_at:
+                if limits.check(expanded):
+                    break
+                check_at = limits.next_check(expanded)
+            _, _, current = heappop(frontier)
+            if closed[current]:
+                stale += 1
+                continue  # Stale entry left behind by a cheaper push
+            closed[current] = 1
+            expanded += 1
+            if events is not None:
+                events.append((EXPAND, current))
+            if current == goal:
+                reached = current
+                break
+
+            links = start_links if current == start else self.links[current]
+            if current in to_goal:
+                links = links + [(goal, to_goal[current])]
+
+            g = g_score[current]
+            for neighbor, moves in links:
+                new_g = g + moves
+                old_g = g_score[neighbor]
+                if closed[neighbor] or new_g >= old_g:
+                    continue
+                if old_g == unseen:
+                    explored += 1
+                if events is not None:
+                    events.append((EXPLORE, neighbor))
+                g_score[neighbor] = new_g
+                came_from[neighbor] = current
+                h = heuristic(neighbor)
+                heappush(frontier, (new_g + h, h, neighbor))
+                pushes += 1
+                if len(frontier) > peak:
+                    peak = len(frontier)
+
+        if stats is not None:
+            stats.record(grid, expanded, explored, pushes, stale, peak, events)
+        if limits is not None:
+            limits.finish(reached is not None)
+        return came_from, reached
+
+    def _refine(self, came_from, start, goal):
+        """Turn the abstract route into cells, one in-cluster BFS per leg."""
+        grid = self.grid
+        nodes = [goal]
+        while nodes[-1] != start:
+            nodes.append(came_from[nodes[-1]])
+        nodes.reverse()
+
+        path = array(INDEX_TYPECODE, [start])
+        for a, b in zip(nodes, nodes[1:]):
+            cluster = self.cluster_of(a)
+            if cluster != self.cluster_of(b):
+                path.append(b)  # Border crossing
+                continue
+            parent = self._bfs(a, cluster, b)
+            cells = [b]
+            while cells[-1] != a:
+                cells.append(parent[cells[-1]])
+            path.extend(reversed(cells[:-1]))
+        return Path(grid.cols, path)
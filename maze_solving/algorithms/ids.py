@@ -1,81 +1,305 @@
 """
 Iterative Deepening Search (IDS) Algorithm implementation for maze solving.
+
+The depth-first passes use an explicit stack instead of recursion, so the
+search is bounded by memory proportional to the current path depth rather
+than by Python's recursion limit. The same loop runs IDA* when given the
+Manhattan heuristic: the cutoff is then on f = g + h and each new threshold
+is the smallest f that exceeded the previous one.
+
+Every pass searches again from the start, so the passes alone would
+re-expand the cells of a looped maze once per path that reaches them. The
+optional transposition table remembers the shallowest depth each cell was
+reached at, over all passes, and prunes branches that arrive deeper (or as
+deep, a second time in the same pass). IDA*, which uses a table by default,
+then solves a 200x200 maze with loops in about a second; a pass is still
+needed for every f threshold, so 500x500 takes tens of seconds and
+1000x1000 is out of reach. Plain IDS deepens one move per pass and is
+practical up to about 100x100.
 """
 
-def depth_limited_search(maze_obj, start, goal, depth_limit, expanded_nodes, explored_cells, visited):
-    """Helper function for IDS that performs depth-limited search."""
-    if start == goal:
-        return True, {}
-    
-    if depth_limit <= 0:
-        return False, {}
-    
-    # Mark current node as expanded and visited
-    expanded_nodes.add(start)
-    visited.add(start)
-    
-    # Check all possible directions
-    for direction in 'ESNW':
-        if maze_obj.maze_map[start][direction]:
-            # Calculate neighbor coordinates
-            if direction == 'E':
-                neighbor = (start[0], start[1]+1)
-            elif direction == 'W':
-                neighbor = (start[0], start[1]-1)
-            elif direction == 'N':
-                neighbor = (start[0]-1, start[1])
-            else:  # S
-                neighbor = (start[0]+1, start[1])
-            
-            # Mark cell as explored when we first see it
-            explored_cells.add(neighbor)
-            
-            # Skip if we've already visited this node in current path
-            if neighbor in visited:
+from ..grid import as_grid
+from ..path import Path
+from .core import (
+    SearchEvent, closest_cell, manhattan_heuristic, resolve_endpoints, run_steps
+)
+from .stats import EXPAND, EXPLORE
+
+# Transposition table entries IDA* keeps by default
+DEFAULT_TABLE_SIZE = 1 << 20
+
+def deepening_search(grid, start, goals, heuristic=None, table_size=None, all_goals=False,
+                     stats=None, limits=None):
+    """
+    Run iterative deepening (or IDA*) over a Grid.
+
+    Takes the same arguments as deepening_steps and returns its result
+    without producing any events.
+    """
+    return run_steps(deepening_steps(grid, start, goals, heuristic, table_size, all_goals,
+                                     stats, limits, emit=False))
+
+def deepening_steps(grid, start, goals, heuristic=None, table_size=None, all_goals=False,
+                    stats=None, limits=None, emit=True):
+    """
+    Run iterative deepening (or IDA*) over a Grid, yielding a SearchEvent
+    each time a cell is added to the current branch.
+
+    Args:
+        grid: maze_solving.grid.Grid to search
+        start (int): Flat index of the start cell
+        goals (list): Flat indices of the goal cells
+        heuristic (callable): Estimate of the remaining moves from a cell
+            (to the nearest goal); None gives plain depth-first iterative
+            deepening
+        table_size (int): Maximum entries in the transposition table that
+            prunes cells already reached at a smaller depth in any pass, or
+            at the same depth in the current pass; None disables the table
+        all_goals (bool): Keep deepening until every goal has been found
+            instead of stopping at the first one
+        stats: SearchStats to add the search's counters to, or None;
+            frontier_peak is the deepest branch searched
+        limits: SearchLimits to stop the search early by, or None; every
+            cell added to a branch counts as an expansion
+        emit (bool): Yield events; False runs the search without stopping
+
+    Yields:
+        SearchEvent: With f the cell's depth plus heuristic and no pushed
+        cells; every pass starts again with an event for the start cell
+
+    Returns:
+        dict: Maps each goal reached to the list of flat indices from start
+        to it, in the order they were found; a search stopped by its limits
+        before reaching any goal instead maps the branch cell nearest the
+        goals to the branch leading to it
+    """
+    # Passes revisit cells, so distinct cells are counted with marks
+    expanded = bytearray(grid.size)  # Nodes we've processed
+    explored = bytearray(grid.size)  # Cells we've seen
+    events = [] if stats is not None and stats.detailed else None
+    found = {}
+    peak = yield from _deepen(grid, start, goals, heuristic, table_size, all_goals,
+                              found, expanded, explored, events, limits, emit)
+    if stats is not None:
+        stats.record(grid, expanded.count(1), explored.count(1),
+                     frontier_peak=peak, events=events)
+    if limits is not None:
+        limits.finish(bool(found))
+    return found
+
+def _keep_partial(grid, goals, found, branch):
+    """Record the branch prefix nearest the goals if no goal was found."""
+    if not found:
+        best = closest_cell(grid, branch, goals)
+        found[best] = branch[:branch.index(best) + 1]
+
+def _deepen(grid, start, goals, heuristic, table_size, all_goals,
+            found, expanded, explored, events, limits, emit):
+    """Fill ``found`` with the goals reached; return the deepest branch."""
+    # Generator behind deepening_steps: yields its events when emit is set
+    openings, moves = grid.openings, grid.moves
+    check_at = limits.start() if limits is not None else float('inf')
+    explored[start] = 1
+    if events is not None:
+        events.append((EXPLORE, start))
+    targets = set(goals)
+    if start in targets:
+        found[start] = [start]
+        targets.discard(start)
+        if not all_goals or not targets:
+            return 1
+
+    unbounded = float('inf')
+    threshold = start_f = heuristic(start) if heuristic else 0
+    on_path = bytearray(grid.size)  # Cells on the current branch
+    peak = 1
+    work = 0  # Cells added to a branch, over every pass
+    # Cell -> (smallest depth it was reached at, pass that reached it there).
+    # Kept across passes, so a cell is searched again only from a shallower
+    # branch, or from as shallow a one once per pass
+    table = {} if table_size else None
+    passes = 0
+
+    while True:
+        if work >= check_at:
+            if limits.check(work):
+                _keep_partial(grid, goals, found, [start])
+                return peak
+            check_at = limits.next_check(work)
+        work += 1
+        passes += 1
+        next_threshold = unbounded
+
+        # Current branch and, for each cell on it, the next move to try
+        cells = [start]
+        tried = [0]
+        on_path[start] = 1
+        expanded[start] = 1
+        if events is not None:
+            events.append((EXPAND, start))
+        if emit:
+            yield SearchEvent(grid.cell(start), (), start_f)
+
+        while cells:
+            cell = cells[-1]
+            options = moves[openings[cell]]
+            i = tried[-1]
+            if i == len(options):
+                # Every move from this cell tried: backtrack
+                on_path[cell] = 0
+                cells.pop()
+                tried.pop()
                 continue
-                
-            # Recursively search from neighbor
-            found, child_path = depth_limited_search(
-                maze_obj, neighbor, goal, depth_limit-1,
-                expanded_nodes, explored_cells, visited
-            )
-            
-            if found:
-                child_path[start] = neighbor
-                return True, child_path
-    
-    # Remove from visited when backtracking
-    visited.remove(start)
-    return False, {}
-
-def iterative_deepening_search(maze_obj):
+            tried[-1] = i + 1
+
+            neighbor = cell + options[i]
+            if on_path[neighbor]:
+                continue
+            explored[neighbor] = 1
+            if events is not None:
+                events.append((EXPLORE, neighbor))
+
+            depth = len(cells)
+            f = depth + (heuristic(neighbor) if heuristic else 0)
+            if f > threshold:
+                if f < next_threshold:
+                    next_threshold = f
+                continue
+            if neighbor in targets:
+                found[neighbor] = cells + [neighbor]
+                targets.discard(neighbor)
+                if not all_goals or not targets:
+                    if emit:
+                        yield SearchEvent(grid.cell(neighbor), (), f)
+                    return max(peak, depth + 1)
+
+            if table is not None:
+                seen = table.get(neighbor)
+                if seen is not None and (seen[0] < depth or seen == (depth, passes)):
+                    continue
+                if seen is not None or len(table) < table_size:
+                    table[neighbor] = (depth, passes)
+
+            if work >= check_at:
+                if limits.check(work):
+                    _keep_partial(grid, goals, found, cells)
+                    return peak
+                check_at = limits.next_check(work)
+            work += 1
+            expanded[neighbor] = 1
+            if events is not None:
+                events.append((EXPAND, neighbor))
+            on_path[neighbor] = 1
+            cells.append(neighbor)
+            tried.append(0)
+            if depth + 1 > peak:
+                peak = depth + 1
+            if emit:
+                yield SearchEvent(grid.cell(neighbor), (), f)
+
+        if next_threshold == unbounded:
+            # Nothing was cut off, so deeper passes cannot reach the goal
+            return peak
+        threshold = next_threshold
+
+def iterative_deepening_search(maze_obj, start=None, goal=None, all_goals=False,
+                               heuristic=False, table_size=None, stats=None, limits=None):
     """
     Iterative Deepening Search algorithm implementation.
-    
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells; the maze's goal
+            (pyamaze's ``_goal``) or (1, 1) by default
+        all_goals (bool): With several goals, search on until every goal is
+            reached and return a path to each instead of stopping at the
+            nearest one
+        heuristic (bool): Deepen on f = depth + Manhattan distance (IDA*)
+            instead of on depth alone
+        table_size (int): Bound on the transposition table entries, or None
+            to search without one
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None; a stopped search
+            returns the part of its current branch that got closest to the
+            goal
+
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals)
+    """
+    return run_steps(iterative_deepening_steps(
+        maze_obj, start, goal, all_goals, heuristic, table_size, stats, limits, emit=False
+    ))
+
+def iterative_deepening_steps(maze_obj, start=None, goal=None, all_goals=False,
+                              heuristic=False, table_size=None, stats=None, limits=None,
+                              emit=True):
+    """
+    Iterative deepening search as a generator of search steps.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        all_goals (bool): Return a path to every goal
+        heuristic (bool): Deepen on f = depth + Manhattan distance (IDA*)
+        table_size (int): Bound on the transposition table entries, or None
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        emit (bool): Yield events; False just runs the search
+
+    Yields:
+        SearchEvent: One per cell added to the current branch
+
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals), as the
+        generator's return value (see SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+
+    found = yield from deepening_steps(
+        grid, start, goals,
+        heuristic=manhattan_heuristic(grid, goals) if heuristic else None,
+        table_size=table_size, all_goals=all_goals, stats=stats, limits=limits, emit=emit
+    )
+
+    if all_goals:
+        return {grid.cell(g): Path(grid.cols, found.get(g, ())) for g in goals}
+    return Path(grid.cols, next(iter(found.values()), ()))
+
+def ida_star_search(maze_obj, start=None, goal=None, all_goals=False,
+                    table_size=DEFAULT_TABLE_SIZE, stats=None, limits=None):
+    """
+    IDA* Search algorithm implementation (iterative deepening on A*'s f-cost).
+
     Args:
-        maze_obj: pyamaze.maze object representing the maze
-        
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        all_goals (bool): Return a path to every goal
+        table_size (int): Bound on the transposition table entries
+            (DEFAULT_TABLE_SIZE by default), or None to search without one
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None
+
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals)
+    """
+    return iterative_deepening_search(maze_obj, start, goal, all_goals,
+                                      heuristic=True, table_size=table_size, stats=stats,
+                                      limits=limits)
+
+def ida_star_steps(maze_obj, start=None, goal=None, all_goals=False,
+                   table_size=DEFAULT_TABLE_SIZE, stats=None, limits=None, emit=True):
+    """
+    IDA* as a generator of search steps (see iterative_deepening_steps).
+
     Returns:
-        dict: Path from start to goal
+        Path: Path from start to goal ({goal: path} with all_goals), as the
+        generator's return value
     """
-    start = (maze_obj.rows, maze_obj.cols)
-    goal = (1, 1)
-    
-    # Initialize tracking sets
-    maze_obj.expanded_nodes = set()  # Nodes we've processed
-    maze_obj.explored_cells = set()  # Cells we've seen
-    maze_obj.explored_cells.add(start)  # Start is immediately seen
-    
-    # Maximum depth is Manhattan distance * 2 for a reasonable upper bound
-    max_depth = (maze_obj.rows + maze_obj.cols) * 2
-    
-    for depth in range(1, max_depth + 1):
-        visited = set()  # Track visited nodes for current iteration
-        found, path = depth_limited_search(
-            maze_obj, start, goal, depth,
-            maze_obj.expanded_nodes, maze_obj.explored_cells, visited
-        )
-        if found:
-            return path
-            
-    return {}
+    return (yield from iterative_deepening_steps(
+        maze_obj, start, goal, all_goals, heuristic=True, table_size=table_size,
+        stats=stats, limits=limits, emit=emit
+    ))
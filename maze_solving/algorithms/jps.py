@@ -0,0 +1,275 @@
+"""
+Jump Point Search (JPS) for 4-connected mazes with unit move costs.
+
+JPS is A* over "jump points" only. Horizontal moves play the role of the
+straight moves in classic 8-connected JPS and vertical moves the role of the
+diagonals:
+
+- A horizontal jump keeps going until it reaches the goal or a cell with a
+  forced neighbour: an open north (south) side whose cell could not have been
+  reached just as cheaply by stepping north (south) one cell earlier.
+- A vertical jump scans a horizontal jump both ways at every cell and stops
+  at the first cell where one of them finds something.
+
+Every cell skipped over by a jump has a symmetric path of the same length
+that the search covers elsewhere, so the result is still a shortest path
+while only jump points are pushed on the frontier.
+
+The saving is in frontier pushes, not in cells read. Measured on 300x300
+generate_maze mazes against astar_search:
+
+- perfect and 20% loops: 1.6-1.8x fewer pushes, but 10-25% slower, since
+  jump points are nearly as dense as cells and each jump is a Python scan;
+- 100% and 300% loops: about 3.5x fewer pushes and about 2x faster;
+- a fully open 200x200 grid: 2 pushes instead of 794, yet 10x slower
+  (17 ms against 1.6 ms), because every vertical jump scans whole rows
+  both ways.
+
+Use it on loopy mazes where heap traffic dominates; plain A* is faster on
+perfect mazes and on wide open rooms.
+"""
+
+from array import array
+from heapq import heappop, heappush
+
+from ..grid import EAST, NORTH, SOUTH, WEST, as_grid
+from ..path import INDEX_TYPECODE, NO_PARENT, Path, parent_array, tree_cells
+from .core import (
+    SearchEvent, closest_cell, manhattan_heuristic, resolve_endpoints, run_steps
+)
+from .stats import EXPAND, EXPLORE
+
+
+def jump_point_search(maze_obj, start=None, goal=None, stats=None, limits=None):
+    """
+    Jump Point Search algorithm implementation.
+
+    Per-cell move costs are ignored, as in astar_search.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells (the nearest is
+            used); the maze's goal or (1, 1) by default
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search (expansions count jump
+            points), or None; a stopped search returns the path to the jump
+            point it got closest to the goal
+
+    Returns:
+        Path: Path from start to goal
+    """
+    return run_steps(jump_point_steps(maze_obj, start, goal, stats, limits, emit=False))
+
+
+def jump_point_steps(maze_obj, start=None, goal=None, stats=None, limits=None, emit=True):
+    """
+    Jump Point Search as a generator of search steps.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        emit (bool): Yield events; False just runs the search
+
+    Yields:
+        SearchEvent: One per expanded jump point, with the jump points it
+        pushed
+
+    Returns:
+        Path: Path from start to goal, as the generator's return value (see
+        SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+
+    came_from, reached = yield from jps_steps(grid, start, goals, stats=stats,
+                                              limits=limits, emit=emit)
+    if reached is None:
+        if limits is None or not limits.stopped:
+            return Path(grid.cols)
+        reached = closest_cell(grid, [start, *tree_cells(came_from)], goals)
+    return build_jump_path(grid, came_from, start, reached)
+
+
+def jps_search(grid, start, goals, stats=None, limits=None):
+    """
+    Run Jump Point Search over a Grid.
+
+    Takes the same arguments as jps_steps and returns its result without
+    producing any events.
+    """
+    return run_steps(jps_steps(grid, start, goals, stats, limits, emit=False))
+
+
+def jps_steps(grid, start, goals, stats=None, limits=None, emit=True):
+    """
+    Run Jump Point Search over a Grid, yielding a SearchEvent per expansion.
+
+    Args:
+        grid: maze_solving.grid.Grid to search
+        start (int): Flat index of the start cell
+        goals (list): Flat indices of the goal cells
+        stats: SearchStats to add the search's counters to (which count
+            jump points only), or None
+        limits: SearchLimits to stop the search early by, or None
+        emit (bool): Yield events; False runs the search without stopping
+
+    Yields:
+        SearchEvent: One per expanded jump point
+
+    Returns:
+        tuple: (came_from, reached) where came_from is a parent array giving
+        each jump point the jump point it was reached from and reached is
+        the goal found (None if no goal is reachable)
+    """
+    openings = grid.openings
+    cols = grid.cols
+    heuristic = manhattan_heuristic(grid, goals)
+    targets = set(goals)
+
+    def jump_horizontal(cell, bit, step):
+        while openings[cell] & bit:
+            nxt = cell + step
+            if nxt in targets:
+                return nxt
+            flags = openings[nxt]
+            here = openings[cell]
+            if flags & NORTH and not (here & NORTH and openings[cell - cols] & bit):
+                return nxt
+            if flags & SOUTH and not (here & SOUTH and openings[cell + cols] & bit):
+                return nxt
+            cell = nxt
+        return None
+
+    def jump_vertical(cell, bit, step):
+        while openings[cell] & bit:
+            nxt = cell + step
+            if nxt in targets:
+                return nxt
+            if (jump_horizontal(nxt, EAST, 1) is not None
+                    or jump_horizontal(nxt, WEST, -1) is not None):
+                return nxt
+            cell = nxt
+        return None
+
+    def successors(cell, parent):
+        flags = openings[cell]
+        if parent == NO_PARENT:
+            jumps = [(jump_horizontal, EAST, 1), (jump_horizontal, WEST, -1),
+                     (jump_vertical, NORTH, -cols), (jump_vertical, SOUTH, cols)]
+        elif cell // cols == parent // cols:
+            # Arrived horizontally: keep going, turn only where forced
+            step = 1 if cell > parent else -1
+            bit = EAST if step == 1 else WEST
+            previous = cell - step
+            here = openings[previous]
+            jumps = [(jump_horizontal, bit, step)]
+            if flags & NORTH and not (here & NORTH and openings[previous - cols] & bit):
+                jumps.append((jump_vertical, NORTH, -cols))
+            if flags & SOUTH and not (here & SOUTH and openings[previous + cols] & bit):
+                jumps.append((jump_vertical, SOUTH, cols))
+        else:
+            # Arrived vertically: keep going and branch both ways
+            step = cols if cell > parent else -cols
+            jumps = [(jump_vertical, SOUTH if step > 0 else NORTH, step),
+                     (jump_horizontal, EAST, 1), (jump_horizontal, WEST, -1)]
+        for jump, bit, step in jumps:
+            if flags & bit:
+                point = jump(cell, bit, step)
+                if point is not None:
+                    yield point
+
+    unseen = float('inf')
+    g_score = [unseen] * grid.size
+    g_score[start] = 0
+    closed = bytearray(grid.size)
+    came_from = parent_array(grid.size)
+    events = [(EXPLORE, start)] if stats is not None and stats.detailed else None
+    expanded = 0
+    explored = 1
+    pushes = stale = 0
+    peak = 1
+    frontier = [(heuristic(start), heuristic(start), start)]
+    reached = None
+    check_at = limits.start() if limits is not None else unseen
+
+    while frontier:
+        if expanded >= check_at:
+            if limits.check(expanded):
+                break
+            check_at = limits.next_check(expanded)
+        f, _, current = heappop(frontier)
+        if closed[current]:
+            stale += 1
+            continue  # Stale entry left behind by a cheaper push
+        closed[current] = 1
+        expanded += 1
+        if events is not None:
+            events.append((EXPAND, current))
+
+        if current in targets:
+            reached = current
+            if emit:
+                yield SearchEvent(grid.cell(current), (), f)
+            break
+
+        pushed = [] if emit else None
+        for point in successors(current, came_from[current]):
+            if closed[point]:
+                continue
+            distance = abs(point - current)
+            if point // cols != current // cols:
+                distance //= cols
+            new_g = g_score[current] + distance
+            old_g = g_score[point]
+            if new_g < old_g:
+                if old_g == unseen:
+                    explored += 1
+                if events is not None:
+                    events.append((EXPLORE, point))
+                g_score[point] = new_g
+                came_from[point] = current
+                h = heuristic(point)
+                heappush(frontier, (new_g + h, h, point))
+                pushes += 1
+                if len(frontier) > peak:
+                    peak = len(frontier)
+                if pushed is not None:
+                    pushed.append(grid.cell(point))
+
+        if emit:
+            yield SearchEvent(grid.cell(current), tuple(pushed), f)
+
+    if stats is not None:
+        stats.record(grid, expanded, explored, pushes, stale, peak, events)
+    if limits is not None:
+        limits.finish(reached is not None)
+    return came_from, reached
+
+
+def build_jump_path(grid, came_from, start, goal):
+    """
+    Expand jump point links back into a cell-by-cell path.
+
+    Args:
+        grid: maze_solving.grid.Grid that was searched
+        came_from: Parent array giving each jump point the jump point it
+            was reached from
+        start (int): Flat index of the start cell
+        goal (int): Flat index of the goal cell
+
+    Returns:
+        Path: Path from start to goal
+    """
+    points = Path.from_parents(grid, came_from, start, goal).cells
+    cells = array(INDEX_TYPECODE, points[:1])
+    for previous, current in zip(points, points[1:]):
+        if current // grid.cols == previous // grid.cols:
+            step = 1 if current > previous else -1
+        else:
+            step = grid.cols if current > previous else -grid.cols
+        cells.extend(range(previous + step, current + step, step))
+    return Path(grid.cols, cells)
@@ -0,0 +1,244 @@
+"""
+Dead-end pruning and corridor contraction.
+
+Mazes carved by a backtracker are mostly dead ends and one-cell-wide
+corridors. Preprocessing shrinks such a maze into a junction graph:
+
+- Dead ends are pruned by repeatedly removing cells with a single open
+  neighbour (other than the cells that must be kept, such as the start and
+  goal) until none are left, so whole dead-end branches disappear.
+- Every remaining cell with exactly two remaining neighbours lies on a
+  corridor. The other cells (junctions, plus the kept cells) become nodes,
+  and each corridor becomes one weighted edge between the nodes at its ends.
+
+A search over the graph expands only junctions. Corridor cells are not
+stored; a path is expanded back into cells by walking each corridor again
+from the move that leaves its first node.
+"""
+
+from array import array
+
+from ..grid import as_grid
+from ..path import INDEX_TYPECODE, Path, tree_cells
+from .core import best_first_search, closest_cell, manhattan_heuristic, resolve_endpoints
+
+# Number of open sides of each opening mask, as a bytes.translate table
+_DEGREE = bytes(bin(mask & 15).count('1') for mask in range(256))
+
+
+class JunctionGraph:
+    """
+    Junctions of a maze joined by contracted corridors.
+
+    Example:
+        graph = junction_graph(m, keep=[(20, 20), (1, 1)])
+        path = graph.path((20, 20), (1, 1))
+
+    Attributes:
+        grid: maze_solving.grid.Grid the graph was built from
+        keep (set): Flat indices that were never pruned; any two of them can
+            be routed between
+        alive: bytearray marking the cells left after dead-end pruning
+        edges (dict): For each node (flat index), a list of (neighbour,
+            length, cost, offset) tuples: the node at the far end of the
+            corridor, its number of moves, the summed cost of leaving each
+            cell along it and the index offset of its first move
+    """
+
+    def __init__(self, grid, keep, alive, edges):
+        self.grid = grid
+        self.keep = keep
+        self.alive = alive
+        self.edges = edges
+
+    def __repr__(self):
+        return (f'JunctionGraph(cells={self.grid.size}, alive={self.alive.count(1)}, '
+                f'nodes={len(self.edges)})')
+
+    @property
+    def node_count(self):
+        """Number of nodes (junctions and kept cells)."""
+        return len(self.edges)
+
+    @property
+    def edge_count(self):
+        """Number of corridors, each counted once."""
+        return sum(len(links) for links in self.edges.values()) // 2
+
+    def path(self, start=None, goal=None, use_cost=False, stats=None, limits=None):
+        """
+        Search the graph and expand the route back into cells.
+
+        Without costs this is A* on corridor lengths with the Manhattan
+        heuristic; with costs it is uniform cost search on the summed cell
+        costs, matching astar_search and uniform_cost_search.
+
+        Args:
+            start (tuple): (row, col) start cell, bottom-right by default;
+                must be one of the kept cells
+            goal: (row, col) goal cell or a list of goal cells (the nearest
+                is used), (1, 1) by default; must be kept cells
+            use_cost (bool): Read move costs from the grid's cost layer
+                instead of charging 1 per move
+            stats: SearchStats to add the search's counters to (which count
+                nodes only), or None
+            limits: SearchLimits bounding the search (expansions count
+                nodes), or None
+
+        Returns:
+            Path: Path from start to goal, {cell: next_cell}
+
+        Raises:
+            ValueError: If start or a goal was not kept when building the
+                graph
+        """
+        grid = self.grid
+        start, goals = resolve_endpoints(grid, grid, start, goal)
+        for index in [start, *goals]:
+            if index not in self.keep:
+                raise ValueError(f'{grid.cell(index)} is not a kept cell of this graph')
+
+        heuristic = None if use_cost else manhattan_heuristic(grid, goals)
+        came_from, reached = best_first_search(grid, start, goals, heuristic,
+                                               use_cost=use_cost, stats=stats,
+                                               limits=limits, graph=self)
+        if reached:
+            return self._expand(came_from, start, reached[0], use_cost)
+        if limits is None or not limits.stopped:
+            return Path(grid.cols)
+        nearest = closest_cell(grid, [start, *tree_cells(came_from)], goals)
+        return self._expand(came_from, start, nearest, use_cost)
+
+    def _expand(self, came_from, start, goal, use_cost):
+        """Walk the corridors of the node path from start to goal."""
+        grid, alive = self.grid, self.alive
+        openings, moves = grid.openings, grid.moves
+        weight = 2 if use_cost else 1  # Index of the charge in an edge tuple
+        legs = []
+        node = goal
+        while node != start:
+            previous = came_from[node]
+            # Of parallel corridors, the search went down the cheapest
+            offset = min((link for link in self.edges[previous] if link[0] == node),
+                         key=lambda link: link[weight])[3]
+            legs.append((previous, offset, node))
+            node = previous
+
+        path = array(INDEX_TYPECODE, [start])
+        for node, offset, end in reversed(legs):
+            prev, cell = node, node + offset
+            path.append(cell)
+            while cell != end:
+                # Corridor cells have exactly one way on besides the way in
+                for step in moves[openings[cell]]:
+                    nxt = cell + step
+                    if nxt != prev and alive[nxt]:
+                        break
+                path.append(nxt)
+                prev, cell = cell, nxt
+        return Path(grid.cols, path)
+
+
+def junction_graph(maze_obj, keep=None):
+    """
+    Prune the dead ends of a maze and contract its corridors.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        keep: (row, col) cells that must stay in the graph, such as every
+            start and goal it will be asked about; the maze's default start
+            and goal by default
+
+    Returns:
+        JunctionGraph: Nodes and corridors of the pruned maze
+    """
+    grid = as_grid(maze_obj)
+    if keep is None:
+        start, goals = resolve_endpoints(maze_obj, grid)
+        keep = {start, *goals}
+    else:
+        keep = {grid.index(cell) for cell in keep}
+    openings, moves = grid.openings, grid.moves
+
+    # Peel dead ends: a cell left with one open neighbour is removed, which
+    # may leave its neighbour with only one
+    degree = bytearray(bytes(openings).translate(_DEGREE))
+    alive = bytearray(b'\x01') * grid.size
+    stack = [i for i in range(grid.size) if degree[i] < 2 and i not in keep]
+    while stack:
+        cell = stack.pop()
+        if not alive[cell]:
+            continue
+        alive[cell] = 0
+        for offset in moves[openings[cell]]:
+            neighbor = cell + offset
+            if alive[neighbor]:
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1 and neighbor not in keep:
+                    stack.append(neighbor)
+
+    # Every surviving cell that is not a plain corridor cell is a node
+    nodes = [i for i in range(grid.size)
+             if alive[i] and (degree[i] != 2 or i in keep)]
+    is_node = bytearray(grid.size)
+    for node in nodes:
+        is_node[node] = 1
+
+    cost = grid.cost
+    edges = {}
+    for node in nodes:
+        links = []
+        for offset in moves[openings[node]]:
+            cell = node + offset
+            if not alive[cell]:
+                continue
+            prev, length = node, 1
+            total = 1 if cost is None else cost[node]
+            while not is_node[cell]:
+                for step in moves[openings[cell]]:
+                    nxt = cell + step
+                    if nxt != prev and alive[nxt]:
+                        break
+                total += 1 if cost is None else cost[cell]
+                prev, cell = cell, nxt
+                length += 1
+            if cell != node:
+                links.append((cell, length, total, offset))
+        edges[node] = links
+
+    return JunctionGraph(grid, keep, alive, edges)
+
+
+def compressed_search(maze_obj, start=None, goal=None, use_cost=False, stats=None,
+                      limits=None, graph=None):
+    """
+    Solve a maze on its junction graph.
+
+    Building the graph is a pass over every cell, which costs more than a
+    plain search of the maze. It pays off when one graph answers many
+    queries: build it once with junction_graph() and pass it in.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells (the nearest is
+            used); the maze's goal or (1, 1) by default
+        use_cost (bool): Route on the grid's cost layer (see
+            JunctionGraph.path)
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None
+        graph: JunctionGraph of the maze that keeps start and the goals, or
+            None to build one for this query
+
+    Returns:
+        Path: Path from start to goal
+
+    Raises:
+        ValueError: If start or a goal is not kept in ``graph``
+    """
+    grid = as_grid(maze_obj) if graph is None else graph.grid
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
+    ends = [grid.cell(index) for index in goals]
+    if graph is None:
+        graph = junction_graph(grid, keep=[grid.cell(start), *ends])
+    return graph.path(grid.cell(start), ends, use_cost=use_cost, stats=stats, limits=limits)
@@ -0,0 +1,199 @@
+"""
+ALT (A*, landmarks, triangle inequality) heuristics.
+
+Manhattan distance is a weak bound in a maze, where the walk between two
+cells is often many times longer than the straight line. ALT precomputes the
+true move count from a few landmark cells to every cell; for any landmark L
+the triangle inequality gives
+
+    dist(n, goal) >= |dist(L, goal) - dist(L, n)|
+
+so the largest of these differences (and the Manhattan distance) is an
+admissible, consistent heuristic that is usually far tighter. Landmarks are
+picked by farthest-point selection, which puts them at the extremities of
+the maze where the bounds are sharpest.
+
+Each landmark costs one unsigned array over the grid (2 bytes per cell on
+grids under 65535 cells, 4 bytes otherwise). Only unit move costs are
+covered, as in astar_search.
+"""
+
+from array import array
+from hashlib import blake2b
+
+from ..grid import as_grid
+from .core import manhattan_heuristic
+
+
+class Landmarks:
+    """
+    Move counts from a set of landmark cells to every cell of a maze.
+
+    Example:
+        table = select_landmarks(m, count=8)
+        path = astar_search(m, landmarks=table)
+
+    Landmarks pickle with their grid, so a table can be saved next to the
+    maze it was computed for.
+
+    Attributes:
+        grid: maze_solving.grid.Grid the distances were computed on
+        cells (list): Flat indices of the landmarks
+        distances (list): One array per landmark with the move count to
+            every cell, ``unreachable`` where there is no path
+        unreachable (int): Value marking cells a landmark cannot reach
+        layout (bytes): Digest of the grid's walls when the distances were
+            computed
+    """
+
+    def __init__(self, grid, cells, distances, unreachable):
+        self.grid = grid
+        self.cells = cells
+        self.distances = distances
+        self.unreachable = unreachable
+        self.layout = _layout(grid)
+
+    def __repr__(self):
+        return f'Landmarks(count={len(self.cells)}, bytes={self.nbytes})'
+
+    @property
+    def nbytes(self):
+        """Memory held by the distance arrays."""
+        return sum(d.itemsize * len(d) for d in self.distances)
+
+    def check(self, grid):
+        """
+        Raise ValueError unless the table was computed for this grid.
+
+        Distances from another wall layout, even of the same size, would
+        overestimate and make the search return longer paths, so the walls
+        are compared by digest too.
+        """
+        if (grid.rows, grid.cols) != (self.grid.rows, self.grid.cols):
+            raise ValueError(f'Landmarks were computed for a {self.grid.rows}x'
+                             f'{self.grid.cols} maze, not {grid.rows}x{grid.cols}')
+        if _layout(grid) != self.layout:
+            raise ValueError('Landmarks were computed for a maze with other walls')
+
+    def heuristic(self, goals, start=None, active=4):
+        """
+        Build an ALT heuristic towards ``goals``.
+
+        Args:
+            goals: Flat index of the goal, or a list of flat indices to bound
+                the distance to the nearest one
+            start (int): Flat index of the query's start; when given, only
+                the ``active`` landmarks with the best bound at the start are
+                used, which keeps each heuristic call cheap
+            active (int): Landmarks kept when start is given
+
+        Returns:
+            callable: Function mapping a flat index to a lower bound on its
+            distance to the goal
+        """
+        goals = [goals] if isinstance(goals, int) else list(goals)
+        manhattan = manhattan_heuristic(self.grid, goals)
+        unreachable = self.unreachable
+
+        # (distances, goal distance) for each landmark that reaches every goal
+        tables = [(d, [d[g] for g in goals]) for d in self.distances
+                  if all(d[g] != unreachable for g in goals)]
+        if start is not None and len(tables) > active:
+            def bound_at_start(table):
+                d, to_goals = table
+                if d[start] == unreachable:
+                    return -1
+                return min(abs(d[start] - g) for g in to_goals)
+            tables = sorted(tables, key=bound_at_start, reverse=True)[:active]
+
+        if len(goals) == 1:
+            pairs = [(d, to_goals[0]) for d, to_goals in tables]
+
+            def heuristic(index):
+                best = manhattan(index)
+                for d, to_goal in pairs:
+                    here = d[index]
+                    if here != unreachable:
+                        bound = here - to_goal if here > to_goal else to_goal - here
+                        if bound > best:
+                            best = bound
+                return best
+        else:
+            def heuristic(index):
+                # Nearest goal: the smallest of the per-goal bounds
+                best = None
+                for i in range(len(goals)):
+                    bound = 0
+                    for d, to_goals in tables:
+                        here = d[index]
+                        if here != unreachable:
+                            bound = max(bound, abs(here - to_goals[i]))
+                    best = bound if best is None else min(best, bound)
+                return max(best, manhattan(index))
+
+        return heuristic
+
+
+def _layout(grid):
+    """Digest of a grid's openings."""
+    return blake2b(grid.openings, digest_size=16).digest()
+
+
+def _bfs_distances(grid, source, typecode, unreachable):
+    """Move count from source to every cell, layer by layer."""
+    openings, moves = grid.openings, grid.moves
+    distances = array(typecode, [unreachable]) * grid.size
+    distances[source] = 0
+    layer = [source]
+    depth = 0
+    while layer:
+        depth += 1
+        following = []
+        for cell in layer:
+            for offset in moves[openings[cell]]:
+                neighbor = cell + offset
+                if distances[neighbor] == unreachable:
+                    distances[neighbor] = depth
+                    following.append(neighbor)
+        layer = following
+    return distances
+
+
+def select_landmarks(maze_obj, count=8, cells=None):
+    """
+    Pick landmarks and compute their distance arrays.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        count (int): Number of landmarks to pick
+        cells: (row, col) landmark cells to use instead of picking them
+
+    Returns:
+        Landmarks: Distance table for astar_search and the greedy solver
+    """
+    grid = as_grid(maze_obj)
+    typecode = 'H' if grid.size < 0xFFFF else 'I'
+    unreachable = (1 << (8 * array(typecode).itemsize)) - 1
+
+    if cells is not None:
+        indices = [grid.index(cell) for cell in cells]
+        distances = [_bfs_distances(grid, i, typecode, unreachable) for i in indices]
+        return Landmarks(grid, indices, distances, unreachable)
+
+    # Farthest-point selection: start from the cell farthest from a corner,
+    # then keep adding the cell farthest from every landmark so far (cells
+    # no landmark reaches count as farthest, so other components get one)
+    def farthest(nearest):
+        return max(range(grid.size), key=nearest.__getitem__)
+
+    indices, distances = [], []
+    nearest = _bfs_distances(grid, 0, typecode, unreachable)
+    for _ in range(min(count, grid.size)):
+        landmark = farthest(nearest)
+        if indices and nearest[landmark] == 0:
+            break  # Every cell is already a landmark
+        d = _bfs_distances(grid, landmark, typecode, unreachable)
+        indices.append(landmark)
+        distances.append(d)
+        nearest = array(typecode, map(min, nearest, d)) if len(indices) > 1 else d
+    return Landmarks(grid, indices, distances, unreachable)
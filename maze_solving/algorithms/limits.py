@@ -0,0 +1,171 @@
+"""
+Search limits passed into the solvers.
+
+Every solver takes an optional ``limits`` argument. The search loop counts
+its expansions in a local integer and only calls back into the SearchLimits
+when that count reaches the next checkpoint: the expansion budget, or every
+``check_interval`` expansions while a deadline or cancellation token has to
+be polled. A search stopped by its limits returns the path to the cell it
+got closest to the goal, and the reason it stopped is left in
+``limits.status``.
+"""
+
+import time
+from collections import namedtuple
+
+from .stats import SearchStats
+
+# Why a search ended
+FOUND = 'found'          # A path to the goal was found
+NO_PATH = 'no_path'      # The search finished without reaching the goal
+BUDGET = 'budget'        # max_expansions was used up
+DEADLINE = 'deadline'    # The deadline passed
+CANCELLED = 'cancelled'  # The cancellation token was set
+
+# Statuses of a search cut short, whose path is only partial
+STOPPED = (BUDGET, DEADLINE, CANCELLED)
+
+SearchResult = namedtuple('SearchResult', [
+    'status',  # One of FOUND, NO_PATH, BUDGET, DEADLINE, CANCELLED
+    'path',    # Path dict, partial unless status is FOUND
+    'stats',   # SearchStats of the search
+])
+
+
+class SearchLimits:
+    """
+    Expansion budget, deadline and cancellation token of a search.
+
+    Example:
+        limits = SearchLimits(max_expansions=10000, timeout=0.05)
+        path = astar_search(m, limits=limits)
+        if limits.stopped:
+            ...  # path only leads towards the goal
+
+    The same object may be passed to several solves; each one starts the
+    budget and the timeout afresh.
+
+    Attributes:
+        max_expansions (int): Most cells a search may expand, or None
+        timeout (float): Seconds each search may run for, or None
+        deadline (float): time.monotonic() value by which every search must
+            stop, or None
+        cancel: Object with an ``is_set()`` method, such as a
+            threading.Event; the search stops soon after it is set
+        check_interval (int): Expansions between polls of the clock and the
+            cancellation token
+        status (str): Why the last search ended (see FOUND and the other
+            status constants), None while it runs
+    """
+
+    def __init__(self, max_expansions=None, timeout=None, deadline=None, cancel=None,
+                 check_interval=256):
+        """
+        Args:
+            max_expansions (int): Most cells a search may expand
+            timeout (float): Seconds each search may run for
+            deadline (float): time.monotonic() value to stop by
+            cancel: Cancellation token with an ``is_set()`` method
+            check_interval (int): Expansions between polls of the clock and
+                the cancellation token
+        """
+        self.max_expansions = max_expansions
+        self.timeout = timeout
+        self.deadline = deadline
+        self.cancel = cancel
+        self.check_interval = check_interval
+        self.status = None
+        self._stop_at = None
+
+    def __repr__(self):
+        return (f'SearchLimits(max_expansions={self.max_expansions}, '
+                f'timeout={self.timeout}, deadline={self.deadline}, '
+                f'status={self.status!r})')
+
+    @property
+    def stopped(self):
+        """Whether the last search was cut short by these limits."""
+        return self.status in STOPPED
+
+    def start(self):
+        """
+        Reset for a new search.
+
+        Returns:
+            int: Expansion count at which the search calls check() first;
+            always 0, so a search that is already cancelled does no work
+        """
+        self.status = None
+        self._stop_at = self.deadline
+        if self.timeout is not None:
+            until = time.monotonic() + self.timeout
+            self._stop_at = until if self._stop_at is None else min(until, self._stop_at)
+        return 0
+
+    def next_check(self, expanded):
+        """
+        Expansion count at which the search should call check() next.
+
+        Args:
+            expanded (int): Cells expanded so far
+        """
+        checkpoint = float('inf') if self.max_expansions is None else self.max_expansions
+        if self._stop_at is not None or self.cancel is not None:
+            checkpoint = min(checkpoint, expanded + self.check_interval)
+        return checkpoint
+
+    def check(self, expanded):
+        """
+        Decide whether the search has to stop before expanding another cell.
+
+        Args:
+            expanded (int): Cells expanded so far
+
+        Returns:
+            bool: True (with status set to the reason) if it has to stop
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            self.status = CANCELLED
+        elif self._stop_at is not None and time.monotonic() >= self._stop_at:
+            self.status = DEADLINE
+        elif self.max_expansions is not None and expanded >= self.max_expansions:
+            self.status = BUDGET
+        return self.status is not None
+
+    def finish(self, found):
+        """
+        Record how a search ended, unless it was already stopped.
+
+        Args:
+            found (bool): Whether a goal was reached
+        """
+        if self.status is None:
+            self.status = FOUND if found else NO_PATH
+
+
+def solve_within(solver, maze_obj, max_expansions=None, timeout=None, deadline=None,
+                 cancel=None, stats=None, **options):
+    """
+    Run a solver under limits and report how it ended.
+
+    Args:
+        solver (callable): Solver such as astar_search or a value of
+            algorithms.ALGORITHMS
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        max_expansions (int): Most cells the search may expand
+        timeout (float): Seconds the search may run for
+        deadline (float): time.monotonic() value to stop by
+        cancel: Cancellation token with an ``is_set()`` method
+        stats: SearchStats to add the search's counters to; a new one by
+            default
+        **options: Other solver arguments (start, goal, ...)
+
+    Returns:
+        SearchResult: Status, path (partial if the search was stopped) and
+        stats
+    """
+    limits = SearchLimits(max_expansions, timeout, deadline, cancel)
+    if stats is None:
+        stats = SearchStats()
+    path = solver(maze_obj, stats=stats, limits=limits, **options)
+    return SearchResult(limits.status, path, stats)
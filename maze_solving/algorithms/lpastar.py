@@ -0,0 +1,176 @@
+"""
+Lifelong Planning A* (LPA*) for mazes whose walls change between queries.
+
+LPA* keeps two cost estimates per cell: g, the cost found by the last
+search, and rhs, a one-step lookahead computed from the neighbours' g
+values. A cell is "inconsistent" when the two differ, and only inconsistent
+cells are queued. Opening or closing a wall only changes the rhs of the two
+cells it separates, so the next query repairs the shortest-path tree outward
+from the change instead of searching the whole maze again.
+
+Like astar_search, the planner counts moves: every move costs 1 and a grid's
+cost layer is ignored, which keeps the Manhattan heuristic admissible.
+"""
+
+from array import array
+from heapq import heappop, heappush
+
+from ..grid import Grid, as_grid
+from ..path import INDEX_TYPECODE, Path
+from .core import manhattan_heuristic
+from .stats import EXPAND, EXPLORE
+
+INFINITY = float('inf')
+
+
+class IncrementalPlanner:
+    """
+    Shortest-path planner that reuses its search between wall changes.
+
+    Example:
+        planner = IncrementalPlanner(m)
+        path = planner.path()
+        planner.set_wall((3, 4), 'E', is_open=False)
+        path = planner.path()  # Repairs only what the new wall affects
+
+    Attributes:
+        grid: maze_solving.grid.Grid being planned on (a private copy when
+            built from a pyamaze maze)
+        start (tuple): (row, col) start cell
+        goal (tuple): (row, col) goal cell
+    """
+
+    def __init__(self, maze_obj, start=None, goal=None):
+        """
+        Args:
+            maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the
+                maze; a Grid is planned on (and modified) in place
+            start (tuple): (row, col) start cell, bottom-right by default
+            goal (tuple): (row, col) goal cell, (1, 1) by default
+        """
+        self._maze_obj = None if isinstance(maze_obj, Grid) else maze_obj
+        self.grid = as_grid(maze_obj)
+        self.start = start or self.grid.default_start
+        self.goal = goal or self.grid.default_goal
+
+        size = self.grid.size
+        self._start = self.grid.index(self.start)
+        self._goal = self.grid.index(self.goal)
+        self._heuristic = manhattan_heuristic(self.grid, self._goal)
+        self._g = [INFINITY] * size
+        self._rhs = [INFINITY] * size
+        self._rhs[self._start] = 0
+        self._frontier = []
+        self._queued = {}  # Cell -> key of its live frontier entry
+        self._pushes = self._stale = 0  # Since the last path() call
+        self._push(self._start)
+
+    def _key(self, cell):
+        best = min(self._g[cell], self._rhs[cell])
+        return (best + self._heuristic(cell), best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self._queued[cell] = key
+        heappush(self._frontier, (key, cell))
+        self._pushes += 1
+
+    def _top_key(self):
+        frontier, queued = self._frontier, self._queued
+        while frontier and queued.get(frontier[0][1]) != frontier[0][0]:
+            heappop(frontier)  # Stale entry: cell re-keyed or made consistent
+            self._stale += 1
+        return frontier[0][0] if frontier else (INFINITY, INFINITY)
+
+    def _update(self, cell):
+        """Recompute rhs of a cell and queue it if it became inconsistent."""
+        if cell != self._start:
+            g = self._g
+            best = INFINITY
+            for neighbor in self.grid.neighbors(cell):
+                if g[neighbor] < best:
+                    best = g[neighbor]
+            self._rhs[cell] = best + 1
+        if self._g[cell] != self._rhs[cell]:
+            self._push(cell)
+        else:
+            self._queued.pop(cell, None)
+
+    def _compute(self, events):
+        g, rhs, goal = self._g, self._rhs, self._goal
+        grid = self.grid
+        expanded = explored = 0
+        peak = len(self._frontier)
+        while self._top_key() < self._key(goal) or rhs[goal] != g[goal]:
+            peak = max(peak, len(self._frontier))
+            _, cell = heappop(self._frontier)
+            del self._queued[cell]
+            expanded += 1
+            if events is not None:
+                events.append((EXPAND, cell))
+            neighbors = grid.neighbors(cell)
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]  # Cost went down: settle it
+            else:
+                g[cell] = INFINITY  # Cost went up: re-derive it and its successors
+                self._update(cell)
+            for neighbor in neighbors:
+                explored += 1
+                if events is not None:
+                    events.append((EXPLORE, neighbor))
+                self._update(neighbor)
+        return expanded, explored, max(peak, len(self._frontier))
+
+    def set_wall(self, cell, direction, is_open):
+        """
+        Apply a wall change event.
+
+        Args:
+            cell (tuple): (row, col) cell whose side changes
+            direction (str): Side of the cell ('E', 'W', 'N', 'S')
+            is_open (bool): True if the wall was removed, False if built
+        """
+        neighbor = self.grid.set_open(cell, direction, is_open)
+        if self._maze_obj is not None:
+            # Keep the pyamaze maze in step so it can still be drawn
+            for c in (cell, neighbor):
+                sides = self._maze_obj.maze_map[c]
+                for d in 'EWNS':
+                    sides[d] = 1 if self.grid.is_open(c, d) else 0
+        self._update(self.grid.index(cell))
+        self._update(self.grid.index(neighbor))
+
+    def path(self, stats=None):
+        """
+        Bring the search up to date and return the current shortest path.
+
+        Args:
+            stats: SearchStats to add the counters of this repair to, or
+                None. A cell can be expanded twice in one repair (once to
+                raise its cost, once to settle it) and explored from each
+                neighbour, so here expanded and explored count events rather
+                than distinct cells.
+
+        Returns:
+            Path: Path from start to goal, empty if the goal is unreachable
+        """
+        events = [] if stats is not None and stats.detailed else None
+        expanded, explored, peak = self._compute(events)
+        if stats is not None:
+            stats.record(self.grid, expanded, explored, self._pushes, self._stale,
+                         peak, events)
+        self._pushes = self._stale = 0
+
+        grid, g = self.grid, self._g
+        if g[self._goal] == INFINITY:
+            return Path(grid.cols)
+        path = array(INDEX_TYPECODE, [self._goal])
+        cell = self._goal
+        while cell != self._start:
+            # Step back to the neighbour the cell's cost came from, which is
+            # one move closer to the start
+            previous = min(grid.neighbors(cell), key=g.__getitem__)
+            path.append(previous)
+            cell = previous
+        path.reverse()
+        return Path(grid.cols, path)
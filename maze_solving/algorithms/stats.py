@@ -0,0 +1,90 @@
+"""
+Search instrumentation passed into the solvers.
+
+Every solver takes an optional ``stats`` argument. Without one nothing is
+recorded beyond a few integer counters local to the search loop. With a
+SearchStats the solver adds its counters to it when it finishes; in detailed
+mode it also logs which cells it expanded and explored, and with ``trace``
+the order it did so in.
+"""
+
+# Trace event kinds
+EXPAND = 'expand'    # Cell taken off the frontier and processed
+EXPLORE = 'explore'  # Cell seen (pushed on the frontier) from a neighbour
+
+
+class SearchStats:
+    """
+    Counters of one or more solver runs.
+
+    Example:
+        stats = SearchStats()
+        path = astar_search(m, stats=stats)
+        stats.expanded, stats.heap_pushes
+
+    Counts are added up when the same object is passed to several solves;
+    frontier_peak keeps the largest peak.
+
+    Attributes:
+        expanded (int): Distinct cells expanded
+        explored (int): Distinct cells seen
+        heap_pushes (int): Entries pushed on the frontier
+        stale_pops (int): Outdated frontier entries popped and skipped
+        frontier_peak (int): Largest frontier size (deepest branch for the
+            depth-first searches)
+        expanded_cells (set): (row, col) cells expanded, detailed mode only
+        explored_cells (set): (row, col) cells seen, detailed mode only
+        trace (list): (EXPAND or EXPLORE, (row, col)) events in the order
+            they happened, with trace=True only
+    """
+
+    def __init__(self, detailed=False, trace=False):
+        """
+        Args:
+            detailed (bool): Also record the sets of expanded and explored
+                cells
+            trace (bool): Also record every expand/explore event in order
+                (implies detailed)
+        """
+        self.detailed = detailed or trace
+        self.expanded = 0
+        self.explored = 0
+        self.heap_pushes = 0
+        self.stale_pops = 0
+        self.frontier_peak = 0
+        self.expanded_cells = set() if self.detailed else None
+        self.explored_cells = set() if self.detailed else None
+        self.trace = [] if trace else None
+
+    def __repr__(self):
+        return (f'SearchStats(expanded={self.expanded}, explored={self.explored}, '
+                f'heap_pushes={self.heap_pushes}, stale_pops={self.stale_pops}, '
+                f'frontier_peak={self.frontier_peak})')
+
+    def record(self, grid, expanded, explored, heap_pushes=0, stale_pops=0,
+               frontier_peak=0, events=None):
+        """
+        Add the counters of a finished search (called by the solvers).
+
+        Args:
+            grid: maze_solving.grid.Grid that was searched
+            expanded (int): Distinct cells expanded
+            explored (int): Distinct cells seen
+            heap_pushes (int): Entries pushed on the frontier
+            stale_pops (int): Outdated frontier entries skipped
+            frontier_peak (int): Largest frontier size
+            events (list): (EXPAND or EXPLORE, flat index) events, collected
+                by the search only when detailed is set
+        """
+        self.expanded += expanded
+        self.explored += explored
+        self.heap_pushes += heap_pushes
+        self.stale_pops += stale_pops
+        self.frontier_peak = max(self.frontier_peak, frontier_peak)
+        if events is None or not self.detailed:
+            return
+        cell = grid.cell
+        for kind, index in events:
+            (self.expanded_cells if kind == EXPAND else self.explored_cells).add(cell(index))
+        if self.trace is not None:
+            self.trace.extend((kind, cell(index)) for kind, index in events)
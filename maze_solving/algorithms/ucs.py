@@ -2,68 +2,95 @@
 Uniform Cost Search (UCS) Algorithm implementation for maze solving.
 """
 
-from queue import PriorityQueue
+from ..grid import as_grid
+from .bidirectional import bidirectional_uniform_cost_search
+from .core import best_first_steps, goal_paths, resolve_endpoints, run_steps
+from .dial import bucket_steps, choose_frontier
+from .junctions import compressed_search
 
-def uniform_cost_search(maze_obj):
+def uniform_cost_search(maze_obj, start=None, goal=None, all_goals=False, bidirectional=False,
+                        stats=None, limits=None, compress=False, frontier='auto'):
     """
     Uniform Cost Search algorithm implementation.
+
+    Moves cost 1 unless the maze has a per-cell 'cost' (the cost of leaving
+    that cell).
     
     Args:
-        maze_obj: pyamaze.maze object representing the maze
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells; the maze's goal
+            (pyamaze's ``_goal``) or (1, 1) by default
+        all_goals (bool): With several goals, search on until every goal is
+            reached and return a path to each instead of stopping at the
+            nearest one
+        bidirectional (bool): Search from both ends at once and meet in the
+            middle (see bidirectional_uniform_cost_search); single goal only
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits bounding the search, or None; a stopped search
+            returns the path to the cell it got closest to the goal
+        compress: JunctionGraph from junction_graph() to search instead of
+            the cells, built once and reused across queries; True builds one
+            for this query only, which costs more than it saves (see
+            compressed_search). Not with all_goals
+        frontier (str): 'heap' for a binary heap, 'buckets' for Dial's
+            bucket queue (whole cell costs up to dial.MAX_BUCKET_COST only),
+            or 'auto' to use buckets whenever the costs allow
         
     Returns:
-        dict: Path from start to goal
+        Path: Path from start to goal ({goal: path} with all_goals)
     """
-    start = (maze_obj.rows, maze_obj.cols)
-    goal = (1, 1)
-
-    # Initialize tracking sets
-    maze_obj.expanded_nodes = set()  # Nodes we've processed
-    maze_obj.explored_cells = set()  # Cells we've seen
-    maze_obj.explored_cells.add(start)  # Start is immediately seen
+    if compress:
+        if all_goals or bidirectional:
+            raise ValueError('compress cannot be combined with all_goals or bidirectional')
+        return compressed_search(maze_obj, start, goal, use_cost=True, stats=stats,
+                                 limits=limits, graph=None if compress is True else compress)
+    if bidirectional:
+        return bidirectional_uniform_cost_search(
+            maze_obj, start=start, goal=goal, stats=stats, limits=limits
+        )
 
-    # Priority queue ordered by cumulative cost
-    frontier = PriorityQueue()
-    frontier.put((0, start))  # (cost, cell)
-    
-    # Track paths and costs
-    came_from = {}
-    cost_so_far = {start: 0}
+    return run_steps(
+        uniform_cost_steps(maze_obj, start, goal, all_goals, stats, limits,
+                           frontier=frontier, emit=False)
+    )
 
-    while not frontier.empty():
-        current_cost, current = frontier.get()
-        maze_obj.expanded_nodes.add(current)  # Mark as expanded when we process it
-        
-        if current == goal:
-            break
+def uniform_cost_steps(maze_obj, start=None, goal=None, all_goals=False, stats=None,
+                       limits=None, frontier='auto', emit=True):
+    """
+    Uniform cost search as a generator of search steps (f is the path cost).
 
-        # Check each possible direction
-        for direction in 'ESNW':
-            if maze_obj.maze_map[current][direction]:
-                if direction == 'E':
-                    neighbor = (current[0], current[1]+1)
-                elif direction == 'W':
-                    neighbor = (current[0], current[1]-1)
-                elif direction == 'N':
-                    neighbor = (current[0]-1, current[1])
-                elif direction == 'S':
-                    neighbor = (current[0]+1, current[1])
-                
-                # Get the cost of moving to this neighbor
-                move_cost = maze_obj.maze_map[current].get('cost', 1)  # Default to 1 if no cost specified
-                new_cost = cost_so_far[current] + move_cost
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or a list of goal cells
+        all_goals (bool): Return a path to every goal
+        stats: SearchStats to add the search's counters to, or None
+        limits: SearchLimits to stop the search early by, or None
+        frontier (str): 'auto', 'heap' or 'buckets' (see uniform_cost_search)
+        emit (bool): Yield events; False just runs the search
 
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    maze_obj.explored_cells.add(neighbor)  # Mark as explored when we first see it
-                    cost_so_far[neighbor] = new_cost
-                    frontier.put((new_cost, neighbor))
-                    came_from[neighbor] = current
+    Yields:
+        SearchEvent: One per expanded cell
 
-    # Reconstruct path
-    path = {}
-    current = goal
-    while current != start:
-        path[came_from[current]] = current
-        current = came_from[current]
+    Returns:
+        Path: Path from start to goal ({goal: path} with all_goals), as the
+        generator's return value (see SearchSteps)
+    """
+    grid = as_grid(maze_obj)
+    start, goals = resolve_endpoints(maze_obj, grid, start, goal)
 
-    return path
+    # Ordered by cumulative cost only
+    max_step = choose_frontier(grid, frontier, use_cost=True)
+    if max_step is not None:
+        came_from, reached = yield from bucket_steps(
+            grid, start, goals, max_step, use_cost=True, all_goals=all_goals, stats=stats,
+            limits=limits, emit=emit
+        )
+    else:
+        came_from, reached = yield from best_first_steps(
+            grid, start, goals, use_cost=True, all_goals=all_goals, stats=stats,
+            limits=limits, emit=emit
+        )
+    return goal_paths(grid, came_from, start, goals, reached, all_goals,
+                      partial=limits is not None and limits.stopped)
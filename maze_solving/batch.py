@@ -0,0 +1,129 @@
+"""
+Batch solving of many mazes across a process pool.
+
+Every (maze, algorithm) pair becomes one job. Mazes are converted to a Grid
+in the parent process, so a job pickles down to the grid's raw byte buffers
+plus an algorithm name instead of a pyamaze object with its dict-of-dicts
+maze_map. Results are yielded as soon as each job finishes, and only a
+bounded number of jobs are in flight at once, so the input can be a lazy
+iterable of tens of thousands of mazes.
+"""
+
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .algorithms import ALGORITHMS, SearchStats
+from .grid import as_grid
+
+BatchResult = namedtuple('BatchResult', [
+    'maze_index',      # Position of the maze in the input
+    'algorithm',       # Algorithm name, a key of algorithms.ALGORITHMS
+    'path_length',     # Cells on the path including start, 0 if not found
+    'expanded_nodes',  # Number of nodes the solver expanded
+    'explored_cells',  # Number of cells the solver saw
+    'time',            # Seconds spent in the solver
+    'path',            # Path dict, or None unless paths were requested
+])
+
+
+def solve_job(maze_index, grid, algorithm, return_path=False, start=None, goal=None):
+    """
+    Solve one maze with one algorithm (the unit of work of solve_batch).
+
+    Args:
+        maze_index (int): Position of the maze in the batch
+        grid: maze_solving.grid.Grid to solve
+        algorithm (str): Name of the algorithm in algorithms.ALGORITHMS
+        return_path (bool): Include the path dict in the result
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal: (row, col) goal cell or list of goal cells, (1, 1) by default
+
+    Returns:
+        BatchResult: Metrics of the solve
+    """
+    solver = ALGORITHMS[algorithm]
+    stats = SearchStats()
+    start_time = time.perf_counter()
+    path = solver(grid, start=start, goal=goal, stats=stats)
+    elapsed = time.perf_counter() - start_time
+    # A start already at the goal is a one-cell path, not a missing one
+    return BatchResult(
+        maze_index, algorithm, len(path.cells),
+        stats.expanded, stats.explored, elapsed,
+        path if return_path else None
+    )
+
+
+def solve_batch(mazes, algorithms, workers=None, return_paths=False, max_pending=None):
+    """
+    Solve every maze with every algorithm, in parallel, streaming results.
+
+    Args:
+        mazes: Iterable of pyamaze.maze or maze_solving.grid.Grid objects
+        algorithms: Names of algorithms from algorithms.ALGORITHMS
+        workers (int): Number of worker processes; None uses every CPU and
+            1 solves in the calling process without a pool
+        return_paths (bool): Include each path dict in the results
+        max_pending (int): Most jobs submitted but not yet finished; defaults
+            to four per worker
+
+    Returns:
+        iterator: One BatchResult per (maze, algorithm) pair, in completion
+        order
+    """
+    algorithms = list(algorithms)
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm: {name}')
+
+    jobs = (
+        (index, grid, name)
+        for index, grid in enumerate(as_grid(m) for m in mazes)
+        for name in algorithms
+    )
+    return solve_jobs(jobs, workers, return_paths, max_pending)
+
+
+def solve_jobs(jobs, workers=None, return_paths=False, max_pending=None):
+    """
+    Solve individual (maze_index, maze, algorithm) jobs, in parallel,
+    streaming results; for callers that only need some pairs of a batch.
+
+    Args:
+        jobs: Iterable of (maze_index, maze, algorithm name) tuples, where
+            the maze is a pyamaze.maze or maze_solving.grid.Grid
+        workers (int): Number of worker processes, as in solve_batch
+        return_paths (bool): Include each path dict in the results
+        max_pending (int): Most jobs submitted but not yet finished
+
+    Returns:
+        iterator: One BatchResult per job, in completion order
+    """
+    return _stream(((index, as_grid(m), name) for index, m, name in jobs),
+                   workers, return_paths, max_pending)
+
+
+def _stream(jobs, workers, return_paths, max_pending):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for index, grid, name in jobs:
+            yield solve_job(index, grid, name, return_paths)
+        return
+
+    if max_pending is None:
+        max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for index, grid, name in jobs:
+            pending.add(pool.submit(solve_job, index, grid, name, return_paths))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,391 @@
+"""
+Reproducible benchmark suite for the maze solvers.
+
+Every maze comes from the seeded generator, so two runs with the same
+options solve exactly the same corpus. Each (algorithm, maze) pair is solved
+``warmup`` times untimed, then ``repeats`` times timed with perf_counter_ns
+(the garbage collector is paused during a timed solve, as timeit does). One
+extra run under tracemalloc measures peak memory; it is kept apart from the
+timed runs because tracing slows allocation down. Timings of all mazes in a
+(algorithm, size, loop percent) configuration are pooled and reported as
+median and interquartile range. The deepening searches can take exponential
+time on mazes with loops, so each of their mazes is first solved under an
+expansion budget; a configuration with a maze over budget is reported as
+skipped instead of timed. The report also gives the time to import
+the solvers in a fresh interpreter, and which heavy dependencies that
+import pulled in (there should be none).
+
+Usage:
+    python -m maze_solving.benchmark --sizes 50 200 --output bench.json
+    python -m maze_solving.benchmark --sizes 50 200 --baseline bench.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .algorithms import ALGORITHMS, SearchLimits, SearchStats
+from .generator import generate_maze
+
+DEFAULT_SIZES = (50, 200, 1000, 2000)
+DEFAULT_LOOP_PERCENTS = (0, 20, 100)
+
+# Largest maze side each algorithm is run on; the depth-first searches
+# revisit cells once per deepening pass and would not finish on big mazes
+SIZE_LIMITS = {'ids': 20, 'ida': 40}
+
+# Expansions per maze cell the algorithms in SIZE_LIMITS may use on a maze
+# before their configuration is skipped; even within the size limit, loops
+# can make a deepening search run for minutes
+PROBE_BUDGET = 1000
+
+# Packages the solvers must not load; only visualization code needs them
+HEAVY_MODULES = ('pyamaze', 'tkinter', 'numpy', 'matplotlib', 'seaborn')
+
+# Run in a fresh interpreter to time one import
+_IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter_ns()
+import {module}
+elapsed = time.perf_counter_ns() - start
+print(json.dumps([elapsed, [m for m in {heavy!r} if m in sys.modules]]))
+'''
+
+
+def build_corpus(sizes=DEFAULT_SIZES, loop_percents=DEFAULT_LOOP_PERCENTS,
+                 mazes=3, seed=0):
+    """
+    Generate the seeded mazes of a benchmark run.
+
+    Args:
+        sizes: Maze sides (each maze is size x size)
+        loop_percents: Loop percentages passed to the generator
+        mazes (int): Mazes per (size, loop percent) configuration
+        seed: Base seed; the same seed always gives the same corpus
+
+    Returns:
+        list: (size, loop_percent, grid) tuples
+    """
+    return [
+        (size, loop_percent,
+         generate_maze(size, size, loop_percent=loop_percent,
+                       seed=f'{seed}-{size}-{loop_percent}-{i}'))
+        for size in sizes
+        for loop_percent in loop_percents
+        for i in range(mazes)
+    ]
+
+
+def time_solve(solver, grid, repeats=5, warmup=1):
+    """
+    Time a solver on one maze.
+
+    Args:
+        solver (callable): Solver from algorithms.ALGORITHMS
+        grid: maze_solving.grid.Grid to solve
+        repeats (int): Timed runs
+        warmup (int): Untimed runs before timing
+
+    Returns:
+        list: Nanoseconds taken by each timed run
+    """
+    for _ in range(warmup):
+        solver(grid)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            solver(grid)
+            samples.append(time.perf_counter_ns() - start)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def peak_memory(solver, grid):
+    """
+    Peak bytes allocated by one solve, measured with tracemalloc.
+
+    Args:
+        solver (callable): Solver from algorithms.ALGORITHMS
+        grid: maze_solving.grid.Grid to solve
+
+    Returns:
+        int: Peak traced memory in bytes
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        solver(grid)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def measure_startup(module='maze_solving.algorithms', runs=5):
+    """
+    Time importing a module in fresh interpreters.
+
+    Args:
+        module (str): Module to import
+        runs (int): Interpreters to start; the median import time is kept
+
+    Returns:
+        dict: module, median_ns and min_ns of the import, and
+        heavy_modules, the names from HEAVY_MODULES the import loaded
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+    script = _IMPORT_SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+    samples, heavy = [], set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                                capture_output=True, text=True).stdout
+        elapsed, loaded = json.loads(output)
+        samples.append(elapsed)
+        heavy.update(loaded)
+    return {'module': module, 'median_ns': statistics.median(samples),
+            'min_ns': min(samples),
+            'heavy_modules': [name for name in HEAVY_MODULES if name in heavy]}
+
+
+def summarize(samples):
+    """
+    Median and interquartile range of a list of samples.
+
+    Returns:
+        dict: median, q1, q3 and iqr
+    """
+    if len(samples) == 1:
+        q1 = median = q3 = samples[0]
+    else:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    return {'median': median, 'q1': q1, 'q3': q3, 'iqr': q3 - q1}
+
+
+def run_benchmark(algorithms=None, sizes=DEFAULT_SIZES,
+                  loop_percents=DEFAULT_LOOP_PERCENTS, mazes=3, repeats=5,
+                  warmup=1, seed=0, measure_memory=True, startup_runs=5, progress=None):
+    """
+    Benchmark solvers over a seeded corpus.
+
+    Args:
+        algorithms: Names from algorithms.ALGORITHMS, all of them by default
+        sizes: Maze sides to benchmark
+        loop_percents: Loop percentages to benchmark
+        mazes (int): Mazes per (size, loop percent) configuration
+        repeats (int): Timed runs per maze
+        warmup (int): Untimed runs per maze before timing
+        seed: Base seed of the corpus
+        measure_memory (bool): Also record peak memory with tracemalloc
+        startup_runs (int): Fresh interpreters to time the solvers' import
+            in (see measure_startup); 0 to skip
+        progress (callable): Called with a message before each configuration
+
+    Returns:
+        dict: {'meta': run settings and machine, 'startup': import timing
+        from measure_startup or None, 'results': one entry per
+        (algorithm, size, loop_percent) with timing statistics in
+        nanoseconds, peak memory in bytes and the search counters,
+        'skipped': the algorithm, size and loop_percent of configurations
+        that went over PROBE_BUDGET}
+    """
+    algorithms = list(algorithms or ALGORITHMS)
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm: {name}')
+
+    startup = measure_startup(runs=startup_runs) if startup_runs else None
+    corpus = build_corpus(sizes, loop_percents, mazes, seed)
+    results, skipped = [], []
+    for name in algorithms:
+        solver = ALGORITHMS[name]
+        for size in sizes:
+            if size > SIZE_LIMITS.get(name, size):
+                continue
+            for loop_percent in loop_percents:
+                if progress is not None:
+                    progress(f'{name} {size}x{size} loops={loop_percent}%')
+                samples, peaks = [], []
+                stats = SearchStats()
+                path_length = 0
+                over_budget = False
+                for s, lp, grid in corpus:
+                    if (s, lp) != (size, loop_percent):
+                        continue
+                    if name in SIZE_LIMITS:
+                        limits = SearchLimits(max_expansions=PROBE_BUDGET * grid.size)
+                        solver(grid, limits=limits)
+                        if limits.stopped:
+                            over_budget = True
+                            break
+                    samples.extend(time_solve(solver, grid, repeats, warmup))
+                    if measure_memory:
+                        peaks.append(peak_memory(solver, grid))
+                    path_length += len(solver(grid, stats=stats))
+                if over_budget:
+                    skipped.append({'algorithm': name, 'size': size,
+                                    'loop_percent': loop_percent})
+                    continue
+                entry = {
+                    'algorithm': name,
+                    'size': size,
+                    'loop_percent': loop_percent,
+                    'mazes': mazes,
+                    'samples': len(samples),
+                    'expanded': stats.expanded / mazes,
+                    'explored': stats.explored / mazes,
+                    'heap_pushes': stats.heap_pushes / mazes,
+                    'path_length': path_length / mazes,
+                    'peak_bytes': max(peaks) if peaks else None,
+                }
+                entry.update({f'{key}_ns': value for key, value in summarize(samples).items()})
+                results.append(entry)
+
+    meta = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'sizes': list(sizes),
+        'loop_percents': list(loop_percents),
+        'mazes': mazes,
+        'repeats': repeats,
+        'warmup': warmup,
+        'seed': seed,
+    }
+    return {'meta': meta, 'startup': startup, 'results': results, 'skipped': skipped}
+
+
+def compare(current, baseline, threshold=0.1):
+    """
+    Find configurations that got slower than a saved baseline.
+
+    A configuration regresses when its median is more than ``threshold``
+    above the baseline median and the two interquartile ranges do not
+    overlap, so ordinary run-to-run noise is not reported.
+
+    Args:
+        current (dict): Output of run_benchmark
+        baseline (dict): Earlier output of run_benchmark
+        threshold (float): Allowed relative slowdown of the median
+
+    Returns:
+        list: One dict per regression with the algorithm, size,
+        loop_percent, both medians and their ratio
+    """
+    def key(entry):
+        return entry['algorithm'], entry['size'], entry['loop_percent']
+
+    before = {key(entry): entry for entry in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        old = before.get(key(entry))
+        if old is None or not old['median_ns']:
+            continue
+        ratio = entry['median_ns'] / old['median_ns']
+        if ratio > 1 + threshold and entry['q1_ns'] > old['q3_ns']:
+            regressions.append({
+                'algorithm': entry['algorithm'],
+                'size': entry['size'],
+                'loop_percent': entry['loop_percent'],
+                'baseline_median_ns': old['median_ns'],
+                'median_ns': entry['median_ns'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def format_report(report):
+    """Render benchmark results as a fixed-width table."""
+    lines = [
+        f"{'Algorithm':<10} {'Size':>6} {'Loops':>6} {'Median ms':>11} "
+        f"{'IQR ms':>9} {'Peak KiB':>10} {'Expanded':>10}",
+        '-' * 68,
+    ]
+    for entry in report['results']:
+        peak = entry['peak_bytes']
+        lines.append(
+            f"{entry['algorithm']:<10} {entry['size']:>6} {entry['loop_percent']:>5}% "
+            f"{entry['median_ns'] / 1e6:>11.3f} {entry['iqr_ns'] / 1e6:>9.3f} "
+            f"{'-' if peak is None else f'{peak / 1024:.0f}':>10} {entry['expanded']:>10.0f}"
+        )
+    for entry in report.get('skipped', ()):
+        lines.append(f"{entry['algorithm']:<10} {entry['size']:>6} {entry['loop_percent']:>5}% "
+                     f"{'skipped (over the expansion budget)':>43}")
+    startup = report.get('startup')
+    if startup:
+        heavy = ', '.join(startup['heavy_modules']) or 'none'
+        lines.append(f"\nimport {startup['module']}: {startup['median_ns'] / 1e6:.1f} ms "
+                     f"median (heavy modules loaded: {heavy})")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Command-line entry point; returns 1 if a regression was found."""
+    parser = argparse.ArgumentParser(description='Benchmark the maze solvers.')
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(ALGORITHMS),
+                        help='Algorithms to run (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES),
+                        help='Maze sides (default: %(default)s)')
+    parser.add_argument('--loops', nargs='+', type=int, default=list(DEFAULT_LOOP_PERCENTS),
+                        help='Loop percentages (default: %(default)s)')
+    parser.add_argument('--mazes', type=int, default=3,
+                        help='Mazes per size and loop percentage')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per maze')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs per maze')
+    parser.add_argument('--seed', default='0', help='Corpus seed')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the tracemalloc peak memory run')
+    parser.add_argument('--startup-runs', type=int, default=5,
+                        help='Fresh interpreters to time the import in (0 to skip)')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='Compare against results saved with --output')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Allowed median slowdown against the baseline')
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        args.algorithms, args.sizes, args.loops, args.mazes, args.repeats,
+        args.warmup, args.seed, measure_memory=not args.no_memory,
+        startup_runs=args.startup_runs,
+        progress=lambda message: print(message, file=sys.stderr)
+    )
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['algorithm']} {r['size']}x{r['size']} "
+                  f"loops={r['loop_percent']}%: {r['ratio']:.2f}x slower")
+        if regressions:
+            return 1
+        print('No regressions against the baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
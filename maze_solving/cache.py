@@ -0,0 +1,212 @@
+"""
+Solution cache in front of the solver functions.
+
+Solutions are keyed by a fingerprint of the maze layout (dimensions, wall
+flags and cost layer), the endpoints and the algorithm, so the same maze
+solved again anywhere in the process is answered without searching. Paths
+are stored as packed arrays of flat cell indices and entries are evicted in
+least-recently-used order once their estimated size exceeds the memory
+budget. An optional SQLite file keeps solutions across restarts.
+"""
+
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from hashlib import blake2b
+
+from .algorithms import ALGORITHMS, SearchStats
+from .grid import as_grid
+from .path import Path
+
+CachedSolution = namedtuple('CachedSolution', [
+    'path',            # Path dict from start to goal
+    'expanded_nodes',  # Number of nodes the solver expanded
+    'explored_cells',  # Number of cells the solver saw
+])
+
+# Rough per-entry bookkeeping cost (key, tuple, OrderedDict slot)
+_ENTRY_OVERHEAD = 200
+
+
+def fingerprint(maze_obj, algorithm, start=None, goal=None, **options):
+    """
+    Hash a maze layout, endpoints and algorithm into a cache key.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the maze
+        algorithm (str): Name of the algorithm in algorithms.ALGORITHMS
+        start (tuple): (row, col) start cell, bottom-right by default
+        goal (tuple): (row, col) goal cell, (1, 1) by default
+        **options: Extra solver options that change the answer
+
+    Returns:
+        str: Hex digest identifying the query
+    """
+    grid = as_grid(maze_obj)
+    start = start or grid.default_start
+    goal = goal or grid.default_goal
+    digest = blake2b(digest_size=16)
+    digest.update(repr((grid.rows, grid.cols, start, goal, algorithm,
+                        sorted(options.items()))).encode())
+    digest.update(grid.openings)
+    if grid.cost is not None:
+        digest.update(bytes(grid.cost))
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+    LRU cache of solved mazes with an optional on-disk store.
+
+    Example:
+        cache = SolutionCache(max_bytes=32 * 2**20, path='solutions.db')
+        solution = cache.solve(m, 'astar')
+        solution.path, solution.expanded_nodes
+
+    Attributes:
+        max_bytes (int): Memory budget for cached entries
+        hits (int): Lookups answered from memory or disk
+        misses (int): Lookups that ran the solver
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, path=None):
+        """
+        Args:
+            max_bytes (int): Memory budget for cached entries
+            path (str): SQLite file to persist solutions in, or None to keep
+                them in memory only
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (cells, expanded, explored)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS solutions ('
+                'key TEXT PRIMARY KEY, cells BLOB, expanded INTEGER, explored INTEGER)'
+            )
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def size_bytes(self):
+        """Estimated memory held by cached entries."""
+        return self._bytes
+
+    def get(self, key):
+        """
+        Look up a fingerprint.
+
+        Returns:
+            tuple: (cells, expanded, explored) where cells is an array of flat
+            indices from start to goal, or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                'SELECT cells, expanded, explored FROM solutions WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            cells = array('I')
+            cells.frombytes(row[0])
+            entry = (cells, row[1], row[2])
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, cells, expanded, explored):
+        """
+        Store a solution under a fingerprint.
+
+        Args:
+            key (str): Fingerprint from fingerprint()
+            cells: Iterable of flat indices from start to goal (empty if no
+                path exists)
+            expanded (int): Number of nodes the solver expanded
+            explored (int): Number of cells the solver saw
+        """
+        entry = (array('I', cells), expanded, explored)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?)',
+                    (key, entry[0].tobytes(), expanded, explored)
+                )
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= self._entry_size(key, old)
+        self._entries[key] = entry
+        self._bytes += self._entry_size(key, entry)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(old_key, old_entry)
+
+    @staticmethod
+    def _entry_size(key, entry):
+        return len(key) + entry[0].itemsize * len(entry[0]) + _ENTRY_OVERHEAD
+
+    def solve(self, maze_obj, algorithm='astar', start=None, goal=None):
+        """
+        Solve a maze through the cache.
+
+        Args:
+            maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the
+                maze
+            algorithm (str): Name of the algorithm in algorithms.ALGORITHMS
+            start (tuple): (row, col) start cell, bottom-right by default
+            goal: (row, col) goal cell or list of goal cells, the maze's goal
+                or (1, 1) by default
+
+        Returns:
+            CachedSolution: Path and the metrics of the search that found it
+        """
+        grid = as_grid(maze_obj)
+        start = start or grid.default_start
+        goal = goal or getattr(maze_obj, '_goal', None) or grid.default_goal
+        key = fingerprint(grid, algorithm, start, goal)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            cells, expanded, explored = entry
+        else:
+            self.misses += 1
+            stats = SearchStats()
+            path = ALGORITHMS[algorithm](grid, start=start, goal=goal, stats=stats)
+            expanded, explored = stats.expanded, stats.explored
+            cells = path.cells
+            self.put(key, cells, expanded, explored)
+        return CachedSolution(Path(grid.cols, cells), expanded, explored)
+
+    def clear(self):
+        """Drop every cached entry, on disk too."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.execute('DELETE FROM solutions')
+                self._db.commit()
+
+    def close(self):
+        """Close the on-disk store."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
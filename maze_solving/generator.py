@@ -0,0 +1,176 @@
+"""
+Headless, seedable maze generator writing straight into a Grid.
+
+The carve follows pyamaze's ``CreateMaze``: a randomised depth-first
+(recursive backtracker) carve starting from the goal cell. Loops are added
+differently. When ``loop_percent`` is non-zero, ``cells / 3 * loop_percent /
+100`` extra walls are knocked out, drawn from a single pool of every cell in
+random order, skipping removals that pyamaze's isCyclic check rejects.
+pyamaze instead splits the quota in two: ``route / 3 * loopPercent / 100``
+walls around the cells of the carved start-goal route and the same share of
+the remaining cells from the rest. (Its walk along that route stops at once,
+so in practice it is one wall at the bottom-right cell plus the rest.) The
+total number of walls removed is the same, but the layouts differ and are
+not a drop-in for a given pyamaze maze. Walls are carved straight
+into the grid's byte-per-cell openings, about a million cells every two
+seconds. Nothing here imports pyamaze or Tkinter; to_pyamaze and
+write_pyamaze_csv convert a generated grid when it needs to be drawn.
+"""
+
+import csv
+import random
+from array import array
+
+from .grid import EAST, NORTH, SOUTH, WEST, Grid
+
+
+def generate_maze(rows, cols, loop_percent=0, seed=None, goal=(1, 1)):
+    """
+    Generate a random maze.
+
+    Args:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        loop_percent (int): 0 for a perfect maze (exactly one path between
+            any two cells); higher values knock out cells / 3 *
+            loop_percent / 100 extra walls (see the module docstring for
+            how this differs from pyamaze)
+        seed: Seed for the random generator, or None for a fresh maze
+        goal (tuple): (row, col) cell the carve starts from
+
+    Returns:
+        Grid: The generated maze
+    """
+    rng = random.Random(seed)
+    grid = Grid(rows, cols)
+    openings = grid.openings
+    size = grid.size
+
+    visited = bytearray(size)
+    start = grid.index(goal)
+    visited[start] = 1
+    stack = [start]
+    randrange = rng.randrange
+    last_col = cols - 1
+
+    while stack:
+        cell = stack[-1]
+        col = cell % cols
+        options = []
+        if col < last_col and not visited[cell + 1]:
+            options.append((cell + 1, EAST, WEST))
+        if col > 0 and not visited[cell - 1]:
+            options.append((cell - 1, WEST, EAST))
+        if cell + cols < size and not visited[cell + cols]:
+            options.append((cell + cols, SOUTH, NORTH))
+        if cell >= cols and not visited[cell - cols]:
+            options.append((cell - cols, NORTH, SOUTH))
+        if not options:
+            stack.pop()
+            continue
+        nxt, side, back = options[randrange(len(options))]
+        openings[cell] |= side
+        openings[nxt] |= back
+        visited[nxt] = 1
+        stack.append(nxt)
+
+    if loop_percent:
+        _add_loops(grid, loop_percent, rng)
+    return grid
+
+
+def _add_loops(grid, loop_percent, rng):
+    """Knock out size / 3 * loop_percent / 100 walls, one pool for all cells."""
+    openings, cols, size = grid.openings, grid.cols, grid.size
+    cells = array('l', range(size))
+    target = size / 3 * loop_percent / 100
+    removed = 0
+    # Lazy Fisher-Yates: only the prefix that is actually used is shuffled
+    for i in range(size):
+        if removed >= target:
+            break
+        j = rng.randrange(i, size)
+        cells[i], cells[j] = cells[j], cells[i]
+        cell = cells[i]
+        blocked = _blocked_neighbours(openings, cols, size, cell)
+        if not blocked:
+            continue
+        neighbour, side, back = blocked[rng.randrange(len(blocked))]
+        if not _would_open_block(openings, cols, size, cell, neighbour):
+            openings[cell] |= side
+            openings[neighbour] |= back
+            removed += 1
+
+
+def _blocked_neighbours(openings, cols, size, cell):
+    flags = openings[cell]
+    col = cell % cols
+    blocked = []
+    if not flags & EAST and col < cols - 1:
+        blocked.append((cell + 1, EAST, WEST))
+    if not flags & WEST and col > 0:
+        blocked.append((cell - 1, WEST, EAST))
+    if not flags & NORTH and cell >= cols:
+        blocked.append((cell - cols, NORTH, SOUTH))
+    if not flags & SOUTH and cell + cols < size:
+        blocked.append((cell + cols, SOUTH, NORTH))
+    return blocked
+
+
+def _would_open_block(openings, cols, size, a, b):
+    """pyamaze's isCyclic: would joining a and b open (part of) a 2x2 area?"""
+    first, second = min(a, b), max(a, b)
+    if a // cols == b // cols:
+        if (openings[first] & SOUTH and openings[second] & SOUTH
+                and first + cols < size and openings[first + cols] & EAST):
+            return True
+        if (openings[first] & NORTH and openings[second] & NORTH
+                and first >= cols and openings[first - cols] & EAST):
+            return True
+    else:
+        if (openings[first] & EAST and openings[second] & EAST
+                and (first + 1) % cols and openings[first + 1] & SOUTH):
+            return True
+        if (openings[first] & WEST and openings[second] & WEST
+                and first % cols and openings[first - 1] & SOUTH):
+            return True
+    return False
+
+
+def write_pyamaze_csv(grid, path):
+    """
+    Save a grid in the CSV layout read by ``pyamaze.maze.CreateMaze(loadMaze=...)``.
+
+    Args:
+        grid: maze_solving.grid.Grid to save
+        path (str): Destination file
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['  cell  ', 'E', 'W', 'N', 'S'])
+        # pyamaze reads the maze size from the last row, so end on (rows, cols)
+        for cell, sides in grid.to_maze_map().items():
+            writer.writerow([cell, sides['E'], sides['W'], sides['N'], sides['S']])
+
+
+def to_pyamaze(grid, goal=(1, 1)):
+    """
+    Build a pyamaze maze object with the grid's layout, without drawing it.
+
+    The result can be passed anywhere a pyamaze maze is expected by the
+    solvers. To show it in a window, save it with write_pyamaze_csv and
+    load that file with ``CreateMaze(loadMaze=...)``.
+
+    Args:
+        grid: maze_solving.grid.Grid to convert
+        goal (tuple): (row, col) goal recorded on the maze
+
+    Returns:
+        pyamaze.maze: Maze with maze_map filled in
+    """
+    from pyamaze import maze
+
+    m = maze(grid.rows, grid.cols)
+    m.maze_map = grid.to_maze_map()
+    m._goal = goal
+    return m
@@ -0,0 +1,218 @@
+"""
+Compact array-backed maze representation.
+
+A Grid stores one byte of direction flags per cell in a flat buffer and
+addresses cells by integer index ``(row - 1) * cols + (col - 1)``, so the
+solvers can walk the maze without building a tuple or touching a dict for
+every edge. Grids are built once from a pyamaze ``maze`` (or directly from a
+buffer) and can be passed to every solver in place of the pyamaze object.
+"""
+
+from array import array
+
+# Bit flags for open sides of a cell (set bit = passage, as in pyamaze's 1)
+EAST = 1
+WEST = 2
+NORTH = 4
+SOUTH = 8
+
+# Order in which the solvers try directions
+DIRECTIONS = 'ESNW'
+
+DIRECTION_BITS = {'E': EAST, 'W': WEST, 'N': NORTH, 'S': SOUTH}
+OPPOSITE = {'E': 'W', 'W': 'E', 'N': 'S', 'S': 'N'}
+DIRECTION_DELTAS = {'E': (0, 1), 'W': (0, -1), 'N': (-1, 0), 'S': (1, 0)}
+
+
+class Grid:
+    """
+    Maze stored as a flat buffer of per-cell opening flags.
+
+    Attributes:
+        rows (int): Number of rows
+        cols (int): Number of columns
+        size (int): Number of cells (rows * cols)
+        openings: Byte buffer with one EAST/WEST/NORTH/SOUTH bitmask per cell
+        cost: Optional buffer of doubles with the cost of leaving each cell,
+            or None when every move costs 1; assign it again after editing
+            it in place, so cost_range() is recomputed
+        offsets (dict): Index offset for each direction letter
+        moves (tuple): For every 4-bit mask, the index offsets of its open
+            directions in DIRECTIONS order
+    """
+
+    def __init__(self, rows, cols, openings=None, cost=None):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        if openings is None:
+            openings = bytearray(self.size)
+        if len(openings) != self.size:
+            raise ValueError(f'Expected {self.size} cells, got {len(openings)}')
+        self.openings = openings
+        self.cost = cost
+        self.offsets = {'E': 1, 'W': -1, 'N': -cols, 'S': cols}
+        self.moves = tuple(
+            tuple(self.offsets[d] for d in DIRECTIONS if mask & DIRECTION_BITS[d])
+            for mask in range(16)
+        )
+
+    def __getstate__(self):
+        # Pickle only the buffers: offsets/moves are rebuilt on load and any
+        # metrics a solver left on the grid are not worth shipping
+        cost = None if self.cost is None else bytes(self.cost)
+        return (self.rows, self.cols, bytes(self.openings), cost)
+
+    def __setstate__(self, state):
+        rows, cols, openings, cost = state
+        if cost is not None:
+            cost = array('d', cost)
+        self.__init__(rows, cols, bytearray(openings), cost)
+
+    @classmethod
+    def from_maze(cls, maze_obj):
+        """
+        Build a Grid from a pyamaze maze.
+
+        Args:
+            maze_obj: pyamaze.maze object (or anything with rows, cols and
+                a pyamaze-style maze_map)
+
+        Returns:
+            Grid: Compact copy of the maze layout
+        """
+        rows, cols = maze_obj.rows, maze_obj.cols
+        openings = bytearray(rows * cols)
+        cost = None
+        for (row, col), sides in maze_obj.maze_map.items():
+            index = (row - 1) * cols + (col - 1)
+            openings[index] = (
+                (EAST if sides['E'] else 0) | (WEST if sides['W'] else 0) |
+                (NORTH if sides['N'] else 0) | (SOUTH if sides['S'] else 0)
+            )
+            if 'cost' in sides:
+                if cost is None:
+                    cost = array('d', [1.0]) * (rows * cols)
+                cost[index] = sides['cost']
+        return cls(rows, cols, openings, cost)
+
+    def index(self, cell):
+        """Flat index of a (row, col) cell."""
+        return (cell[0] - 1) * self.cols + (cell[1] - 1)
+
+    def cell(self, index):
+        """(row, col) cell of a flat index."""
+        row, col = divmod(index, self.cols)
+        return (row + 1, col + 1)
+
+    def neighbors(self, index):
+        """Indices of the cells reachable in one move from ``index``."""
+        return [index + offset for offset in self.moves[self.openings[index]]]
+
+    def is_open(self, cell, direction):
+        """Whether the given side of a (row, col) cell is open."""
+        return bool(self.openings[self.index(cell)] & DIRECTION_BITS[direction])
+
+    def set_open(self, cell, direction, is_open=True):
+        """
+        Open or close one side of a (row, col) cell and the matching side of
+        its neighbour, like pyamaze's _Open_* helpers.
+
+        Args:
+            cell (tuple): (row, col) cell to change
+            direction (str): Side to change ('E', 'W', 'N', 'S')
+            is_open (bool): True to remove the wall, False to build it
+
+        Returns:
+            tuple: (row, col) of the neighbour on the other side
+        """
+        dr, dc = DIRECTION_DELTAS[direction]
+        neighbor = (cell[0] + dr, cell[1] + dc)
+        if not (1 <= neighbor[0] <= self.rows and 1 <= neighbor[1] <= self.cols):
+            raise ValueError(f'{cell} has no neighbour to the {direction}')
+        for c, d in ((cell, direction), (neighbor, OPPOSITE[direction])):
+            index = self.index(c)
+            if is_open:
+                self.openings[index] |= DIRECTION_BITS[d]
+            else:
+                self.openings[index] &= ~DIRECTION_BITS[d] & 0xF
+        return neighbor
+
+    @property
+    def cost(self):
+        return self._cost
+
+    @cost.setter
+    def cost(self, cost):
+        if cost is not None and len(cost) != self.size:
+            raise ValueError(f'Expected {self.size} costs, got {len(cost)}')
+        self._cost = cost
+        self._cost_range = None
+
+    def cost_range(self):
+        """
+        Smallest and largest cell cost, and whether every cost is whole.
+
+        Scanned once per cost layer and kept until ``cost`` is assigned.
+
+        Returns:
+            tuple: (lowest, highest, whole), or None without a cost layer
+        """
+        if self._cost is None:
+            return None
+        if self._cost_range is None:
+            cost = self._cost
+            self._cost_range = (min(cost), max(cost), all(map(float.is_integer, cost)))
+        return self._cost_range
+
+    def move_cost(self, index):
+        """Cost of leaving the cell at ``index``."""
+        return 1 if self.cost is None else self.cost[index]
+
+    @property
+    def default_start(self):
+        """Bottom-right cell, where the pyamaze agent starts."""
+        return (self.rows, self.cols)
+
+    @property
+    def default_goal(self):
+        """Top-left cell, pyamaze's default goal."""
+        return (1, 1)
+
+    def to_maze_map(self):
+        """
+        Export the layout as a pyamaze-style maze_map.
+
+        Returns:
+            dict: {(row, col): {'E': 0/1, 'W': 0/1, 'N': 0/1, 'S': 0/1}}, with
+            a 'cost' entry on every cell when the grid has a cost layer
+        """
+        maze_map = {}
+        openings = self.openings
+        for index in range(self.size):
+            flags = openings[index]
+            sides = {
+                'E': 1 if flags & EAST else 0,
+                'W': 1 if flags & WEST else 0,
+                'N': 1 if flags & NORTH else 0,
+                'S': 1 if flags & SOUTH else 0,
+            }
+            if self.cost is not None:
+                sides['cost'] = self.cost[index]
+            maze_map[self.cell(index)] = sides
+        return maze_map
+
+
+def as_grid(maze_obj):
+    """
+    Return ``maze_obj`` as a Grid, converting a pyamaze maze if needed.
+
+    Args:
+        maze_obj: Grid or pyamaze.maze object
+
+    Returns:
+        Grid: The grid to search
+    """
+    if isinstance(maze_obj, Grid):
+        return maze_obj
+    return Grid.from_maze(maze_obj)
@@ -0,0 +1,172 @@
+"""
+Compact path representation.
+
+A Path stores the flat indices of the cells it visits, start to goal, in one
+typed array (4 bytes per cell) instead of a dict of (row, col) tuples. It
+still behaves as the read-only mapping {cell: next_cell} the solvers have
+always returned, so existing code that looks up, iterates or compares paths
+keeps working. On top of that it has O(1) length, start and goal, slicing by
+position, cheap comparison and direction strings for pyamaze agents.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+# Typecode of flat cell indices in paths and parent arrays
+INDEX_TYPECODE = 'i'
+
+# Parent of a cell the search has not reached
+NO_PARENT = -1
+
+
+def parent_array(size):
+    """Parent array for a search over ``size`` cells, all unreached."""
+    return array(INDEX_TYPECODE, [NO_PARENT]) * size
+
+
+def tree_cells(parents):
+    """Flat indices that have a parent in a parent array (or dict)."""
+    if isinstance(parents, dict):
+        return list(parents)
+    return [index for index, parent in enumerate(parents) if parent != NO_PARENT]
+
+
+class Path(Mapping):
+    """
+    Path through a maze as the sequence of cells it visits.
+
+    Example:
+        path = astar_search(m)
+        len(path), path.start, path.goal
+        path[(5, 5)]          # Next cell after (5, 5), as with a dict
+        path[10:20]           # The moves between the 10th and 20th cells
+        m.tracePath({a: path.to_dict()})
+
+    Attributes:
+        cols (int): Columns of the maze, to turn flat indices into cells
+        cells: array of the flat indices visited, start first; empty when
+            there is no path
+    """
+
+    __slots__ = ('cols', 'cells', '_positions')
+
+    def __init__(self, cols, cells=()):
+        """
+        Args:
+            cols (int): Columns of the maze
+            cells: Flat indices from start to goal
+        """
+        self.cols = cols
+        if not (isinstance(cells, array) and cells.typecode == INDEX_TYPECODE):
+            cells = array(INDEX_TYPECODE, cells)
+        self.cells = cells
+        self._positions = None
+
+    @classmethod
+    def from_parents(cls, grid, parents, start, goal):
+        """
+        Walk a search tree back from goal to start.
+
+        Args:
+            grid: maze_solving.grid.Grid that was searched
+            parents: Parent array (or dict) giving each reached flat index
+                its predecessor
+            start (int): Flat index of the start cell
+            goal (int): Flat index of the goal cell
+
+        Returns:
+            Path: Path from start to goal
+        """
+        cells = array(INDEX_TYPECODE, [goal])
+        current = goal
+        while current != start:
+            current = parents[current]
+            cells.append(current)
+        cells.reverse()
+        return cls(grid.cols, cells)
+
+    def __reduce__(self):
+        return Path, (self.cols, self.cells)
+
+    def __repr__(self):
+        if not self.cells:
+            return 'Path()'
+        return f'Path({self.start} -> {self.goal}, moves={len(self)})'
+
+    def _cell(self, index):
+        row, col = divmod(index, self.cols)
+        return row + 1, col + 1
+
+    def __len__(self):
+        # Moves, which is the number of keys of the equivalent dict
+        return max(len(self.cells) - 1, 0)
+
+    def __iter__(self):
+        cell = self._cell
+        for index in self.cells[:-1]:
+            yield cell(index)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError('Paths can only be sliced with step 1')
+            return Path(self.cols, self.cells[key])
+        try:
+            position = self._lookup()[self._index(key)]
+        except (TypeError, ValueError, KeyError):
+            raise KeyError(key) from None
+        return self._cell(self.cells[position + 1])
+
+    def __contains__(self, key):
+        try:
+            return self._index(key) in self._lookup()
+        except (TypeError, ValueError):
+            return False
+
+    def _index(self, cell):
+        row, col = cell
+        if not 1 <= col <= self.cols:
+            raise ValueError(f'{cell} is outside the maze')
+        return (row - 1) * self.cols + (col - 1)
+
+    def _lookup(self):
+        """Position of each cell on the path, built on the first lookup."""
+        if self._positions is None:
+            self._positions = {index: i for i, index in enumerate(self.cells[:-1])}
+        return self._positions
+
+    def __eq__(self, other):
+        if isinstance(other, Path):
+            if not self.cells or not other.cells:
+                # No path at all: equal to another one whatever its maze,
+                # but not to the one-cell path of a start at the goal
+                return self.cells == other.cells
+            return self.cols == other.cols and self.cells == other.cells
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    @property
+    def start(self):
+        """(row, col) first cell, or None for an empty path."""
+        return self._cell(self.cells[0]) if self.cells else None
+
+    @property
+    def goal(self):
+        """(row, col) last cell, or None for an empty path."""
+        return self._cell(self.cells[-1]) if self.cells else None
+
+    def to_dict(self):
+        """The path as a {cell: next_cell} dict, as pyamaze's tracePath wants."""
+        cells = [self._cell(index) for index in self.cells]
+        return dict(zip(cells, cells[1:]))
+
+    def directions(self):
+        """
+        The moves as a string of 'E', 'W', 'N' and 'S', which pyamaze's
+        tracePath also accepts.
+        """
+        # On a one-column maze the vertical entries replace the horizontal ones
+        letter = {1: 'E', -1: 'W', -self.cols: 'N', self.cols: 'S'}
+        cells = self.cells
+        return ''.join(letter[b - a] for a, b in zip(cells, cells[1:]))
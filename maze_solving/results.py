@@ -0,0 +1,180 @@
+"""
+Append-only columnar store for solve results.
+
+A store is a directory with one binary file per column and a
+``schema.json`` naming the columns and their array typecodes. Values are
+little-endian, fixed width, one after another, so reading a column is a
+single read into an array and appending a row writes a few bytes to the
+end of each file. String columns are dictionary-encoded: the file holds
+uint32 codes into a list of values kept in the schema.
+
+Every append is flushed, so a long run that crashes loses at most the row
+being written. Columns of unequal length left by such a crash are cut back
+to the shortest one when the store is opened again.
+"""
+
+import json
+import os
+import sys
+from array import array
+
+# Typecode of dictionary-encoded string columns
+STRING = 'str'
+
+_SCHEMA = 'schema.json'
+
+
+class ResultStore:
+    """
+    Results table kept as one file per column.
+
+    Example:
+        store = ResultStore('results', [('size', 'q'), ('algorithm', 'str'),
+                                        ('time', 'd')])
+        store.append(size=20, algorithm='astar', time=0.01)
+        store.column('time')  # array('d', [0.01])
+
+    Attributes:
+        path (str): Directory holding the store
+        columns (list): (name, typecode) pairs; typecodes are array
+            typecodes or STRING
+    """
+
+    def __init__(self, path, columns=None):
+        """
+        Open a store, creating it if the directory has none yet.
+
+        Args:
+            path (str): Directory of the store
+            columns (list): (name, typecode) pairs; needed to create a store,
+                and checked against the schema when opening one
+
+        Raises:
+            ValueError: If columns differ from an existing store's schema, or
+                are missing when creating one
+        """
+        self.path = path
+        schema_path = os.path.join(path, _SCHEMA)
+        if os.path.exists(schema_path):
+            with open(schema_path) as f:
+                schema = json.load(f)
+            stored = [tuple(column) for column in schema['columns']]
+            if columns is not None and [tuple(c) for c in columns] != stored:
+                raise ValueError(f'{path} holds columns {stored}, not {list(columns)}')
+            self.columns = stored
+            self._values = schema['values']
+        else:
+            if not columns:
+                raise ValueError(f'{path} is not a result store; give columns to create one')
+            os.makedirs(path, exist_ok=True)
+            self.columns = [tuple(column) for column in columns]
+            self._values = {name: [] for name, typecode in self.columns if typecode == STRING}
+            self._write_schema()
+
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self._values.items()}
+        self._files = {}
+        self._rows = self._repair()
+        for name, _ in self.columns:
+            self._files[name] = open(self._file(name), 'ab')
+
+    def __len__(self):
+        return self._rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the column files."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def _file(self, name):
+        return os.path.join(self.path, f'{name}.col')
+
+    @staticmethod
+    def _typecode(typecode):
+        return 'I' if typecode == STRING else typecode
+
+    def _write_schema(self):
+        temporary = os.path.join(self.path, _SCHEMA + '.tmp')
+        with open(temporary, 'w') as f:
+            json.dump({'columns': self.columns, 'values': self._values}, f)
+        os.replace(temporary, os.path.join(self.path, _SCHEMA))
+
+    def _repair(self):
+        """Cut every column back to the rows all of them hold."""
+        sizes = {}
+        for name, typecode in self.columns:
+            path = self._file(name)
+            itemsize = array(self._typecode(typecode)).itemsize
+            sizes[name] = (os.path.getsize(path) if os.path.exists(path) else 0, itemsize)
+        rows = min(length // itemsize for length, itemsize in sizes.values())
+        for name, (length, itemsize) in sizes.items():
+            if length != rows * itemsize:
+                with open(self._file(name), 'ab') as f:
+                    f.truncate(rows * itemsize)
+        return rows
+
+    def append(self, **row):
+        """
+        Add one row.
+
+        Args:
+            **row: A value for every column
+
+        Raises:
+            ValueError: If a column is missing or unknown
+        """
+        if row.keys() != {name for name, _ in self.columns}:
+            raise ValueError(f'Row needs exactly the columns {[n for n, _ in self.columns]}')
+        encoded = []
+        for name, typecode in self.columns:
+            value = row[name]
+            if typecode == STRING:
+                codes = self._codes[name]
+                if value not in codes:
+                    codes[value] = len(codes)
+                    self._values[name].append(value)
+                    self._write_schema()
+                value = codes[value]
+            data = array(self._typecode(typecode), [value])
+            if sys.byteorder == 'big':
+                data.byteswap()
+            encoded.append((name, data.tobytes()))
+        for name, data in encoded:
+            self._files[name].write(data)
+        for name, _ in encoded:
+            self._files[name].flush()
+        self._rows += 1
+
+    def column(self, name):
+        """
+        Read a whole column.
+
+        Returns:
+            array of the column's typecode, or a list of str for a string
+            column
+        """
+        typecode = dict(self.columns)[name]
+        values = array(self._typecode(typecode))
+        with open(self._file(name), 'rb') as f:
+            values.frombytes(f.read(self._rows * values.itemsize))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        if typecode == STRING:
+            return [self._values[name][code] for code in values]
+        return values
+
+    def keys(self, *names):
+        """
+        Distinct combinations of some columns, e.g. to skip finished work.
+
+        Returns:
+            set: Tuples of the values of ``names`` in each row
+        """
+        return set(zip(*(self.column(name) for name in names)))
@@ -0,0 +1,200 @@
+"""
+Asyncio front-end for the solvers.
+
+The solvers are synchronous and CPU-bound, so calling them from a coroutine
+blocks the event loop. SolveService runs them on an executor (a process pool
+by default) instead and adds two things a web service needs:
+
+- Coalescing: requests with the same maze fingerprint, endpoints and
+  algorithm that arrive while one is being solved wait on that computation
+  instead of starting another one.
+- Backpressure: new computations wait in a bounded queue for one of the
+  workers. When it is full, solve() waits for room, or raises
+  asyncio.QueueFull with ``wait=False`` so the caller can reject the request.
+
+Converting a maze to a Grid and hashing it are linear in its size, so they
+run on the loop's default thread pool (asyncio.to_thread) rather than on the
+loop itself.
+"""
+
+import asyncio
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .algorithms import ALGORITHMS
+from .batch import solve_job
+from .cache import fingerprint
+from .grid import as_grid
+
+
+class SolveService:
+    """
+    Solves mazes for coroutines on a managed worker pool.
+
+    Example:
+        async with SolveService(workers=4, max_queue=100) as service:
+            result = await service.solve(m, 'astar', start=(20, 20))
+            result.path, result.expanded_nodes
+
+    To test without worker processes, pass a ThreadPoolExecutor as the
+    executor; the service then solves in the calling process.
+
+    Attributes:
+        workers (int): Computations run at once
+        max_queue (int): Computations that may wait for a worker
+        requests (int): solve() calls accepted
+        coalesced (int): Requests answered by an identical one in flight
+        computed (int): Computations handed to the executor
+    """
+
+    def __init__(self, workers=None, max_queue=64, executor=None):
+        """
+        Args:
+            workers (int): Number of computations to run at once, and of
+                worker processes in the default pool; every CPU by default
+            max_queue (int): Most computations waiting for a worker
+            executor: concurrent.futures executor to solve on instead of a
+                new ProcessPoolExecutor; the service does not shut it down
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.requests = self.coalesced = self.computed = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue = None
+        self._dispatchers = []
+        self._in_flight = {}  # Fingerprint -> future of its result
+        self._puts = set()  # Queue puts still waiting for room
+        self._ids = itertools.count()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def running(self):
+        """Whether start() has been called and close() has not."""
+        return self._queue is not None
+
+    @property
+    def pending(self):
+        """Computations queued or running."""
+        return len(self._in_flight)
+
+    async def start(self):
+        """Create the worker pool and the dispatchers feeding it."""
+        if self.running:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue(self.max_queue)
+        self._dispatchers = [asyncio.create_task(self._dispatch())
+                             for _ in range(self.workers)]
+
+    async def close(self):
+        """
+        Stop the dispatchers and the pool it created. Requests still queued
+        or running are cancelled.
+        """
+        if not self.running:
+            return
+        for task in [*self._dispatchers, *self._puts]:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, *self._puts, return_exceptions=True)
+        for future in self._in_flight.values():
+            future.cancel()
+        self._in_flight.clear()
+        self._queue = None
+        self._dispatchers = []
+        if self._owns_executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def solve(self, maze_obj, algorithm='astar', start=None, goal=None, wait=True):
+        """
+        Solve a maze without blocking the event loop.
+
+        Args:
+            maze_obj: pyamaze.maze or maze_solving.grid.Grid representing the
+                maze
+            algorithm (str): Name of the algorithm in algorithms.ALGORITHMS
+            start (tuple): (row, col) start cell, bottom-right by default
+            goal: (row, col) goal cell or list of goal cells, the maze's goal
+                or (1, 1) by default
+            wait (bool): Wait for room when the queue is full instead of
+                raising asyncio.QueueFull
+
+        Returns:
+            BatchResult: Path (always included) and metrics of the solve
+
+        Raises:
+            ValueError: For an unknown algorithm
+            RuntimeError: If the service is not running
+            asyncio.QueueFull: If the queue is full and wait is False
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm: {algorithm}')
+        if not self.running:
+            raise RuntimeError('SolveService is not running; call start() first')
+        grid, start, goal, key = await asyncio.to_thread(_prepare, maze_obj, algorithm,
+                                                         start, goal)
+        if not self.running:
+            raise RuntimeError('SolveService was closed while the request was prepared')
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            job = (key, future, grid, algorithm, start, goal)
+            if wait:
+                self._in_flight[key] = future  # Later requests share it while we wait
+                # The put belongs to the service, not this caller: if the
+                # caller gives up, the others sharing the future still get it
+                put = asyncio.ensure_future(self._queue.put(job))
+                self._puts.add(put)
+                put.add_done_callback(self._puts.discard)
+                await asyncio.shield(put)
+            else:
+                self._queue.put_nowait(job)
+                self._in_flight[key] = future
+        self.requests += 1
+        # Shielded so that one caller giving up does not cancel the others
+        return await asyncio.shield(future)
+
+    async def _dispatch(self):
+        """Hand queued computations to the executor, one at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            key, future, grid, algorithm, start, goal = await self._queue.get()
+            try:
+                if future.done():
+                    continue  # Cancelled by close()
+                self.computed += 1
+                try:
+                    result = await loop.run_in_executor(
+                        self._executor, solve_job, next(self._ids), grid, algorithm, True,
+                        start, goal
+                    )
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                self._queue.task_done()
+
+
+def _prepare(maze_obj, algorithm, start, goal):
+    """Convert a request's maze and fill in its endpoints and coalescing key."""
+    grid = as_grid(maze_obj)
+    start = start or grid.default_start
+    goal = goal or getattr(maze_obj, '_goal', None) or grid.default_goal
+    return grid, start, goal, fingerprint(grid, algorithm, start, goal)
@@ -0,0 +1,157 @@
+"""
+Compact binary maze files.
+
+A maze file is a 16-byte header followed by the Grid's own buffers, so a
+file can be memory-mapped and searched in place without parsing anything:
+
+    offset 0   magic b'MAZE'
+    offset 4   format version (1 byte), flags (1 byte), 2 reserved bytes
+    offset 8   rows, cols (two little-endian uint32)
+    offset 16  one byte of EAST/WEST/NORTH/SOUTH flags per cell, row-major
+    then       if FLAG_COST is set: padding to an 8-byte boundary and one
+               little-endian float64 per cell (cost of leaving the cell)
+
+Compared with pyamaze's CSV (about 20 bytes of text per cell) this is one
+byte per cell. The wall flags are kept a byte per cell rather than packed
+tighter so the mapped bytes can serve directly as Grid.openings.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from .grid import Grid, as_grid
+
+MAGIC = b'MAZE'
+VERSION = 1
+FLAG_COST = 1
+
+_HEADER = struct.Struct('<4sBBxxII')
+
+
+def _cost_offset(size):
+    end = _HEADER.size + size
+    return end + (-end % 8)
+
+
+def save_maze(maze_obj, path):
+    """
+    Write a maze to a binary maze file.
+
+    Args:
+        maze_obj: pyamaze.maze or maze_solving.grid.Grid to save
+        path (str): Destination file
+    """
+    grid = as_grid(maze_obj)
+    flags = FLAG_COST if grid.cost is not None else 0
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, flags, grid.rows, grid.cols))
+        f.write(grid.openings)
+        if grid.cost is not None:
+            f.write(bytes(_cost_offset(grid.size) - _HEADER.size - grid.size))
+            cost = array('d', grid.cost)
+            if sys.byteorder == 'big':
+                cost.byteswap()
+            f.write(cost)
+
+
+def _read_header(data, path):
+    if len(data) < _HEADER.size:
+        raise ValueError(f'{path} is not a maze file')
+    magic, version, flags, rows, cols = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a maze file')
+    if version != VERSION:
+        raise ValueError(f'{path} has unsupported maze format version {version}')
+    size = rows * cols
+    expected = _cost_offset(size) + 8 * size if flags & FLAG_COST else _HEADER.size + size
+    if len(data) < expected:
+        raise ValueError(f'{path} is truncated')
+    return rows, cols, bool(flags & FLAG_COST)
+
+
+def load_maze(path):
+    """
+    Read a binary maze file into memory.
+
+    Args:
+        path (str): Maze file written by save_maze
+
+    Returns:
+        Grid: The maze, with its own writable buffers
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    rows, cols, has_cost = _read_header(data, path)
+    size = rows * cols
+    openings = bytearray(data[_HEADER.size:_HEADER.size + size])
+    cost = None
+    if has_cost:
+        offset = _cost_offset(size)
+        cost = array('d')
+        cost.frombytes(data[offset:offset + 8 * size])
+        if sys.byteorder == 'big':
+            cost.byteswap()
+    return Grid(rows, cols, openings, cost)
+
+
+class MappedGrid(Grid):
+    """
+    Grid whose buffers are a memory-mapped maze file.
+
+    Nothing is copied: the operating system pages the walls in as the
+    solvers touch them, and every process mapping the same file shares the
+    same pages. Pickling a MappedGrid sends only the file path, so
+    solve_batch workers each map the file instead of receiving a copy.
+
+    Attributes:
+        path (str): The mapped file
+        writable (bool): Whether wall changes are written back to the file
+    """
+
+    def __init__(self, path, writable=False):
+        """
+        Args:
+            path (str): Maze file written by save_maze
+            writable (bool): Map the file for writing so set_open changes the
+                file; by default the grid is read-only
+        """
+        with open(path, 'r+b' if writable else 'rb') as f:
+            self._mmap = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+        rows, cols, has_cost = _read_header(self._mmap, path)
+        if has_cost and sys.byteorder == 'big':
+            raise ValueError('Mapping a cost layer needs a little-endian machine; use load_maze')
+        size = rows * cols
+        view = memoryview(self._mmap)
+        openings = view[_HEADER.size:_HEADER.size + size]
+        cost = None
+        if has_cost:
+            offset = _cost_offset(size)
+            cost = view[offset:offset + 8 * size].cast('d')
+        super().__init__(rows, cols, openings, cost)
+        self.path = path
+        self.writable = writable
+
+    def flush(self):
+        """Write wall changes made through a writable mapping to disk."""
+        self._mmap.flush()
+
+    def __reduce__(self):
+        return (MappedGrid, (self.path, self.writable))
+
+
+def map_maze(path, writable=False):
+    """
+    Memory-map a binary maze file as a Grid.
+
+    Args:
+        path (str): Maze file written by save_maze
+        writable (bool): Allow set_open to change the file in place
+
+    Returns:
+        MappedGrid: Grid backed by the file
+    """
+    return MappedGrid(path, writable)
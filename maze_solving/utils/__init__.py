@@ -2,9 +2,15 @@
 Utility functions for maze solving algorithms.
 """
 
+from ..grid import DIRECTION_DELTAS
+
 def get_neighbor(current, direction):
     """
     Get neighboring cell coordinates based on direction.
+
+    Solvers working on a maze_solving.grid.Grid use its precomputed
+    ``offsets``/``moves`` tables instead; this helper is kept for code that
+    still walks (row, col) tuples.
     
     Args:
         current (tuple): Current cell coordinates (row, col)
@@ -13,20 +19,19 @@ def get_neighbor(current, direction):
     Returns:
         tuple: Coordinates of the neighbor cell
     """
-    if direction == 'E':
-        return (current[0], current[1]+1)
-    elif direction == 'W':
-        return (current[0], current[1]-1)
-    elif direction == 'N':
-        return (current[0]-1, current[1])
-    elif direction == 'S':
-        return (current[0]+1, current[1])
-    return None
+    delta = DIRECTION_DELTAS.get(direction)
+    if delta is None:
+        return None
+    return (current[0] + delta[0], current[1] + delta[1])
 
 def reconstruct_path(came_from, start, goal):
     """
     Reconstruct path from start to goal using came_from dictionary.
-    
+
+    Solvers build their paths from typed parent arrays with
+    maze_solving.path.Path.from_parents instead; this helper is kept for
+    code that still keys its search tree on (row, col) tuples.
+
     Args:
         came_from (dict): Dictionary mapping each cell to its predecessor
         start (tuple): Start cell coordinates
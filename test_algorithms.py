@@ -6,7 +6,6 @@ Tests all algorithms on various maze sizes and validates their functionality.
 import os
 import sys
 import time
-from pyamaze import maze
 
 # Add the project root directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,19 +15,21 @@ sys.path.append(current_dir)
 from maze_solving.algorithms.astar import astar_search
 from maze_solving.algorithms.gbfs import greedy_best_first_search
 from maze_solving.algorithms.ids import iterative_deepening_search
+from maze_solving.algorithms.stats import SearchStats
 from maze_solving.algorithms.ucs import uniform_cost_search
+from maze_solving.generator import generate_maze, to_pyamaze
 
 def test_algorithm(name, algo_func, maze_size=10, loop_percent=20):
     """Test a single algorithm on a maze of given size."""
     print(f"\nTesting {name} on {maze_size}x{maze_size} maze...")
     
-    # Create maze
-    m = maze(maze_size, maze_size)
-    m.CreateMaze(loopPercent=loop_percent)
+    # Create maze (headless; no Tk window is needed to solve it)
+    m = to_pyamaze(generate_maze(maze_size, maze_size, loop_percent=loop_percent))
     
     # Run algorithm and time it
+    stats = SearchStats()
     start_time = time.time()
-    path = algo_func(m)
+    path = algo_func(m, stats=stats)
     end_time = time.time()
     
     # Check results
@@ -36,13 +37,13 @@ def test_algorithm(name, algo_func, maze_size=10, loop_percent=20):
         print(f"✓ {name} found a path!")
         print(f"  Time taken: {end_time - start_time:.4f} seconds")
         print(f"  Path length: {len(path) + 1}")
-        print(f"  Expanded nodes: {len(m.expanded_nodes)}")
-        print(f"  Explored cells: {len(m.explored_cells)}")
+        print(f"  Expanded nodes: {stats.expanded}")
+        print(f"  Explored cells: {stats.explored}")
         return True, {
             'time': end_time - start_time,
             'path_length': len(path) + 1,
-            'expanded_nodes': len(m.expanded_nodes),
-            'explored_cells': len(m.explored_cells)
+            'expanded_nodes': stats.expanded,
+            'explored_cells': stats.explored
         }
     else:
         print(f"✗ {name} failed to find a path!")
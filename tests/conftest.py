@@ -0,0 +1,95 @@
+"""
+Shared fixtures for the pytest suite.
+
+Mazes are carved directly into a pyamaze maze_map so the tests run without
+opening a Tk window (pyamaze's CreateMaze always draws).
+"""
+
+import os
+import random
+import sys
+from collections import deque
+
+import pytest
+from pyamaze import maze
+
+# Add the parent directory to system path to import our package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def carve_maze(rows, cols, loop_percent=0, seed=0):
+    """Randomised depth-first maze with extra walls knocked out for loops."""
+    rng = random.Random(seed)
+    m = maze(rows, cols)
+    openers = {
+        (0, 1): m._Open_East, (0, -1): m._Open_West,
+        (-1, 0): m._Open_North, (1, 0): m._Open_South,
+    }
+    stack = [(1, 1)]
+    visited = {(1, 1)}
+    while stack:
+        x, y = stack[-1]
+        options = [(dx, dy) for dx, dy in openers
+                   if 1 <= x + dx <= rows and 1 <= y + dy <= cols
+                   and (x + dx, y + dy) not in visited]
+        if not options:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(options)
+        openers[dx, dy](x, y)
+        visited.add((x + dx, y + dy))
+        stack.append((x + dx, y + dy))
+    for _ in range(rows * cols * loop_percent // 100):
+        x, y = rng.randint(1, rows), rng.randint(1, cols)
+        dx, dy = rng.choice(list(openers))
+        if 1 <= x + dx <= rows and 1 <= y + dy <= cols:
+            openers[dx, dy](x, y)
+    return m
+
+
+def bfs_length(maze_obj, start, goal):
+    """Number of moves on a shortest path, or None if unreachable."""
+    deltas = {'E': (0, 1), 'W': (0, -1), 'N': (-1, 0), 'S': (1, 0)}
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            return dist[cell]
+        for d, (dx, dy) in deltas.items():
+            if maze_obj.maze_map[cell][d]:
+                nxt = (cell[0] + dx, cell[1] + dy)
+                if nxt not in dist:
+                    dist[nxt] = dist[cell] + 1
+                    queue.append(nxt)
+    return None
+
+
+def assert_valid_path(maze_obj, path, start, goal):
+    """Check that ``path`` walks open passages from start to goal."""
+    deltas = {(0, 1): 'E', (0, -1): 'W', (-1, 0): 'N', (1, 0): 'S'}
+    cell = start
+    steps = 0
+    while cell != goal:
+        nxt = path[cell]
+        direction = deltas[(nxt[0] - cell[0], nxt[1] - cell[1])]
+        assert maze_obj.maze_map[cell][direction]
+        cell = nxt
+        steps += 1
+        assert steps <= len(path)
+    assert steps == len(path)
+
+
+@pytest.fixture
+def make_maze():
+    return carve_maze
+
+
+@pytest.fixture
+def shortest_length():
+    return bfs_length
+
+
+@pytest.fixture
+def check_path():
+    return assert_valid_path
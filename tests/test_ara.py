@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from maze_solving.algorithms import (
+    SearchLimits,
+    SearchStats,
+    anytime_astar_search,
+    anytime_astar_solutions,
+    astar_search,
+    select_landmarks
+)
+from maze_solving.algorithms.limits import DEADLINE
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid
+
+
+@pytest.mark.parametrize('weight', [1.0, 2.0, 5.0])
+def test_final_path_is_shortest(weight, make_maze, check_path, shortest_length):
+    rng = random.Random(int(weight))
+    for seed in range(3):
+        m = make_maze(12, 14, loop_percent=30, seed=seed)
+        for _ in range(5):
+            start = (rng.randint(1, 12), rng.randint(1, 14))
+            goal = (rng.randint(1, 12), rng.randint(1, 14))
+            path = anytime_astar_search(m, start=start, goal=goal, weight=weight)
+            check_path(m, path, start, goal)
+            assert len(path) == shortest_length(m, start, goal)
+
+
+def test_solutions_improve_within_their_bounds():
+    grid = generate_maze(60, 60, loop_percent=20, seed=3)
+    shortest = len(astar_search(grid))
+    solutions = list(anytime_astar_solutions(grid, weight=4.0, decrement=0.5))
+    assert solutions[-1].bound == 1.0 and solutions[-1].length == shortest
+    for earlier, later in zip(solutions, solutions[1:]):
+        assert later.length <= earlier.length and later.bound <= earlier.bound
+        assert later.expanded >= earlier.expanded
+    for solution in solutions:
+        assert solution.length == len(solution.path)
+        assert 1.0 <= solution.bound <= solution.weight
+        assert solution.length <= solution.bound * shortest
+
+
+def test_first_solution_is_cheaper_than_astar():
+    grid = generate_maze(80, 80, loop_percent=30, seed=2)
+    stats = SearchStats()
+    astar_search(grid, stats=stats)
+    first = next(anytime_astar_solutions(grid, weight=3.0))
+    assert first.expanded < stats.expanded
+
+
+def test_deadline_keeps_the_best_path():
+    grid = generate_maze(150, 150, loop_percent=10, seed=1)
+    first = next(anytime_astar_solutions(grid, weight=3.0))
+    limits = SearchLimits(max_expansions=first.expanded + 10)
+    path = anytime_astar_search(grid, weight=3.0, limits=limits)
+    assert limits.stopped
+    cell = (150, 150)
+    while cell in path:
+        cell = path[cell]
+    assert cell == (1, 1) and len(path) <= first.length
+
+    limits = SearchLimits(timeout=0)
+    for solution in anytime_astar_solutions(grid, limits=limits):
+        pass
+    assert limits.status == DEADLINE
+
+
+def test_length_of_a_pass_stopped_partway_is_the_path_length():
+    # The pass repairs parents after the goal was reached, so the path can be
+    # shorter than the goal's g when it is cut off
+    grid = generate_maze(40, 40, loop_percent=30, seed=3)
+    shortest = len(astar_search(grid))
+    for budget in range(100, 3000, 97):
+        limits = SearchLimits(max_expansions=budget, check_interval=1)
+        for solution in anytime_astar_solutions(grid, weight=4.0, limits=limits):
+            assert solution.length == len(solution.path)
+            assert shortest <= solution.length <= solution.bound * shortest
+
+
+def test_landmarks_and_several_goals(make_maze, shortest_length):
+    m = make_maze(15, 15, loop_percent=25, seed=6)
+    goals = [(1, 1), (3, 14), (14, 2)]
+    path = anytime_astar_search(m, goal=goals, landmarks=select_landmarks(m, count=4))
+    assert len(path) == min(shortest_length(m, (15, 15), goal) for goal in goals)
+
+
+def test_bad_arguments_and_trivial_queries():
+    with pytest.raises(ValueError):
+        anytime_astar_search(generate_maze(5, 5, seed=1), weight=0.5)
+    assert anytime_astar_search(Grid(3, 3)) == {}
+    solution, = anytime_astar_solutions(Grid(3, 3), start=(2, 2), goal=(2, 2))
+    assert solution.path == {} and solution.bound == 1.0
@@ -0,0 +1,48 @@
+import pickle
+
+import pytest
+
+from maze_solving.algorithms import astar_search
+from maze_solving.batch import solve_batch, solve_job, solve_jobs
+from maze_solving.grid import Grid
+
+
+def test_grid_pickles_compactly(make_maze):
+    m = make_maze(30, 30, loop_percent=20, seed=1)
+    grid = Grid.from_maze(m)
+    astar_search(grid)
+    data = pickle.dumps(grid)
+    assert len(data) < 2 * grid.size
+    copy = pickle.loads(data)
+    assert copy.to_maze_map() == m.maze_map
+    assert not hasattr(copy, 'expanded_nodes')
+
+
+def test_batch_matches_in_process_and_pool(make_maze):
+    mazes = [make_maze(12, 12, loop_percent=30, seed=s) for s in range(4)]
+    algorithms = ['astar', 'ucs', 'gbfs', 'jps']
+    serial = list(solve_batch(mazes, algorithms, workers=1, return_paths=True))
+    pooled = list(solve_batch(iter(mazes), algorithms, workers=2, max_pending=3))
+
+    assert len(serial) == len(pooled) == 16
+    key = lambda r: (r.maze_index, r.algorithm)
+    for a, b in zip(sorted(serial, key=key), sorted(pooled, key=key)):
+        assert key(a) == key(b)
+        assert a.path_length == b.path_length
+        assert a.expanded_nodes == b.expanded_nodes
+        assert b.path is None
+    first = next(r for r in serial if r.maze_index == 0 and r.algorithm == 'astar')
+    assert first.path == astar_search(mazes[0])
+
+
+def test_start_at_the_goal_counts_as_solved():
+    grid = Grid(3, 3)
+    results = list(solve_jobs([(0, grid, 'astar'), (1, grid, 'jps')], workers=1))
+    assert [r.path_length for r in results] == [0, 0]
+    result = solve_job(0, grid, 'astar', True, start=(2, 2), goal=(2, 2))
+    assert result.path_length == 1 and result.path.start == (2, 2)
+
+
+def test_unknown_algorithm_rejected_up_front():
+    with pytest.raises(ValueError):
+        solve_batch([Grid(2, 2)], ['dijkstra'])
@@ -0,0 +1,87 @@
+import json
+
+from maze_solving.benchmark import (
+    DEFAULT_LOOP_PERCENTS, build_corpus, compare, format_report, main,
+    measure_startup, run_benchmark, summarize
+)
+
+
+def test_corpus_is_reproducible():
+    first = build_corpus(sizes=[6, 9], loop_percents=[0, 40], mazes=2, seed=3)
+    second = build_corpus(sizes=[6, 9], loop_percents=[0, 40], mazes=2, seed=3)
+    assert len(first) == 8
+    assert [g.openings for _, _, g in first] == [g.openings for _, _, g in second]
+    assert first[0][2].openings != first[1][2].openings
+
+
+def test_summarize():
+    stats = summarize([5, 1, 3, 2, 4])
+    assert stats['median'] == 3
+    assert (stats['q1'], stats['q3'], stats['iqr']) == (2, 4, 2)
+    assert summarize([7])['iqr'] == 0
+
+
+def test_run_benchmark_reports_every_configuration():
+    report = run_benchmark(['astar', 'ids'], sizes=[8, 30], loop_percents=[0, 50],
+                           mazes=2, repeats=3, warmup=1)
+    keys = [(r['algorithm'], r['size'], r['loop_percent']) for r in report['results']]
+    # IDS is skipped above its size limit
+    assert keys == [('astar', 8, 0), ('astar', 8, 50), ('astar', 30, 0), ('astar', 30, 50),
+                    ('ids', 8, 0), ('ids', 8, 50)]
+    for entry in report['results']:
+        assert entry['samples'] == 6
+        assert entry['q1_ns'] <= entry['median_ns'] <= entry['q3_ns']
+        assert entry['peak_bytes'] > 0 and entry['expanded'] > 0
+    assert report['meta']['repeats'] == 3
+    assert report['startup']['module'] == 'maze_solving.algorithms'
+
+
+def test_solvers_import_without_heavy_dependencies():
+    startup = measure_startup(runs=1)
+    assert startup['heavy_modules'] == []
+    assert 0 < startup['min_ns'] <= startup['median_ns']
+    # A module that does need a heavy dependency is reported
+    assert measure_startup('numpy', runs=1)['heavy_modules'] == ['numpy']
+
+
+def test_deepening_configurations_finish_or_are_skipped():
+    # IDS on a 20x20 maze with loops ran for minutes before the budget
+    report = run_benchmark(['ids', 'ida'], sizes=[20, 40],
+                           loop_percents=DEFAULT_LOOP_PERCENTS, mazes=1, repeats=1,
+                           warmup=0, measure_memory=False, startup_runs=0)
+    configurations = [(e['algorithm'], e['size'], e['loop_percent'])
+                      for e in report['results'] + report['skipped']]
+    assert sorted(configurations) == sorted(
+        (name, size, loops) for name, size in [('ids', 20), ('ida', 20), ('ida', 40)]
+        for loops in DEFAULT_LOOP_PERCENTS
+    )
+    assert {'algorithm': 'ids', 'size': 20, 'loop_percent': 100} in report['skipped']
+    assert 'skipped (over the expansion budget)' in format_report(report)
+
+
+def test_compare_flags_only_clear_slowdowns():
+    def report(median, q1, q3):
+        return {'results': [{'algorithm': 'astar', 'size': 50, 'loop_percent': 0,
+                             'median_ns': median, 'q1_ns': q1, 'q3_ns': q3}]}
+    baseline = report(100, 95, 105)
+    assert compare(report(104, 99, 110), baseline) == []     # Within threshold
+    assert compare(report(130, 100, 160), baseline) == []    # Ranges overlap
+    [regression] = compare(report(130, 120, 140), baseline)
+    assert regression['ratio'] == 1.3
+
+
+def test_cli_writes_json_and_compares(tmp_path, capsys):
+    output = tmp_path / 'bench.json'
+    args = ['--algorithms', 'ucs', '--sizes', '6', '--loops', '0',
+            '--mazes', '1', '--repeats', '2', '--no-memory']
+    assert main(args + ['--output', str(output)]) == 0
+    saved = json.loads(output.read_text())
+    assert saved['results'][0]['peak_bytes'] is None
+    assert 'heavy modules loaded: none' in capsys.readouterr().out
+
+    # A baseline that was impossibly fast makes the run a regression
+    for entry in saved['results']:
+        entry['median_ns'] = entry['q1_ns'] = entry['q3_ns'] = 1
+    output.write_text(json.dumps(saved))
+    assert main(args + ['--baseline', str(output)]) == 1
+    assert 'REGRESSION ucs' in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import random
+
+from maze_solving.algorithms import (
+    SearchStats,
+    astar_search,
+    bidirectional_astar_search,
+    bidirectional_uniform_cost_search,
+    uniform_cost_search
+)
+
+
+def path_cost(maze_obj, path):
+    return sum(maze_obj.maze_map[cell].get('cost', 1) for cell in path)
+
+
+def test_bidirectional_astar_is_optimal(make_maze, shortest_length, check_path):
+    for seed in range(8):
+        m = make_maze(15, 11, loop_percent=50, seed=seed)
+        stats = SearchStats()
+        path = bidirectional_astar_search(m, stats=stats)
+        check_path(m, path, (15, 11), (1, 1))
+        assert len(path) == shortest_length(m, (15, 11), (1, 1))
+        assert stats.expanded and stats.explored
+
+
+def test_bidirectional_ucs_matches_ucs_cost(make_maze, check_path):
+    for seed in range(8):
+        m = make_maze(10, 12, loop_percent=60, seed=seed)
+        rng = random.Random(seed)
+        for cell in m.grid:
+            m.maze_map[cell]['cost'] = rng.randint(1, 9)
+        expected = path_cost(m, uniform_cost_search(m))
+        path = uniform_cost_search(m, bidirectional=True)
+        check_path(m, path, (10, 12), (1, 1))
+        assert path_cost(m, path) == expected
+
+
+def test_bidirectional_flag_expands_fewer_nodes(make_maze):
+    m = make_maze(40, 40, loop_percent=100, seed=4)
+    one_way, two_way = SearchStats(), SearchStats()
+    uniform_cost_search(m, stats=one_way)
+    bidirectional_uniform_cost_search(m, stats=two_way)
+    assert two_way.expanded < one_way.expanded
+    assert len(astar_search(m, bidirectional=True)) == len(astar_search(m))
@@ -0,0 +1,67 @@
+from maze_solving.algorithms import SearchStats, astar_search
+from maze_solving.cache import SolutionCache, fingerprint
+from maze_solving.grid import Grid
+
+
+def test_fingerprint_depends_on_layout_endpoints_and_algorithm(make_maze):
+    grid = Grid.from_maze(make_maze(6, 6, seed=1))
+    key = fingerprint(grid, 'astar')
+    assert key == fingerprint(make_maze(6, 6, seed=1), 'astar')
+    assert key != fingerprint(grid, 'ucs')
+    assert key != fingerprint(grid, 'astar', goal=(2, 2))
+    assert key != fingerprint(Grid.from_maze(make_maze(6, 6, seed=2)), 'astar')
+
+
+def test_hits_return_stored_solution(make_maze):
+    m = make_maze(10, 10, loop_percent=20, seed=4)
+    cache = SolutionCache()
+    first = cache.solve(m, 'astar')
+    second = cache.solve(Grid.from_maze(m), 'astar')
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first == second
+    stats = SearchStats()
+    assert first.path == astar_search(m, stats=stats)
+    assert first.expanded_nodes == stats.expanded
+
+
+def test_lru_eviction_respects_budget(make_maze):
+    cache = SolutionCache(max_bytes=1000)
+    mazes = [make_maze(8, 8, seed=s) for s in range(6)]
+    for m in mazes:
+        cache.solve(m, 'ucs')
+    assert cache.size_bytes <= 1000
+    assert 1 <= len(cache) < 6
+    assert fingerprint(mazes[-1], 'ucs') in cache
+    assert fingerprint(mazes[0], 'ucs') not in cache
+
+
+def test_unsolvable_maze_is_cached(tmp_path):
+    cache = SolutionCache(path=str(tmp_path / 'cache.db'))
+    assert cache.solve(Grid(2, 2), 'ids').path == {}
+    assert cache.solve(Grid(2, 2), 'ids').path == {}
+    assert cache.hits == 1
+
+
+def test_start_at_the_goal_is_not_cached_as_unsolvable(tmp_path):
+    cache = SolutionCache(path=str(tmp_path / 'cache.db'))
+    for _ in range(2):
+        solution = cache.solve(Grid(3, 3), 'astar', start=(2, 2), goal=(2, 2))
+        assert solution.path.start == solution.path.goal == (2, 2)
+    assert cache.hits == 1
+
+
+def test_disk_store_survives_restart(make_maze, tmp_path):
+    db = str(tmp_path / 'cache.db')
+    m = make_maze(9, 9, loop_percent=10, seed=8)
+    cache = SolutionCache(path=db)
+    expected = cache.solve(m, 'gbfs')
+    cache.close()
+
+    warm = SolutionCache(path=db)
+    assert warm.solve(m, 'gbfs') == expected
+    assert (warm.hits, warm.misses) == (1, 0)
+    warm.clear()
+    assert len(warm) == 0
+    warm.solve(m, 'gbfs')
+    assert warm.misses == 1
+    warm.close()
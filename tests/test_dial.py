@@ -0,0 +1,124 @@
+from array import array
+import random
+
+import pytest
+
+from maze_solving.algorithms import (
+    SearchLimits,
+    SearchStats,
+    SearchSteps,
+    astar_search,
+    astar_steps,
+    select_landmarks,
+    uniform_cost_search,
+    uniform_cost_steps
+)
+from maze_solving.algorithms.dial import bucket_step
+from maze_solving.generator import generate_maze
+
+
+def path_cost(grid, path, start):
+    total, cell = 0, start
+    while cell in path:
+        total += grid.cost[grid.index(cell)]
+        cell = path[cell]
+    return total
+
+
+def with_costs(grid, seed, low=0, high=9):
+    rng = random.Random(seed)
+    grid.cost = array('d', (rng.randint(low, high) for _ in range(grid.size)))
+    return grid
+
+
+@pytest.mark.parametrize('loop_percent', [0, 30])
+def test_bucket_ucs_matches_heap_cost(loop_percent):
+    for seed in range(4):
+        grid = with_costs(generate_maze(20, 25, loop_percent=loop_percent, seed=seed), seed)
+        heap = uniform_cost_search(grid, frontier='heap')
+        buckets = uniform_cost_search(grid, frontier='buckets')
+        assert path_cost(grid, buckets, (20, 25)) == path_cost(grid, heap, (20, 25))
+
+
+def test_bucket_ucs_all_goals():
+    grid = with_costs(generate_maze(15, 15, loop_percent=20, seed=2), 2, low=1)
+    goals = [(1, 1), (1, 15), (8, 3)]
+    heap = uniform_cost_search(grid, goal=goals, all_goals=True, frontier='heap')
+    buckets = uniform_cost_search(grid, goal=goals, all_goals=True, frontier='buckets')
+    assert buckets.keys() == heap.keys()
+    for goal in goals:
+        assert path_cost(grid, buckets[goal], (15, 15)) == path_cost(grid, heap[goal], (15, 15))
+
+
+@pytest.mark.parametrize('use_landmarks', [False, True])
+def test_bucket_astar_is_still_shortest(use_landmarks, make_maze, check_path, shortest_length):
+    rng = random.Random(7)
+    for seed in range(3):
+        m = make_maze(12, 14, loop_percent=25, seed=seed)
+        table = select_landmarks(m, count=4) if use_landmarks else None
+        for _ in range(6):
+            start = (rng.randint(1, 12), rng.randint(1, 14))
+            goal = (rng.randint(1, 12), rng.randint(1, 14))
+            path = astar_search(m, start=start, goal=goal, landmarks=table, frontier='buckets')
+            check_path(m, path, start, goal)
+            assert len(path) == shortest_length(m, start, goal)
+
+
+def test_priorities_never_decrease():
+    grid = generate_maze(20, 20, loop_percent=30, seed=4)
+    for steps in (astar_steps(grid), uniform_cost_steps(with_costs(grid, 4))):
+        priorities = [event.f for event in SearchSteps(steps)]
+        assert priorities == sorted(priorities)
+
+
+def test_auto_picks_buckets_only_for_small_whole_costs():
+    grid = generate_maze(10, 10, seed=1)
+    assert bucket_step(grid) == 1
+    assert bucket_step(grid, heuristic=True) == 2
+    assert bucket_step(with_costs(grid, 1, high=5), use_cost=True) == 5
+    costs = list(grid.cost)
+    costs[3] = 1.5
+    grid.cost = array('d', costs)
+    assert bucket_step(grid, use_cost=True) is None
+    with pytest.raises(ValueError):
+        uniform_cost_search(grid, frontier='buckets')
+    # Fractional costs fall back to the heap
+    assert uniform_cost_search(grid) == uniform_cost_search(grid, frontier='heap')
+    with pytest.raises(ValueError):
+        astar_search(grid, frontier='radix')
+
+
+def test_budget_stops_bucket_search():
+    grid = generate_maze(40, 40, loop_percent=10, seed=3)
+    limits = SearchLimits(max_expansions=50, check_interval=1)
+    path = uniform_cost_search(grid, limits=limits, frontier='buckets')
+    assert limits.status == 'budget'
+    assert path and len(path) < len(uniform_cost_search(grid))
+
+
+def test_astar_auto_keeps_the_heap_tie_break():
+    grid = generate_maze(60, 60, loop_percent=100, seed=1)
+    auto, heap = SearchStats(), SearchStats()
+    assert astar_search(grid, stats=auto) == astar_search(grid, frontier='heap', stats=heap)
+    assert auto.expanded == heap.expanded
+
+
+def test_cost_range_is_kept_until_the_layer_is_replaced():
+    grid = with_costs(generate_maze(10, 10, seed=2), 2, low=1, high=4)
+    assert grid.cost_range() == (1, 4, True)
+    grid.cost[0] = 9  # Edited in place: not seen until reassigned
+    assert grid.cost_range() == (1, 4, True)
+    grid.cost = grid.cost
+    assert grid.cost_range() == (1, 9, True)
+    grid.cost = None
+    assert grid.cost_range() is None and bucket_step(grid, use_cost=True) == 1
+
+
+def test_costs_edited_in_place_are_never_truncated():
+    grid = with_costs(generate_maze(2, 2, loop_percent=100, seed=1), 1, low=1, high=1)
+    uniform_cost_search(grid)  # Caches the whole-cost check
+    grid.cost[1] = grid.cost[2] = 1.9
+    with pytest.raises(ValueError, match='assign grid.cost again'):
+        uniform_cost_search(grid)
+    grid.cost = grid.cost
+    assert uniform_cost_search(grid) == uniform_cost_search(grid, frontier='heap')
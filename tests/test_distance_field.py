@@ -0,0 +1,25 @@
+from maze_solving.algorithms import distance_field
+from maze_solving.algorithms.distance_field import UNREACHABLE
+from maze_solving.grid import Grid
+
+
+def test_distances_match_bfs(make_maze, shortest_length, check_path):
+    m = make_maze(9, 13, loop_percent=40, seed=5)
+    field = distance_field(m)
+    assert field.distance.shape == (9, 13)
+    for cell in m.grid:
+        expected = shortest_length(m, cell, (1, 1))
+        assert field.distance_to_goal(cell) == expected
+        path = field.path(cell)
+        check_path(m, path, cell, (1, 1))
+
+
+def test_custom_goal_and_unreachable_cells(make_maze):
+    grid = Grid.from_maze(make_maze(5, 5, seed=1))
+    field = distance_field(grid, goal=(3, 3))
+    assert field.distance_to_goal((3, 3)) == 0
+    assert field.path((3, 3)) == {}
+
+    walled = distance_field(Grid(2, 3))
+    assert (walled.distance == UNREACHABLE).sum() == 5
+    assert walled.path((2, 3)) == {}
@@ -0,0 +1,74 @@
+import pytest
+
+from maze_solving.algorithms import ALGORITHMS
+from maze_solving.grid import Grid
+
+SINGLE_PASS = ['astar', 'ucs', 'gbfs', 'ids', 'ida']
+OPTIMAL = ['astar', 'ucs', 'ids', 'ida', 'jps', 'bi-astar', 'bi-ucs']
+
+
+@pytest.mark.parametrize('name', sorted(ALGORITHMS))
+def test_custom_start_and_goal(name, make_maze, shortest_length, check_path):
+    m = make_maze(9, 9, loop_percent=25, seed=11)
+    path = ALGORITHMS[name](m, start=(2, 3), goal=(8, 7))
+    check_path(m, path, (2, 3), (8, 7))
+    if name in OPTIMAL:
+        assert len(path) == shortest_length(m, (2, 3), (8, 7))
+
+
+@pytest.mark.parametrize('name', sorted(ALGORITHMS))
+def test_pyamaze_goal_is_the_default(name, make_maze, check_path):
+    m = make_maze(7, 7, loop_percent=25, seed=12)
+    m._goal = (4, 2)
+    check_path(m, ALGORITHMS[name](m), (7, 7), (4, 2))
+
+
+@pytest.mark.parametrize('name', ['astar', 'ucs', 'ids', 'ida', 'jps'])
+def test_multi_goal_stops_at_nearest(name, make_maze, shortest_length, check_path):
+    m = make_maze(12, 12, loop_percent=30, seed=13)
+    goals = [(1, 1), (6, 9), (12, 1)]
+    path = ALGORITHMS[name](m, goal=goals)
+    nearest = min(shortest_length(m, (12, 12), g) for g in goals)
+    assert len(path) == nearest
+    end = (set(path.values()) - set(path)).pop()
+    assert end in goals
+    check_path(m, path, (12, 12), end)
+
+
+@pytest.mark.parametrize('name', SINGLE_PASS)
+def test_all_goals_in_one_pass(name, make_maze, shortest_length, check_path):
+    m = make_maze(10, 10, loop_percent=30, seed=14)
+    goals = [(1, 1), (5, 5), (1, 10)]
+    paths = ALGORITHMS[name](m, goal=goals, all_goals=True)
+    assert set(paths) == set(goals)
+    for goal, path in paths.items():
+        check_path(m, path, (10, 10), goal)
+        if name != 'gbfs':
+            assert len(path) == shortest_length(m, (10, 10), goal)
+
+
+def test_unreachable_goal_in_all_goals_mode(make_maze):
+    grid = Grid(1, 3, bytearray([1, 2, 0]))
+    paths = ALGORITHMS['ucs'](grid, start=(1, 1), goal=[(1, 2), (1, 3)], all_goals=True)
+    assert paths == {(1, 2): {(1, 1): (1, 2)}, (1, 3): {}}
+
+
+def test_bidirectional_rejects_several_goals(make_maze):
+    with pytest.raises(ValueError):
+        ALGORITHMS['bi-astar'](make_maze(4, 4), goal=[(1, 1), (2, 2)])
+
+
+@pytest.mark.parametrize('name', sorted(ALGORITHMS))
+@pytest.mark.parametrize('start, goal', [
+    ((3, 0), (1, 1)), ((3, 6), (1, 1)), ((0, 3), (1, 1)), ((6, 1), (1, 1)),
+    ((5, 5), (1, 6)), ((5, 5), [(1, 1), (0, 2)])
+])
+def test_cells_outside_the_maze_are_rejected(name, start, goal):
+    with pytest.raises(ValueError):
+        ALGORITHMS[name](Grid(5, 5), start=start, goal=goal)
+
+
+@pytest.mark.parametrize('name', sorted(ALGORITHMS))
+def test_empty_goal_list_is_rejected(name):
+    with pytest.raises(ValueError, match='At least one goal'):
+        ALGORITHMS[name](Grid(5, 5), goal=[])
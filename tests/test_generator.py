@@ -0,0 +1,59 @@
+import csv
+
+from maze_solving.algorithms import astar_search
+from maze_solving.generator import generate_maze, to_pyamaze, write_pyamaze_csv
+
+
+def _passages(grid):
+    return sum(len(grid.neighbors(i)) for i in range(grid.size)) // 2
+
+
+def _reachable(grid, start=0):
+    seen = {start}
+    stack = [start]
+    while stack:
+        for n in grid.neighbors(stack.pop()):
+            if n not in seen:
+                seen.add(n)
+                stack.append(n)
+    return len(seen)
+
+
+def test_perfect_maze_is_a_spanning_tree():
+    grid = generate_maze(17, 23, seed=4)
+    assert _reachable(grid) == grid.size
+    assert _passages(grid) == grid.size - 1
+
+
+def test_same_seed_same_maze():
+    a = generate_maze(20, 20, loop_percent=30, seed=7)
+    b = generate_maze(20, 20, loop_percent=30, seed=7)
+    c = generate_maze(20, 20, loop_percent=30, seed=8)
+    assert a.openings == b.openings
+    assert a.openings != c.openings
+
+
+def test_loop_percent_removes_a_third_of_cells_worth_of_walls():
+    grid = generate_maze(30, 30, loop_percent=60, seed=1)
+    assert _passages(grid) - (grid.size - 1) == 30 * 30 // 3 * 60 // 100
+
+
+def test_pyamaze_export(tmp_path, shortest_length, check_path):
+    grid = generate_maze(8, 12, loop_percent=20, seed=3)
+    m = to_pyamaze(grid)
+    assert m.maze_map == grid.to_maze_map()
+    path = astar_search(m)
+    check_path(m, path, (8, 12), (1, 1))
+    assert len(path) == shortest_length(m, (8, 12), (1, 1))
+
+    # Read the file back the way pyamaze's CreateMaze(loadMaze=...) does
+    maze_file = tmp_path / 'maze.csv'
+    write_pyamaze_csv(grid, maze_file)
+    with open(maze_file) as f:
+        rows = list(csv.reader(f))[1:]
+    loaded = {}
+    for cell, *sides in rows:
+        row, col = cell.split(',')
+        loaded[int(row.lstrip('(')), int(col.rstrip(')'))] = dict(zip('EWNS', map(int, sides)))
+    assert loaded == m.maze_map
+    assert list(loaded)[-1] == (8, 12)
@@ -0,0 +1,64 @@
+import pytest
+
+from maze_solving.algorithms import (
+    SearchStats,
+    astar_search,
+    greedy_best_first_search,
+    iterative_deepening_search,
+    uniform_cost_search
+)
+from maze_solving.grid import EAST, SOUTH, Grid, as_grid
+
+
+def test_round_trip_maze_map(make_maze):
+    m = make_maze(6, 9, loop_percent=30, seed=1)
+    grid = Grid.from_maze(m)
+    assert (grid.rows, grid.cols, grid.size) == (6, 9, 54)
+    assert grid.to_maze_map() == m.maze_map
+    assert as_grid(grid) is grid
+
+
+def test_index_and_neighbors(make_maze):
+    m = make_maze(4, 5, seed=2)
+    grid = Grid.from_maze(m)
+    for cell in m.grid:
+        index = grid.index(cell)
+        assert grid.cell(index) == cell
+        expected = sorted(
+            grid.index((cell[0] + dr, cell[1] + dc))
+            for d, (dr, dc) in {'E': (0, 1), 'W': (0, -1),
+                                'N': (-1, 0), 'S': (1, 0)}.items()
+            if m.maze_map[cell][d]
+        )
+        assert sorted(grid.neighbors(index)) == expected
+
+
+def test_cost_layer_is_read():
+    grid = Grid(1, 2, bytearray([EAST, 2]))
+    assert grid.cost is None
+    assert grid.move_cost(0) == 1
+    with pytest.raises(ValueError):
+        Grid(2, 2, bytearray([EAST, SOUTH]))
+
+
+@pytest.mark.parametrize('solver', [
+    astar_search, greedy_best_first_search,
+    uniform_cost_search, iterative_deepening_search
+])
+def test_solvers_accept_grid(solver, make_maze, check_path):
+    m = make_maze(8, 8, loop_percent=20, seed=3)
+    maze_stats, grid_stats = SearchStats(detailed=True), SearchStats(detailed=True)
+    from_maze = solver(m, stats=maze_stats)
+    grid = Grid.from_maze(m)
+    from_grid = solver(grid, stats=grid_stats)
+    assert from_grid == from_maze
+    check_path(m, from_grid, (8, 8), (1, 1))
+    assert grid_stats.expanded_cells == maze_stats.expanded_cells
+    assert grid_stats.explored_cells == maze_stats.explored_cells
+
+
+@pytest.mark.parametrize('solver', [astar_search, uniform_cost_search])
+def test_optimal_solvers_find_shortest_path(solver, make_maze, shortest_length):
+    for seed in range(5):
+        m = make_maze(12, 10, loop_percent=40, seed=seed)
+        assert len(solver(m)) == shortest_length(m, (12, 10), (1, 1))
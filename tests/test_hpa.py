@@ -0,0 +1,67 @@
+import pickle
+import random
+
+import pytest
+
+from maze_solving.algorithms import HierarchicalPlanner, SearchStats, astar_search
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid
+
+
+@pytest.mark.parametrize('cluster_size', [1, 4, 7])
+def test_queries_return_shortest_paths(cluster_size, make_maze, check_path, shortest_length):
+    rng = random.Random(cluster_size)
+    for seed in range(3):
+        m = make_maze(13, 11, loop_percent=25, seed=seed)
+        planner = HierarchicalPlanner(m, cluster_size=cluster_size)
+        for _ in range(8):
+            start = (rng.randint(1, 13), rng.randint(1, 11))
+            goal = (rng.randint(1, 13), rng.randint(1, 11))
+            path = planner.path(start, goal)
+            check_path(m, path, start, goal)
+            assert len(path) == shortest_length(m, start, goal)
+
+
+def test_wall_changes_rebuild_touched_clusters(make_maze, shortest_length, check_path):
+    rng = random.Random(5)
+    m = make_maze(12, 12, loop_percent=30, seed=5)
+    planner = HierarchicalPlanner(m, cluster_size=4)
+    for _ in range(30):
+        cell = (rng.randint(1, 12), rng.randint(1, 12))
+        try:
+            planner.set_wall(cell, rng.choice('EWNS'), rng.random() < 0.6)
+        except ValueError:
+            continue  # Edge of the maze
+        fresh = HierarchicalPlanner(planner.grid, cluster_size=4)
+        assert planner.links == fresh.links
+        expected = shortest_length(m, (12, 12), (1, 1))
+        path = planner.path()
+        if expected is None:
+            assert path == {}
+        else:
+            check_path(m, path, (12, 12), (1, 1))
+            assert len(path) == expected
+
+
+def test_pickle_round_trip():
+    grid = generate_maze(40, 30, loop_percent=20, seed=2)
+    planner = HierarchicalPlanner(grid, cluster_size=8)
+    loaded = pickle.loads(pickle.dumps(planner))
+    assert loaded.links == planner.links
+    assert loaded.entrances == planner.entrances
+    assert loaded.path((40, 30), (3, 3)) == planner.path((40, 30), (3, 3))
+
+
+def test_abstract_search_expands_fewer_nodes():
+    grid = generate_maze(64, 64, loop_percent=20, seed=1)
+    planner = HierarchicalPlanner(grid, cluster_size=16)
+    hierarchical, plain = SearchStats(), SearchStats()
+    path = planner.path(stats=hierarchical)
+    assert len(path) == len(astar_search(grid, stats=plain))
+    assert hierarchical.expanded < plain.expanded
+
+
+def test_unreachable_goal():
+    planner = HierarchicalPlanner(Grid(6, 6), cluster_size=3)
+    assert planner.path() == {}
+    assert planner.path((2, 2), (2, 2)) == {}
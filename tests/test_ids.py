@@ -0,0 +1,50 @@
+import pytest
+
+from maze_solving.algorithms import (
+    SearchLimits, SearchStats, astar_search, ida_star_search, iterative_deepening_search
+)
+from maze_solving.generator import generate_maze
+from maze_solving.grid import EAST, WEST, Grid
+
+
+@pytest.mark.parametrize('options', [
+    {}, {'heuristic': True}, {'table_size': 10000}, {'heuristic': True, 'table_size': 64}
+])
+def test_deepening_finds_shortest_path(options, make_maze, shortest_length, check_path):
+    for seed in range(6):
+        m = make_maze(9, 8, loop_percent=15, seed=seed)
+        path = iterative_deepening_search(m, **options)
+        check_path(m, path, (9, 8), (1, 1))
+        assert len(path) == shortest_length(m, (9, 8), (1, 1))
+
+
+def test_deep_corridor_does_not_recurse():
+    # A single 1x3000 corridor: far deeper than the default recursion limit
+    openings = bytearray([EAST | WEST]) * 3000
+    openings[0], openings[-1] = EAST, WEST
+    grid = Grid(1, 3000, openings)
+    path = ida_star_search(grid, table_size=4096)
+    assert len(path) == 2999
+
+
+def test_unreachable_goal_terminates():
+    assert iterative_deepening_search(Grid(3, 3)) == {}
+    assert ida_star_search(Grid(3, 3), table_size=16) == {}
+
+
+def test_transposition_table_cuts_expansions(make_maze):
+    m = make_maze(8, 8, loop_percent=60, seed=2)
+    without_table, with_table = SearchStats(), SearchStats()
+    iterative_deepening_search(m, heuristic=True, stats=without_table)
+    ida_star_search(m, table_size=1000, stats=with_table)
+    assert with_table.expanded <= without_table.expanded
+
+
+def test_table_kept_across_passes_stops_re_expansion():
+    grid = generate_maze(40, 40, loop_percent=20, seed=3)
+    # Without a table the passes re-expand looped regions hundreds of times
+    limits = SearchLimits(max_expansions=20 * grid.size)
+    ida_star_search(grid, table_size=None, limits=limits)
+    assert limits.stopped
+    path = ida_star_search(grid, limits=limits)
+    assert limits.status == 'found' and len(path) == len(astar_search(grid))
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from maze_solving.algorithms import SearchStats, astar_search, jump_point_search
+from maze_solving.generator import generate_maze
+from maze_solving.grid import EAST, NORTH, SOUTH, WEST, Grid
+
+
+def test_jps_matches_shortest_path(make_maze, shortest_length, check_path):
+    for seed in range(60):
+        rng = random.Random(seed)
+        rows, cols = rng.randint(1, 18), rng.randint(1, 18)
+        m = make_maze(rows, cols, loop_percent=rng.choice([0, 20, 100, 300]), seed=seed)
+        path = jump_point_search(m)
+        check_path(m, path, (rows, cols), (1, 1))
+        assert len(path) == shortest_length(m, (rows, cols), (1, 1))
+
+
+@pytest.mark.parametrize('loop_percent, cut', [(0, 1.4), (20, 1.4), (100, 1.8), (300, 1.8)])
+def test_jps_push_savings(loop_percent, cut):
+    # What the module docstring promises: a modest cut, larger on loopy mazes
+    astar_stats, jps_stats = SearchStats(), SearchStats()
+    for seed in range(3):
+        grid = generate_maze(100, 100, loop_percent=loop_percent, seed=seed)
+        astar_search(grid, stats=astar_stats)
+        jump_point_search(grid, stats=jps_stats)
+    assert jps_stats.heap_pushes * cut < astar_stats.heap_pushes
+    assert jps_stats.heap_pushes * 5 > astar_stats.heap_pushes
+
+
+def test_open_room_needs_only_a_couple_of_pushes():
+    openings = bytearray((row > 0) * NORTH | (row < 29) * SOUTH | (col > 0) * WEST
+                         | (col < 29) * EAST for row in range(30) for col in range(30))
+    grid = Grid(30, 30, openings)
+    stats = SearchStats()
+    assert len(jump_point_search(grid, stats=stats)) == 58
+    assert stats.heap_pushes <= 2
+
+
+def test_jps_without_path_returns_empty():
+    grid = Grid(2, 2)
+    assert jump_point_search(grid) == {}
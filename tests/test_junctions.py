@@ -0,0 +1,95 @@
+from array import array
+
+import pytest
+
+from maze_solving.algorithms import (
+    SearchStats,
+    astar_search,
+    junction_graph,
+    uniform_cost_search
+)
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid, as_grid
+
+
+def path_cost(grid, path, start):
+    total, cell = 0, start
+    while cell in path:
+        total += grid.cost[grid.index(cell)]
+        cell = path[cell]
+    return total
+
+
+@pytest.mark.parametrize('loop_percent', [0, 20, 100])
+def test_compressed_path_is_shortest(loop_percent, make_maze, check_path, shortest_length):
+    for seed in range(4):
+        m = make_maze(12, 10, loop_percent=loop_percent, seed=seed)
+        path = astar_search(m, compress=True)
+        check_path(m, path, (12, 10), (1, 1))
+        assert len(path) == shortest_length(m, (12, 10), (1, 1))
+
+
+def test_perfect_maze_contracts_to_one_corridor():
+    grid = generate_maze(30, 30, seed=3)
+    graph = junction_graph(grid)
+    # A perfect maze is a tree: only the route between the kept cells is left
+    assert graph.node_count == 2 and graph.edge_count == 1
+    assert graph.alive.count(1) == len(astar_search(grid)) + 1
+
+
+def test_compressed_search_expands_fewer_nodes():
+    grid = generate_maze(40, 40, loop_percent=20, seed=7)
+    plain, compressed = SearchStats(), SearchStats()
+    path = astar_search(grid, stats=plain)
+    assert len(astar_search(grid, stats=compressed, compress=True)) == len(path)
+    assert compressed.expanded < plain.expanded
+
+
+def test_kept_cells_route_between_each_other():
+    grid = generate_maze(20, 20, loop_percent=10, seed=2)
+    cells = [(20, 20), (1, 1), (5, 17), (14, 3)]
+    graph = junction_graph(grid, keep=cells)
+    for start in cells:
+        for goal in cells:
+            path = graph.path(start, goal)
+            assert len(path) == len(astar_search(grid, start=start, goal=goal))
+    with pytest.raises(ValueError):
+        graph.path((10, 10), (1, 1))
+
+
+def test_compressed_uniform_cost_uses_cell_costs():
+    grid = as_grid(generate_maze(15, 15, loop_percent=50, seed=4))
+    grid.cost = array('d', ((i * 7) % 5 + 1 for i in range(grid.size)))
+    path = uniform_cost_search(grid, compress=True)
+    assert path_cost(grid, path, (15, 15)) == path_cost(grid, uniform_cost_search(grid), (15, 15))
+
+
+def test_unreachable_goal():
+    assert astar_search(Grid(3, 3), compress=True) == {}
+
+
+def test_graph_is_built_once_and_reused():
+    grid = generate_maze(30, 30, loop_percent=30, seed=6)
+    cells = [(30, 30), (1, 1), (12, 25), (27, 4)]
+    graph = junction_graph(grid, keep=cells)
+    for start in cells:
+        for goal in cells:
+            stats = SearchStats()
+            path = astar_search(grid, start=start, goal=goal, compress=graph, stats=stats)
+            assert len(path) == len(astar_search(grid, start=start, goal=goal))
+            assert path == graph.path(start, goal)
+            assert stats.expanded <= graph.node_count
+    with pytest.raises(ValueError):
+        uniform_cost_search(grid, start=(2, 2), compress=graph)
+
+
+def test_parallel_corridors_expand_along_the_shorter_one():
+    # A ring of 8 cells: (1, 1) and (1, 2) are joined directly and the long way round
+    grid = Grid(3, 3)
+    for cell, side in [((1, 1), 'E'), ((1, 2), 'E'), ((1, 3), 'S'), ((2, 3), 'S'),
+                       ((3, 3), 'W'), ((3, 2), 'W'), ((3, 1), 'N'), ((2, 1), 'N')]:
+        grid.set_open(cell, side, True)
+    graph = junction_graph(grid, keep=[(1, 1), (1, 2)])
+    assert graph.edge_count == 2
+    assert graph.path((1, 1), (1, 2)) == {(1, 1): (1, 2)}
+    assert len(graph.path((1, 2), (1, 1))) == 1
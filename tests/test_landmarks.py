@@ -0,0 +1,89 @@
+import pickle
+import random
+
+import pytest
+
+from maze_solving.algorithms import (
+    SearchStats,
+    astar_search,
+    greedy_best_first_search,
+    select_landmarks
+)
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid
+
+
+@pytest.mark.parametrize('loop_percent', [0, 30])
+def test_alt_astar_is_still_shortest(loop_percent, make_maze, check_path, shortest_length):
+    rng = random.Random(loop_percent)
+    for seed in range(3):
+        m = make_maze(12, 14, loop_percent=loop_percent, seed=seed)
+        table = select_landmarks(m, count=4)
+        for _ in range(6):
+            start = (rng.randint(1, 12), rng.randint(1, 14))
+            goal = (rng.randint(1, 12), rng.randint(1, 14))
+            path = astar_search(m, start=start, goal=goal, landmarks=table)
+            check_path(m, path, start, goal)
+            assert len(path) == shortest_length(m, start, goal)
+
+
+def test_heuristic_is_admissible_and_beats_manhattan(shortest_length, make_maze):
+    m = make_maze(15, 15, loop_percent=10, seed=4)
+    table = select_landmarks(m, count=6)
+    grid = table.grid
+    goal = grid.index((1, 1))
+    heuristic = table.heuristic(goal)
+    tighter = 0
+    for index in range(grid.size):
+        row, col = grid.cell(index)
+        true_distance = shortest_length(m, (row, col), (1, 1))
+        assert heuristic(index) <= true_distance
+        tighter += heuristic(index) > (row - 1) + (col - 1)
+    assert tighter > grid.size // 2
+
+
+def test_landmarks_cut_expansions():
+    grid = generate_maze(80, 80, loop_percent=20, seed=3)
+    table = select_landmarks(grid, count=8)
+    plain, alt = SearchStats(), SearchStats()
+    path = astar_search(grid, stats=plain)
+    assert len(astar_search(grid, stats=alt, landmarks=table)) == len(path)
+    assert alt.expanded * 2 < plain.expanded
+
+
+def test_greedy_with_landmarks_reaches_goal(make_maze, check_path):
+    m = make_maze(10, 10, loop_percent=20, seed=1)
+    table = select_landmarks(m, count=4)
+    path = greedy_best_first_search(m, goal=[(1, 1), (1, 10)], landmarks=table)
+    assert path
+    end = (10, 10)
+    while end in path:
+        end = path[end]
+    assert end in [(1, 1), (1, 10)]
+
+
+def test_compact_storage_and_pickle():
+    grid = generate_maze(30, 20, seed=2)
+    table = select_landmarks(grid, count=3, cells=[(1, 1), (30, 20), (15, 10)])
+    assert table.nbytes == 3 * 2 * grid.size
+    loaded = pickle.loads(pickle.dumps(table))
+    assert loaded.cells == table.cells and loaded.distances == table.distances
+
+
+def test_table_must_match_the_maze():
+    table = select_landmarks(generate_maze(10, 10, seed=1), count=2)
+    with pytest.raises(ValueError):
+        astar_search(generate_maze(12, 10, seed=1), landmarks=table)
+    # Same size, other walls: the distances would overestimate
+    with pytest.raises(ValueError):
+        astar_search(generate_maze(10, 10, seed=2), landmarks=table)
+    other = generate_maze(10, 10, seed=1)
+    assert astar_search(other, landmarks=table) == astar_search(other)
+    other.set_open((5, 5), 'E', not other.is_open((5, 5), 'E'))
+    with pytest.raises(ValueError):
+        greedy_best_first_search(other, landmarks=table)
+
+
+def test_disconnected_cells():
+    table = select_landmarks(Grid(3, 3), count=4)
+    assert astar_search(Grid(3, 3), landmarks=table) == {}
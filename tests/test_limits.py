@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+from maze_solving.algorithms import (
+    ALGORITHMS,
+    SearchLimits,
+    astar_search,
+    iterative_deepening_search,
+    solve_within
+)
+from maze_solving.algorithms.limits import BUDGET, CANCELLED, DEADLINE, FOUND, NO_PATH
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid
+
+# The depth-first searches only get small mazes
+FAST = [name for name in ALGORITHMS if name not in ('ids', 'ida')]
+
+
+def walk(path, start):
+    """Cells visited by following a path dict from start."""
+    cells = [start]
+    while cells[-1] in path:
+        cells.append(path[cells[-1]])
+    return cells
+
+
+@pytest.mark.parametrize('name', list(ALGORITHMS))
+def test_unlimited_solve_is_found(name, make_maze, check_path):
+    m = make_maze(8, 8, loop_percent=10, seed=3)
+    result = solve_within(ALGORITHMS[name], m)
+    assert result.status == FOUND
+    check_path(m, result.path, (8, 8), (1, 1))
+    assert result.stats.expanded > 0
+
+
+@pytest.mark.parametrize('name', list(ALGORITHMS))
+def test_unreachable_goal_is_no_path(name):
+    result = solve_within(ALGORITHMS[name], Grid(4, 4))
+    assert result.status == NO_PATH
+    assert result.path == {}
+
+
+@pytest.mark.parametrize('name', FAST)
+def test_budget_returns_partial_path(name):
+    grid = generate_maze(40, 40, loop_percent=20, seed=5)
+    result = solve_within(ALGORITHMS[name], grid, max_expansions=60)
+    assert result.status == BUDGET
+    assert result.stats.expanded <= 60
+    cells = walk(result.path, (40, 40))
+    assert cells[0] == (40, 40) and (1, 1) not in cells
+    for a, b in zip(cells, cells[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+
+
+def test_budget_bounds_deepening():
+    grid = generate_maze(30, 30, loop_percent=30, seed=1)
+    result = solve_within(iterative_deepening_search, grid, max_expansions=500)
+    assert result.status == BUDGET
+    assert result.path and len(result.path) < 30 * 30
+
+
+@pytest.mark.parametrize('name', list(ALGORITHMS))
+def test_cancelled_before_start(name):
+    cancel = threading.Event()
+    cancel.set()
+    grid = generate_maze(20, 20, seed=2)
+    result = solve_within(ALGORITHMS[name], grid, cancel=cancel)
+    assert result.status == CANCELLED
+    assert result.stats.expanded <= 1
+
+
+def test_deadline_stops_the_search():
+    grid = generate_maze(40, 40, loop_percent=20, seed=1)
+    result = solve_within(iterative_deepening_search, grid, timeout=0.05)
+    assert result.status == DEADLINE
+
+
+def test_limits_reset_between_solves():
+    grid = generate_maze(30, 30, loop_percent=20, seed=4)
+    limits = SearchLimits(max_expansions=20)
+    astar_search(grid, limits=limits)
+    assert limits.stopped
+    limits.max_expansions = None
+    path = astar_search(grid, limits=limits)
+    assert limits.status == FOUND and not limits.stopped
+    assert path == astar_search(grid)
@@ -0,0 +1,73 @@
+import random
+from array import array
+
+import pytest
+
+from maze_solving.algorithms import IncrementalPlanner, SearchStats, astar_search
+from maze_solving.generator import generate_maze
+from maze_solving.grid import Grid
+
+
+def test_replanning_tracks_wall_changes(make_maze, shortest_length, check_path):
+    for seed in range(10):
+        rng = random.Random(seed)
+        m = make_maze(10, 9, loop_percent=30, seed=seed)
+        planner = IncrementalPlanner(m)
+        for _ in range(25):
+            path = planner.path()
+            expected = shortest_length(m, (10, 9), (1, 1))
+            if expected is None:
+                assert path == {}
+            else:
+                check_path(m, path, (10, 9), (1, 1))
+                assert len(path) == expected
+            cell = (rng.randint(1, 10), rng.randint(1, 9))
+            try:
+                planner.set_wall(cell, rng.choice('EWNS'), rng.random() < 0.6)
+            except ValueError:
+                pass  # Edge of the maze
+
+
+def test_small_change_repairs_locally(make_maze):
+    grid = Grid.from_maze(make_maze(40, 40, loop_percent=30, seed=3))
+    planner = IncrementalPlanner(grid)
+    full_search, no_change, repair = SearchStats(), SearchStats(), SearchStats()
+    planner.path(stats=full_search)
+    planner.path(stats=no_change)
+    assert no_change.expanded == 0  # Nothing changed, nothing to redo
+    planner.set_wall((1, 1), 'E', True)
+    planner.path(stats=repair)
+    assert repair.expanded < full_search.expanded
+
+
+def test_custom_endpoints_and_bad_wall():
+    grid = Grid(1, 3)
+    planner = IncrementalPlanner(grid, start=(1, 1), goal=(1, 3))
+    assert planner.path() == {}
+    planner.set_wall((1, 1), 'E', True)
+    planner.set_wall((1, 2), 'E', True)
+    assert planner.path() == {(1, 1): (1, 2), (1, 2): (1, 3)}
+    with pytest.raises(ValueError):
+        planner.set_wall((1, 3), 'E', True)
+
+
+@pytest.mark.parametrize('costs', [(0.05, 3.0), (0.0, 1.0)])
+def test_cost_layer_is_ignored_like_astar(costs):
+    # Cheap and free cells used to break the heuristic and the path walk
+    for seed in range(20):
+        rng = random.Random(seed)
+        grid = generate_maze(12, 12, loop_percent=40, seed=seed)
+        grid.cost = array('d', [rng.choice(costs) for _ in range(grid.size)])
+        planner = IncrementalPlanner(grid)
+        for _ in range(5):
+            path = planner.path()
+            assert len(path) == len(astar_search(grid))
+            cell = grid.default_start
+            for nxt in path.to_dict().values():
+                assert nxt in [grid.cell(n) for n in grid.neighbors(grid.index(cell))]
+                cell = nxt
+            try:
+                planner.set_wall((rng.randint(1, 12), rng.randint(1, 12)),
+                                 rng.choice('EWNS'), rng.random() < 0.6)
+            except ValueError:
+                pass
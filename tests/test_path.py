@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from maze_solving.algorithms import ALGORITHMS, astar_search
+from maze_solving.generator import generate_maze
+from maze_solving.path import NO_PARENT, Path, parent_array, tree_cells
+
+
+def test_path_behaves_like_the_dict_it_replaces():
+    grid = generate_maze(30, 30, loop_percent=20, seed=4)
+    path = astar_search(grid)
+    expected = path.to_dict()
+    assert type(expected) is dict
+    assert path == expected and expected == path
+    assert len(path) == len(expected) == len(path.cells) - 1
+    assert list(path) == list(expected)
+    assert path.start == grid.default_start and path.goal == (1, 1)
+    assert path.start in path and path.goal not in path
+    assert (0, 0) not in path and (1, 31) not in path and 'x' not in path
+    with pytest.raises(KeyError):
+        path[path.goal]
+
+
+def test_every_solver_returns_a_path():
+    grid = generate_maze(15, 15, loop_percent=20, seed=5)
+    for name, solver in ALGORITHMS.items():
+        path = solver(grid)
+        assert isinstance(path, Path), name
+        assert path.start == grid.default_start and path.goal == (1, 1), name
+
+
+def test_slicing_and_directions():
+    path = Path(3, [8, 7, 4, 1, 0])
+    assert path.directions() == 'WNNW'
+    assert path[1:4].to_dict() == {(3, 2): (2, 2), (2, 2): (1, 2)}
+    assert path[1:4].directions() == 'NN' and path[3:].start == (1, 2)
+    assert path[:1] == Path(3, [8]) and not path[:1] and path[:0] == Path(3)
+    with pytest.raises(ValueError):
+        path[::2]
+
+
+def test_equality_pickle_and_empty_paths():
+    path = Path(4, [5, 6, 10])
+    assert path == Path(4, [5, 6, 10]) and path != Path(4, [5, 9, 10])
+    assert Path(4) == Path(7) == {} and Path(4, [3]) == {}
+    assert repr(Path(4)) == 'Path()'
+    # A start at the goal is a one-cell path, not the missing one
+    assert Path(4, [3]) != Path(4) and Path(4) != Path(4, [3])
+    assert Path(4, [3]) == Path(4, [3]) != Path(4, [5])
+    assert repr(Path(4, [3])) == 'Path((1, 4) -> (1, 4), moves=0)'
+    assert Path(4).start is None and Path(4).directions() == ''
+    copy = pickle.loads(pickle.dumps(path))
+    assert copy == path and copy.cells.typecode == path.cells.typecode
+
+
+def test_parent_arrays():
+    parents = parent_array(6)
+    assert list(parents) == [NO_PARENT] * 6
+    parents[4], parents[1], parents[2] = 1, 0, 1
+    assert tree_cells(parents) == [1, 2, 4]
+    grid = generate_maze(2, 3, seed=0)
+    assert Path.from_parents(grid, parents, 0, 4).cells.tolist() == [0, 1, 4]
+    assert tree_cells({3: 0, 5: 3}) == [3, 5]
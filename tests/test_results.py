@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from maze_solving.results import STRING, ResultStore
+
+COLUMNS = [('size', 'q'), ('algorithm', STRING), ('time', 'd')]
+
+
+def test_rows_survive_reopening(tmp_path):
+    with ResultStore(tmp_path / 'store', COLUMNS) as store:
+        store.append(size=10, algorithm='astar', time=0.5)
+        store.append(size=20, algorithm='ucs', time=1.25)
+        store.append(size=20, algorithm='astar', time=2.0)
+    with ResultStore(tmp_path / 'store') as store:
+        assert len(store) == 3
+        assert list(store.column('size')) == [10, 20, 20]
+        assert store.column('algorithm') == ['astar', 'ucs', 'astar']
+        assert list(store.column('time')) == [0.5, 1.25, 2.0]
+        assert store.keys('size', 'algorithm') == {(10, 'astar'), (20, 'ucs'), (20, 'astar')}
+        # Strings are stored once, as codes
+        assert os.path.getsize(tmp_path / 'store' / 'algorithm.col') == 3 * 4
+
+
+def test_torn_row_is_dropped(tmp_path):
+    with ResultStore(tmp_path, COLUMNS) as store:
+        store.append(size=10, algorithm='astar', time=0.5)
+        store.append(size=15, algorithm='ids', time=0.7)
+    # A crash after writing only some columns of a third row
+    with open(tmp_path / 'size.col', 'ab') as f:
+        f.write(bytes(8))
+    with open(tmp_path / 'time.col', 'ab') as f:
+        f.write(bytes(3))
+    with ResultStore(tmp_path) as store:
+        assert len(store) == 2 and list(store.column('size')) == [10, 15]
+        store.append(size=30, algorithm='gbfs', time=0.1)
+        assert list(store.column('size')) == [10, 15, 30]
+        assert store.column('algorithm') == ['astar', 'ids', 'gbfs']
+
+
+def test_schema_is_checked(tmp_path):
+    with pytest.raises(ValueError):
+        ResultStore(tmp_path)
+    ResultStore(tmp_path, COLUMNS).close()
+    with pytest.raises(ValueError):
+        ResultStore(tmp_path, [('size', 'q')])
+    with ResultStore(tmp_path) as store, pytest.raises(ValueError):
+        store.append(size=1, algorithm='astar')
+
+
+def test_analysis_resumes_from_the_store(tmp_path, capsys):
+    analysis = pytest.importorskip('visualization.comparative_analysis')
+    path = str(tmp_path / 'analysis')
+    store = analysis.run_analysis([6, 8], trials=2, workers=1, store=path)
+    rows = len(store)
+    assert rows == 2 * 2 * len(analysis.ALGORITHMS)
+    store.close()
+
+    # Drop the last results, as if the run had been killed
+    for name, typecode in analysis.RESULT_COLUMNS:
+        itemsize = 8 if typecode != STRING else 4
+        with open(os.path.join(path, f'{name}.col'), 'ab') as f:
+            f.truncate((rows - 3) * itemsize)
+    capsys.readouterr()
+    store = analysis.run_analysis([6, 8], trials=2, workers=1, store=path)
+    assert f'{rows - 3} results stored, 3 to compute' in capsys.readouterr().out
+    assert store.keys('size', 'trial', 'algorithm') == {
+        (size, trial, name) for size in (6, 8) for trial in range(2)
+        for name, _ in analysis.ALGORITHMS.values()
+    }
+
+    grouped = analysis.load_results(store)
+    assert sorted(grouped) == [6, 8]
+    assert len(grouped[8]['A*']['path_length']) == 2
+    assert (grouped[8]['A*']['path_length'] == grouped[8]['UCS']['path_length']).all()
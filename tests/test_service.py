@@ -0,0 +1,156 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from maze_solving.algorithms import astar_search, uniform_cost_search
+from maze_solving.cache import fingerprint
+from maze_solving.generator import generate_maze
+from maze_solving.service import SolveService
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Thread pool whose jobs wait until the gate is opened."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.gate = threading.Event()
+
+    def submit(self, fn, *args):
+        return super().submit(self._after_gate, fn, *args)
+
+    def _after_gate(self, fn, *args):
+        self.gate.wait(5)
+        return fn(*args)
+
+
+def test_identical_requests_are_coalesced():
+    grid = generate_maze(40, 40, loop_percent=20, seed=1)
+
+    async def client():
+        async with SolveService(workers=2, executor=ThreadPoolExecutor(2)) as service:
+            results = await asyncio.gather(
+                *[service.solve(grid, 'astar') for _ in range(5)],
+                service.solve(grid, 'ucs'),
+                service.solve(grid, 'astar', start=(20, 20))
+            )
+            return service, results
+
+    service, results = asyncio.run(client())
+    assert service.requests == 7 and service.computed == 3 and service.coalesced == 4
+    assert all(result is results[0] for result in results[:5])
+    assert results[0].path == astar_search(grid)
+    assert results[5].path == uniform_cost_search(grid)
+    assert results[6].path == astar_search(grid, start=(20, 20))
+    assert service.pending == 0
+
+
+def test_full_queue_applies_backpressure():
+    grid = generate_maze(20, 20, seed=2)
+    executor = GatedExecutor()
+
+    async def client():
+        async with SolveService(workers=1, max_queue=1, executor=executor) as service:
+            running = asyncio.create_task(service.solve(grid, start=(1, 20)))
+            await asyncio.sleep(0.01)  # Taken by the worker
+            queued = asyncio.create_task(service.solve(grid, start=(2, 20)))
+            await asyncio.sleep(0.01)
+            with pytest.raises(asyncio.QueueFull):
+                await service.solve(grid, start=(3, 20), wait=False)
+            waiting = asyncio.create_task(service.solve(grid, start=(4, 20)))
+            # Identical to a queued request: shares it without a queue slot
+            shared = await asyncio.wait_for(
+                asyncio.gather(service.solve(grid, start=(2, 20), wait=False),
+                               _open_later(executor.gate)), 5)
+            results = await asyncio.gather(running, queued, waiting)
+            return service, shared[0], results
+
+    service, shared, results = asyncio.run(client())
+    executor.shutdown()
+    assert shared is results[1]
+    assert [len(r.path) for r in results] == [
+        len(astar_search(grid, start=(row, 20))) for row in (1, 2, 4)
+    ]
+    assert service.computed == 3 and service.requests == 4 and service.coalesced == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_requests_sharing_its_put():
+    grid = generate_maze(20, 20, seed=5)
+    executor = GatedExecutor()
+
+    async def client():
+        async with SolveService(workers=1, max_queue=1, executor=executor) as service:
+            running = asyncio.create_task(service.solve(grid, start=(1, 20)))
+            await asyncio.sleep(0.01)  # Taken by the worker
+            queued = asyncio.create_task(service.solve(grid, start=(2, 20)))
+            await asyncio.sleep(0.01)  # Fills the queue
+            first = asyncio.create_task(service.solve(grid, start=(3, 20)))
+            await asyncio.sleep(0.01)  # Waiting for room
+            second = asyncio.create_task(service.solve(grid, start=(3, 20)))
+            await asyncio.sleep(0.01)  # Shares the first one's future
+            first.cancel()
+            await asyncio.sleep(0.01)
+            executor.gate.set()
+            results = await asyncio.wait_for(asyncio.gather(running, queued, second), 5)
+            return service, first, results
+
+    service, first, results = asyncio.run(client())
+    executor.shutdown()
+    assert first.cancelled()
+    assert len(results[2].path) == len(astar_search(grid, start=(3, 20)))
+    assert service.computed == 3 and service.pending == 0
+
+
+async def _open_later(gate):
+    await asyncio.sleep(0.01)
+    gate.set()
+
+
+def test_maze_is_hashed_off_the_event_loop(monkeypatch):
+    grid = generate_maze(30, 30, seed=4)
+    threads = []
+
+    def recording(*args):
+        threads.append(threading.current_thread())
+        return fingerprint(*args)
+
+    monkeypatch.setattr('maze_solving.service.fingerprint', recording)
+
+    async def client():
+        async with SolveService(workers=1, executor=ThreadPoolExecutor(1)) as service:
+            return await service.solve(grid)
+
+    assert asyncio.run(client()).path == astar_search(grid)
+    assert threads and threading.main_thread() not in threads
+
+
+def test_errors_reach_every_waiter_and_the_service_recovers():
+    grid = generate_maze(10, 10, seed=3)
+
+    async def client():
+        async with SolveService(workers=1, executor=ThreadPoolExecutor(1)) as service:
+            with pytest.raises(ValueError):
+                await service.solve(grid, 'dijkstra')
+            failures = await asyncio.gather(
+                *[service.solve(grid, 'bi-astar', goal=[(1, 1), (2, 2)]) for _ in range(3)],
+                return_exceptions=True
+            )
+            assert all(isinstance(f, ValueError) for f in failures)
+            return await service.solve(grid)
+
+    assert asyncio.run(client()).path == astar_search(grid)
+    with pytest.raises(RuntimeError):
+        asyncio.run(SolveService().solve(grid))
+
+
+def test_process_pool():
+    grids = [generate_maze(25, 25, loop_percent=10, seed=s) for s in range(4)]
+
+    async def client():
+        async with SolveService(workers=2) as service:
+            return await asyncio.gather(*[service.solve(g, 'jps') for g in grids])
+
+    results = asyncio.run(client())
+    for grid, result in zip(grids, results):
+        assert result.path_length == len(astar_search(grid)) + 1
@@ -0,0 +1,75 @@
+import threading
+
+from maze_solving.algorithms import ALGORITHMS, IncrementalPlanner, SearchStats
+from maze_solving.algorithms.stats import EXPAND, EXPLORE
+from maze_solving.grid import Grid
+
+
+def test_solvers_leave_the_maze_untouched(make_maze):
+    m = make_maze(10, 10, loop_percent=30, seed=1)
+    for name, solver in ALGORITHMS.items():
+        solver(m)
+        assert not hasattr(m, 'expanded_nodes'), name
+        assert not hasattr(m, 'explored_cells'), name
+
+
+def test_counts_match_detailed_sets(make_maze):
+    grid = Grid.from_maze(make_maze(12, 12, loop_percent=50, seed=2))
+    for name, solver in ALGORITHMS.items():
+        counting, detailed = SearchStats(), SearchStats(detailed=True)
+        assert solver(grid, stats=counting) == solver(grid, stats=detailed)
+        assert counting.expanded_cells is None and counting.trace is None
+        assert counting.expanded == detailed.expanded == len(detailed.expanded_cells), name
+        assert counting.explored == detailed.explored == len(detailed.explored_cells), name
+        assert detailed.expanded_cells <= detailed.explored_cells, name
+
+
+def test_heap_counters(make_maze):
+    grid = Grid.from_maze(make_maze(20, 20, loop_percent=100, seed=3))
+    stats = SearchStats()
+    ALGORITHMS['astar'](grid, stats=stats)
+    # Every push is either expanded, popped as stale or left on the frontier
+    assert stats.heap_pushes + 1 >= stats.expanded + stats.stale_pops
+    assert 0 < stats.frontier_peak <= stats.heap_pushes + 1
+    assert stats.explored <= stats.heap_pushes + 1
+
+
+def test_trace_records_order(make_maze):
+    m = make_maze(6, 6, seed=4)
+    stats = SearchStats(trace=True)
+    ALGORITHMS['ucs'](m, stats=stats)
+    assert stats.trace[0] == (EXPLORE, (6, 6))
+    assert stats.trace[1] == (EXPAND, (6, 6))
+    assert stats.trace[-1] == (EXPAND, (1, 1))
+    assert {cell for kind, cell in stats.trace if kind == EXPAND} == stats.expanded_cells
+
+
+def test_stats_add_up_across_runs(make_maze):
+    grid = Grid.from_maze(make_maze(10, 10, seed=5))
+    once, twice = SearchStats(), SearchStats()
+    ALGORITHMS['gbfs'](grid, stats=once)
+    for _ in range(2):
+        ALGORITHMS['gbfs'](grid, stats=twice)
+    assert twice.expanded == 2 * once.expanded
+    assert twice.frontier_peak == once.frontier_peak
+
+
+def test_planner_reports_per_call(make_maze):
+    planner = IncrementalPlanner(Grid.from_maze(make_maze(15, 15, loop_percent=20, seed=6)))
+    stats = SearchStats(detailed=True)
+    planner.path(stats=stats)
+    assert stats.expanded and stats.heap_pushes and stats.expanded_cells
+
+
+def test_concurrent_solves_share_a_maze(make_maze):
+    grid = Grid.from_maze(make_maze(30, 30, loop_percent=40, seed=7))
+    expected = SearchStats()
+    ALGORITHMS['astar'](grid, stats=expected)
+    results = [SearchStats() for _ in range(4)]
+    threads = [threading.Thread(target=ALGORITHMS['astar'], args=(grid,), kwargs={'stats': s})
+               for s in results]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(s.expanded == expected.expanded for s in results)
@@ -0,0 +1,46 @@
+import pytest
+
+from maze_solving.algorithms import ALGORITHMS, STEPS, SearchStats, SearchSteps
+from maze_solving.grid import Grid
+
+
+@pytest.mark.parametrize('name', sorted(STEPS))
+def test_steps_give_the_solver_result(name, make_maze):
+    grid = Grid.from_maze(make_maze(9, 9, loop_percent=30, seed=1))
+    steps = SearchSteps(STEPS[name](grid))
+    events = list(steps)
+    assert steps.done
+    assert steps.result == ALGORITHMS[name](grid)
+    assert events[-1].cell == (1, 1) or name.startswith('bi-')
+
+
+@pytest.mark.parametrize('name', ['astar', 'ucs', 'gbfs', 'jps'])
+def test_one_event_per_expansion(name, make_maze):
+    grid = Grid.from_maze(make_maze(15, 15, loop_percent=40, seed=2))
+    stats = SearchStats(detailed=True)
+    events = list(SearchSteps(STEPS[name](grid, stats=stats)))
+    assert len(events) == stats.expanded
+    assert {e.cell for e in events} == stats.expanded_cells
+    pushed = {cell for e in events for cell in e.pushed}
+    assert pushed <= stats.explored_cells
+
+
+def test_astar_events(make_maze):
+    m = make_maze(12, 12, loop_percent=50, seed=3)
+    events = list(SearchSteps(STEPS['astar'](m)))
+    # A consistent heuristic expands cells in non-decreasing f
+    assert all(a.f <= b.f for a, b in zip(events, events[1:]))
+    deltas = {(0, 1), (0, -1), (1, 0), (-1, 0)}
+    for event in events:
+        for cell in event.pushed:
+            assert (cell[0] - event.cell[0], cell[1] - event.cell[1]) in deltas
+
+
+def test_stop_early(make_maze):
+    grid = Grid.from_maze(make_maze(30, 30, seed=4))
+    steps = SearchSteps(STEPS['ucs'](grid))
+    for count, event in enumerate(steps, 1):
+        if count == 10:
+            break
+    steps.close()
+    assert not steps.done and steps.result is None
@@ -0,0 +1,70 @@
+import pickle
+from array import array
+
+import pytest
+
+from maze_solving.algorithms import astar_search, uniform_cost_search
+from maze_solving.batch import solve_batch
+from maze_solving.generator import generate_maze
+from maze_solving.storage import MappedGrid, load_maze, map_maze, save_maze
+
+
+def _with_cost(grid):
+    grid.cost = array('d', (1.0 + i % 4 for i in range(grid.size)))
+    return grid
+
+
+@pytest.mark.parametrize('cost', [False, True])
+def test_round_trip(tmp_path, cost):
+    grid = generate_maze(13, 7, loop_percent=30, seed=2)
+    if cost:
+        _with_cost(grid)
+    maze_file = tmp_path / 'a.maze'
+    save_maze(grid, maze_file)
+    for loaded in (load_maze(maze_file), map_maze(maze_file)):
+        assert (loaded.rows, loaded.cols) == (13, 7)
+        assert loaded.to_maze_map() == grid.to_maze_map()
+
+
+def test_solvers_run_on_mapped_grid(tmp_path):
+    grid = _with_cost(generate_maze(40, 40, loop_percent=20, seed=5))
+    save_maze(grid, tmp_path / 'b.maze')
+    mapped = map_maze(tmp_path / 'b.maze')
+    assert astar_search(mapped) == astar_search(grid)
+    assert uniform_cost_search(mapped) == uniform_cost_search(grid)
+
+
+def test_mapped_grid_pickles_as_path(tmp_path):
+    grid = generate_maze(60, 60, seed=1)
+    save_maze(grid, tmp_path / 'c.maze')
+    mapped = map_maze(tmp_path / 'c.maze')
+    data = pickle.dumps(mapped)
+    assert len(data) < 200
+    copy = pickle.loads(data)
+    assert isinstance(copy, MappedGrid)
+    assert copy.openings == grid.openings
+
+    results = list(solve_batch([mapped, mapped], ['astar'], workers=2))
+    assert len({r.path_length for r in results}) == 1
+
+
+def test_writable_mapping_updates_file(tmp_path):
+    maze_file = tmp_path / 'd.maze'
+    save_maze(generate_maze(3, 3, seed=0), maze_file)
+    with pytest.raises(TypeError):
+        map_maze(maze_file).set_open((1, 1), 'E', False)
+    writable = map_maze(maze_file, writable=True)
+    writable.set_open((2, 2), 'E', False)
+    writable.flush()
+    assert not load_maze(maze_file).is_open((2, 2), 'E')
+
+
+def test_rejects_other_files(tmp_path):
+    bad = tmp_path / 'bad.maze'
+    bad.write_bytes(b'not a maze at all')
+    with pytest.raises(ValueError):
+        load_maze(bad)
+    save_maze(generate_maze(4, 4, seed=0), bad)
+    bad.write_bytes(bad.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        map_maze(bad)
@@ -11,78 +11,128 @@ in terms of:
 
 import sys
 import os
-import time
-import matplotlib.pyplot as plt
 import numpy as np
-from pyamaze import maze
 from collections import defaultdict
 
 # Add the parent directory to system path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from maze_solving.algorithms.astar import astar_search
-from maze_solving.algorithms.gbfs import greedy_best_first_search
-from maze_solving.algorithms.ids import iterative_deepening_search
-from maze_solving.algorithms.ucs import uniform_cost_search
-
-class AlgorithmMetrics:
-    def __init__(self, name, is_informed):
-        self.name = name
-        self.is_informed = is_informed
-        self.expanded_nodes = 0
-        self.explored_cells = 0
-        self.execution_time = 0
-        self.path_length = 0
-
-def run_analysis(maze_sizes=[10, 15, 20], trials=5):
-    """Run comparative analysis on different maze sizes."""
-    algorithms = {
-        'UCS': (uniform_cost_search, False),
-        'IDS': (iterative_deepening_search, False),
-        'GBFS': (greedy_best_first_search, True),
-        'A*': (astar_search, True)
-    }
-    
-    all_results = defaultdict(lambda: defaultdict(list))
-    
+from maze_solving.batch import solve_jobs
+from maze_solving.generator import generate_maze
+from maze_solving.results import STRING, ResultStore
+
+# Chart label -> (name in maze_solving.algorithms.ALGORITHMS, is_informed)
+ALGORITHMS = {
+    'UCS': ('ucs', False),
+    'IDS': ('ids', False),
+    'GBFS': ('gbfs', True),
+    'A*': ('astar', True),
+    'Bi-UCS': ('bi-ucs', False),
+    'Bi-A*': ('bi-astar', True)
+}
+
+# Columns of the results store, one row per (seed, size, trial, algorithm)
+RESULT_COLUMNS = [
+    ('seed', 'q'),
+    ('size', 'q'),
+    ('trial', 'q'),
+    ('algorithm', STRING),
+    ('path_length', 'q'),
+    ('expanded_nodes', 'q'),
+    ('explored_cells', 'q'),
+    ('execution_time', 'd')
+]
+METRICS = ['execution_time', 'path_length', 'expanded_nodes', 'explored_cells']
+
+def run_analysis(maze_sizes=[10, 15, 20], trials=5, workers=None, seed=0,
+                 store='docs/analysis_results'):
+    """
+    Run comparative analysis on different maze sizes (seeded, so reruns match).
+
+    Each result is appended to the results store as soon as it comes back
+    from the worker pool, and (seed, size, trial, algorithm) combinations
+    already in the store are skipped, so an interrupted run picks up where it
+    stopped.
+
+    Args:
+        maze_sizes (list): Side lengths of the square mazes
+        trials (int): Mazes per size
+        workers (int): Worker processes, as in maze_solving.batch.solve_batch
+        seed (int): Seed the mazes are generated from
+        store (str): Directory of the results store
+
+    Returns:
+        ResultStore: The store holding every result so far
+    """
+    results = ResultStore(store, RESULT_COLUMNS)
+    done = results.keys('seed', 'size', 'trial', 'algorithm')
+    names = [name for name, _ in ALGORITHMS.values()]
+
+    # (size, trial, algorithms still to run) for every maze with work left
+    plan = []
     for size in maze_sizes:
-        print(f"\nAnalyzing maze size: {size}x{size}")
-        
         for trial in range(trials):
-            print(f"  Trial {trial + 1}/{trials}")
-            
-            # Create maze
-            m = maze(size, size)
-            m.CreateMaze(loopPercent=20)
-            
-            # Test each algorithm
-            for algo_name, (algo_func, is_informed) in algorithms.items():
-                print(f"    Testing {algo_name}...")
-                metrics = AlgorithmMetrics(algo_name, is_informed)
-                
-                # Measure execution time and get path
-                start_time = time.time()
-                path = algo_func(m)
-                metrics.execution_time = time.time() - start_time
-                
-                if path:
-                    # Record metrics
-                    metrics.path_length = len(path) + 1  # +1 for start node
-                    metrics.expanded_nodes = len(m.expanded_nodes)
-                    metrics.explored_cells = len(m.explored_cells)
-                    
-                    # Store results
-                    all_results[size][algo_name].append(metrics)
-                else:
-                    print(f"    Warning: {algo_name} failed to find a path!")
-    
-    return all_results
+            missing = [name for name in names if (seed, size, trial, name) not in done]
+            if missing:
+                plan.append((size, trial, missing))
+    total = sum(len(missing) for _, _, missing in plan)
+    print(f"\n{len(done)} results stored, {total} to compute")
+
+    def jobs():
+        # Mazes are generated only as the pool asks for more work
+        for index, (size, trial, missing) in enumerate(plan):
+            grid = generate_maze(size, size, loop_percent=20, seed=f'{seed}-{size}-{trial}')
+            for name in missing:
+                yield index, grid, name
+
+    labels = {name: label for label, (name, _) in ALGORITHMS.items()}
+    for count, result in enumerate(solve_jobs(jobs(), workers=workers), 1):
+        size, trial, _ = plan[result.maze_index]
+        results.append(seed=seed, size=size, trial=trial, algorithm=result.algorithm,
+                       path_length=result.path_length, expanded_nodes=result.expanded_nodes,
+                       explored_cells=result.explored_cells, execution_time=result.time)
+        print(f"  [{count}/{total}] {size}x{size} trial {trial + 1}: {labels[result.algorithm]}")
+        if not result.path_length:
+            print(f"    Warning: {labels[result.algorithm]} failed to find a path!")
+
+    return results
+
+def load_results(results):
+    """
+    Group the solved runs of a results store by maze size and algorithm.
+
+    Args:
+        results: ResultStore written by run_analysis, or its directory
+
+    Returns:
+        dict: {size: {chart label: {metric: numpy array over trials}}} for
+        the algorithms in ALGORITHMS, leaving out runs that found no path
+    """
+    if not isinstance(results, ResultStore):
+        results = ResultStore(results)
+    columns = {metric: np.asarray(results.column(metric)) for metric in METRICS}
+    sizes = np.asarray(results.column('size'))
+    algorithms = np.array(results.column('algorithm'), dtype=object)
+    solved = columns['path_length'] > 0
+
+    grouped = defaultdict(dict)
+    for size in sorted(set(sizes.tolist())):
+        for label, (name, _) in ALGORITHMS.items():
+            rows = solved & (sizes == size) & (algorithms == name)
+            if rows.any():
+                grouped[size][label] = {metric: values[rows]
+                                        for metric, values in columns.items()}
+    return dict(grouped)
 
 def plot_results(results):
-    """Create visualizations of the analysis results."""
+    """Create visualizations of the analysis results in a results store."""
+    import matplotlib.pyplot as plt
+
+    results = load_results(results)
     maze_sizes = sorted(list(results.keys()))
-    algo_names = list(results[maze_sizes[0]].keys())
-    metrics = ['execution_time', 'path_length', 'expanded_nodes', 'explored_cells']
+    algo_names = [label for label in ALGORITHMS
+                  if all(label in results[size] for size in maze_sizes)]
+    metrics = METRICS
     titles = ['Execution Time (seconds)', 'Path Length', 'Expanded Nodes', 'Explored Cells']
     y_labels = ['Time (s)', 'Length', 'Number of Nodes', 'Number of Cells']
     
@@ -99,7 +149,7 @@ def plot_results(results):
     axes = axes.flatten()
     
     # Colors for different algorithms
-    colors = ['#2ecc71', '#e74c3c', '#3498db', '#f1c40f']
+    colors = ['#2ecc71', '#e74c3c', '#3498db', '#f1c40f', '#9b59b6', '#e67e22']
     
     for idx, (metric, title, ylabel) in enumerate(zip(metrics, titles, y_labels)):
         ax = axes[idx]
@@ -111,7 +161,7 @@ def plot_results(results):
         for size in maze_sizes:
             for algo in algo_names:
                 # Calculate average and standard deviation over trials
-                values = [getattr(m, metric) for m in results[size][algo]]
+                values = results[size][algo][metric]
                 data[algo].append(np.mean(values))
                 errors[algo].append(np.std(values))
         
@@ -144,7 +194,8 @@ def plot_results(results):
     print("\nPlot saved as 'docs/images/algorithm_comparison.png'")
 
 def print_summary(results):
-    """Print a detailed summary of the analysis results."""
+    """Print a detailed summary of the analysis results in a results store."""
+    results = load_results(results)
     print("\nAnalysis Summary")
     print("=" * 80)
     
@@ -154,10 +205,10 @@ def print_summary(results):
         
         for algo in results[size]:
             metrics = results[size][algo]
-            avg_time = np.mean([m.execution_time for m in metrics])
-            avg_path = np.mean([m.path_length for m in metrics])
-            avg_expanded = np.mean([m.expanded_nodes for m in metrics])
-            avg_explored = np.mean([m.explored_cells for m in metrics])
+            avg_time = np.mean(metrics['execution_time'])
+            avg_path = np.mean(metrics['path_length'])
+            avg_expanded = np.mean(metrics['expanded_nodes'])
+            avg_explored = np.mean(metrics['explored_cells'])
             
             print(f"\n{algo}:")
             print(f"  Average Time: {avg_time:.4f}s")
@@ -169,7 +220,7 @@ if __name__ == "__main__":
     print("Running comparative analysis...")
     print("This may take a few minutes...")
     
-    # Run analysis
+    # Run analysis (resumes from docs/analysis_results if it was interrupted)
     results = run_analysis()
     
     # Generate visualizations
@@ -2,39 +2,52 @@
 Script to visualize maze solutions using different algorithms.
 """
 
-from pyamaze import maze, agent, textLabel
+from pyamaze import maze, agent, textLabel, COLOR
 import sys
 import os
 import argparse
+import tempfile
 import time
 
 # Add the parent directory to system path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from maze_solving.algorithms import STEPS, SearchSteps
 from maze_solving.algorithms.astar import astar_search
 from maze_solving.algorithms.gbfs import greedy_best_first_search
 from maze_solving.algorithms.ids import iterative_deepening_search
+from maze_solving.algorithms.jps import jump_point_search
+from maze_solving.algorithms.stats import SearchStats
 from maze_solving.algorithms.ucs import uniform_cost_search
+from maze_solving.generator import generate_maze, write_pyamaze_csv
 
-def visualize_solution(algorithm, size=10, loop_percent=20):
+def visualize_solution(algorithm, size=10, loop_percent=20, seed=None, show_search=False):
     """
     Visualize a maze solution using the specified algorithm.
     
     Args:
-        algorithm (str): Name of the algorithm to use ('astar', 'ucs', 'gbfs', 'ids')
+        algorithm (str): Name of the algorithm to use ('astar', 'ucs', 'gbfs', 'ids', 'jps')
         size (int): Size of the maze (N x N)
         loop_percent (int): Percentage of loops in the maze (0-100)
+        seed (int): Seed for the maze generator, None for a random maze
+        show_search (bool): Replay the cells in the order the algorithm
+            expanded them before tracing the path
     """
-    # Create maze
-    m = maze(size, size)
-    m.CreateMaze(loopPercent=loop_percent)
+    # Create maze, then hand it to pyamaze through its CSV format to draw it
+    grid = generate_maze(size, size, loop_percent=loop_percent, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        maze_file = os.path.join(tmp, 'maze.csv')
+        write_pyamaze_csv(grid, maze_file)
+        m = maze(size, size)
+        m.CreateMaze(loadMaze=maze_file)
     
     # Map algorithm name to function
     algorithms = {
         'astar': astar_search,
         'ucs': uniform_cost_search,
         'gbfs': greedy_best_first_search,
-        'ids': iterative_deepening_search
+        'ids': iterative_deepening_search,
+        'jps': jump_point_search
     }
     
     if algorithm not in algorithms:
@@ -43,24 +56,35 @@ def visualize_solution(algorithm, size=10, loop_percent=20):
         return
     
     # Get the path using selected algorithm
+    stats = SearchStats()
     start_time = time.time()
-    path = algorithms[algorithm](m)
+    if show_search:
+        # Stream the search steps to record the expansion order
+        steps = SearchSteps(STEPS[algorithm](m, stats=stats))
+        expansion_order = [event.cell for event in steps]
+        path = steps.result
+    else:
+        path = algorithms[algorithm](m, stats=stats)
     end_time = time.time()
     
     if not path:
         print(f"No solution found using {algorithm}!")
         return
     
+    if show_search:
+        s = agent(m, footprints=True, color=COLOR.yellow, filled=True)
+        m.tracePath({s: expansion_order}, delay=50)
+    
     # Create agent and add path trace
     a = agent(m, footprints=True, shape='arrow')
-    m.tracePath({a: path})
+    m.tracePath({a: path.to_dict()})
     
     # Add metrics labels
     l = textLabel(m, 'Algorithm', algorithm.upper())
     l = textLabel(m, 'Path Length', len(path) + 1)
     l = textLabel(m, 'Time', f'{(end_time-start_time):.4f}s')
-    l = textLabel(m, 'Expanded Nodes', len(m.expanded_nodes))
-    l = textLabel(m, 'Explored Cells', len(m.explored_cells))
+    l = textLabel(m, 'Expanded Nodes', stats.expanded)
+    l = textLabel(m, 'Explored Cells', stats.explored)
     
     # Run visualization
     m.run()
@@ -68,9 +92,9 @@ def visualize_solution(algorithm, size=10, loop_percent=20):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Visualize maze solutions.')
     parser.add_argument('--algorithm', 
-                      help='Algorithm to use (astar, ucs, gbfs, ids)',
+                      help='Algorithm to use (astar, ucs, gbfs, ids, jps)',
                       required=True,
-                      choices=['astar', 'ucs', 'gbfs', 'ids'])
+                      choices=['astar', 'ucs', 'gbfs', 'ids', 'jps'])
     parser.add_argument('--size',
                       help='Size of the maze (N x N)',
                       type=int,
@@ -79,6 +103,14 @@ if __name__ == "__main__":
                       help='Percentage of loops in maze (0-100)',
                       type=int,
                       default=20)
+    parser.add_argument('--seed',
+                      help='Seed for the maze generator',
+                      type=int,
+                      default=None)
+    
+    parser.add_argument('--show-search',
+                      help='Replay the expanded cells before the path',
+                      action='store_true')
     
     args = parser.parse_args()
-    visualize_solution(args.algorithm, args.size, args.loops)
+    visualize_solution(args.algorithm, args.size, args.loops, args.seed, args.show_search)